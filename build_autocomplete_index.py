@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Build the static autocomplete index for the search box
+
+Combines australian_cities.json with the published salon names into one
+sorted, front-coded prefix index written to public/autocomplete.json, so
+autocomplete is served from a static asset (see src/lib/utils/autocomplete.ts)
+instead of an ILIKE query per keystroke.
+
+Keys use the same normalization as the trigram search columns. Entries are
+ranked by salon count: cities by the number of published salons in them,
+then salons by review count. File layout:
+
+    {
+      "block": 16,
+      "keys": [[shared_prefix_len, suffix], ...],   # front-coded, sorted
+      "entries": [[label, type, slug, state, rank], ...],
+      "top": {"b": [entry_index, ...], "bo": [...], ...}
+    }
+
+Every `block`-th key is stored in full (shared_prefix_len 0) so lookups can
+binary search the restart points. `top` holds the best entries for every
+one- and two-character prefix, which would otherwise match too many keys
+to rank on the fly.
+"""
+import json
+import os
+
+import pandas as pd
+
+from nailnav_etl import get_client
+from build_search_columns import normalize_search_text
+from paged_reads import fetch_all
+
+CITIES_FILE = 'australian_cities.json'
+OUTPUT_FILE = os.path.join('public', 'autocomplete.json')
+
+BLOCK_SIZE = 16
+TOP_PREFIX_LENGTH = 2
+TOP_K = 10
+
+
+def fetch_salons(supabase):
+    rows = fetch_all(lambda: (
+        supabase.table('salons')
+        .select('name, slug, state, review_count, cities(name)')
+        .eq('is_published', True)
+        .order('id')
+    ))
+
+    return pd.DataFrame({
+        'name': [row['name'] for row in rows],
+        'slug': [row['slug'] for row in rows],
+        'state': [row.get('state') for row in rows],
+        'review_count': [row.get('review_count') or 0 for row in rows],
+        'city': [(row.get('cities') or {}).get('name') for row in rows],
+    })
+
+
+def build_entries(cities, salons):
+    """Return all entries sorted by key, with a global rank (0 = best)"""
+    salon_counts = normalize_search_text(salons['city']).value_counts()
+
+    city_entries = pd.DataFrame({
+        'key': normalize_search_text(cities['name']),
+        'label': cities['name'],
+        'type': 'city',
+        'slug': cities['slug'],
+        'state': cities['state'],
+    })
+    city_entries['salon_count'] = city_entries['key'].map(salon_counts).fillna(0).astype(int)
+    city_entries['review_count'] = 0
+
+    salon_entries = pd.DataFrame({
+        'key': normalize_search_text(salons['name']),
+        'label': salons['name'],
+        'type': 'salon',
+        'slug': salons['slug'],
+        'state': salons['state'],
+        'salon_count': 1,
+        'review_count': salons['review_count'].astype(int),
+    })
+
+    entries = pd.concat([city_entries, salon_entries], ignore_index=True)
+    entries = entries[entries['key'].fillna('') != '']
+
+    ranked = entries.sort_values(
+        ['salon_count', 'review_count', 'label'], ascending=[False, False, True], kind='stable'
+    )
+    entries.loc[ranked.index, 'rank'] = range(len(ranked))
+    entries['rank'] = entries['rank'].astype(int)
+
+    return entries.sort_values(['key', 'rank'], kind='stable').reset_index(drop=True)
+
+
+def front_code(keys, block_size=BLOCK_SIZE):
+    """Front-code sorted keys, restarting with a full key every block"""
+    coded = []
+    previous = ''
+    for i, key in enumerate(keys):
+        if i % block_size == 0:
+            shared = 0
+        else:
+            shared = len(os.path.commonprefix([previous, key]))
+        coded.append([shared, key[shared:]])
+        previous = key
+    return coded
+
+
+def top_prefixes(entries, max_length=TOP_PREFIX_LENGTH, k=TOP_K):
+    """Best k entry indices for every prefix up to max_length characters"""
+    top = {}
+    by_rank = entries.sort_values('rank')
+    for length in range(1, max_length + 1):
+        prefixes = by_rank['key'].str[:length]
+        candidates = by_rank[prefixes.str.len() == length].assign(prefix=prefixes)
+        best = candidates.groupby('prefix', sort=False).head(k)
+        for prefix, group in best.groupby('prefix', sort=False):
+            top[prefix] = [int(i) for i in group.index]
+    return top
+
+
+def build_index(cities, salons):
+    entries = build_entries(cities, salons)
+    return {
+        'block': BLOCK_SIZE,
+        'keys': front_code(entries['key'].tolist()),
+        'entries': [
+            [row.label, row.type, row.slug, row.state, row.rank]
+            for row in entries.itertuples(index=False)
+        ],
+        'top': top_prefixes(entries),
+    }
+
+
+def main():
+    print("=" * 80)
+    print("🔤 BUILDING AUTOCOMPLETE INDEX")
+    print("=" * 80)
+
+    with open(CITIES_FILE) as f:
+        cities = pd.DataFrame(json.load(f))
+    print(f"\n🏙️  Loaded {len(cities)} cities from {CITIES_FILE}")
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    salons = fetch_salons(supabase)
+    print(f"✅ Loaded {len(salons)} published salons")
+
+    index = build_index(cities, salons)
+
+    os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+    with open(OUTPUT_FILE, 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+
+    print("\n" + "=" * 80)
+    print(f"✅ Wrote {len(index['entries'])} entries to {OUTPUT_FILE}")
+    print(f"📦 Size: {os.path.getsize(OUTPUT_FILE) / 1024:.1f} KB")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Build precomputed facet counts for the search sidebar
+
+Counts published salons for every (state, city, filter flag, price tier)
+combination in one vectorized pass over the salons table and writes them to
+the salon_facets table (migrations/005_salon_facets.sql). Every refresh
+rereads all published salons and recomputes every count; only the writes
+are incremental: facet rows whose count changed since the last build are
+upserted (with a fresh updated_at), the rest are left alone.
+"""
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from nailnav_etl import get_client, metrics
+from filter_bits import FILTER_BITS
+from paged_reads import fetch_all
+
+BATCH_SIZE = 500
+
+FACET_KEYS = ['state', 'city', 'flag', 'price_tier']
+
+
+def load_salons(supabase):
+    rows = fetch_all(lambda: (
+        supabase.table('salons')
+        .select('id, state, price_range, filter_mask, cities(name)')
+        .eq('is_published', True)
+        .order('id')
+    ))
+    return pd.DataFrame({
+        'state': [row.get('state') or 'Unknown' for row in rows],
+        'city': [(row.get('cities') or {}).get('name') or 'Unknown' for row in rows],
+        'price_tier': [row.get('price_range') or 'unknown' for row in rows],
+        'filter_mask': np.array([row.get('filter_mask') or 0 for row in rows], dtype=np.int64),
+    })
+
+
+def compute_facets(salons):
+    """Count salons per (state, city, flag, price_tier) in one grouped pass"""
+    flags = list(FILTER_BITS)
+    bits = np.array([FILTER_BITS[flag] for flag in flags], dtype=np.int64)
+
+    # One 0/1 column per flag, plus 'all' for the group total
+    matrix = (salons['filter_mask'].to_numpy()[:, None] >> bits) & 1
+    counts = pd.DataFrame(matrix, columns=flags, index=salons.index)
+    counts['all'] = 1
+    counts[['state', 'city', 'price_tier']] = salons[['state', 'city', 'price_tier']]
+
+    facets = (
+        counts.groupby(['state', 'city', 'price_tier'], sort=False)
+        .sum()
+        .reset_index()
+        .melt(id_vars=['state', 'city', 'price_tier'], var_name='flag', value_name='salon_count')
+    )
+    facets = facets[facets['salon_count'] > 0]
+    return facets[FACET_KEYS + ['salon_count']].astype({'salon_count': int})
+
+
+def load_existing_facets(supabase):
+    rows = fetch_all(lambda: (
+        supabase.table('salon_facets')
+        .select('state, city, flag, price_tier, salon_count')
+        .order('state').order('city').order('flag').order('price_tier')
+    ))
+    if not rows:
+        return pd.DataFrame(columns=FACET_KEYS + ['salon_count'])
+    return pd.DataFrame(rows)
+
+
+def diff_facets(current, existing):
+    """Return the facet rows to upsert: changed, new, and vanished (as 0)"""
+    merged = current.merge(existing, on=FACET_KEYS, how='outer', suffixes=('', '_old'))
+    merged['salon_count'] = merged['salon_count'].fillna(0).astype(int)
+    merged['salon_count_old'] = merged['salon_count_old'].fillna(-1).astype(int)
+    changed = merged[merged['salon_count'] != merged['salon_count_old']]
+    return changed[FACET_KEYS + ['salon_count']]
+
+
+def write_facets(supabase, changed):
+    updated_at = datetime.now(timezone.utc).isoformat()
+    records = [{**record, 'updated_at': updated_at} for record in changed.to_dict('records')]
+    for i in range(0, len(records), BATCH_SIZE):
+        supabase.table('salon_facets').upsert(
+            records[i:i + BATCH_SIZE], on_conflict='state,city,flag,price_tier'
+        ).execute()
+    # Facets that dropped to zero were written as 0 above; remove them
+    supabase.table('salon_facets').delete().eq('salon_count', 0).execute()
+
+
+def refresh_facets(supabase):
+    """Recompute facets and write the rows that changed; returns rows written"""
+    current = compute_facets(load_salons(supabase))
+    changed = diff_facets(current, load_existing_facets(supabase))
+    if len(changed):
+        write_facets(supabase, changed)
+    return len(changed)
+
+
+def main():
+    print("=" * 80)
+    print("🧮 BUILDING SEARCH FACET COUNTS")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    print("\n🔄 Counting salons per state, city, flag and price tier...")
+    try:
+        with metrics.stage('refresh_facets'):
+            written = refresh_facets(supabase)
+    except Exception as e:
+        print(f"❌ Failed to build facets: {e}")
+        print("   Have migrations/004 and 005 been applied?")
+        return
+
+    print(f"✅ Wrote {written} changed facet rows")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
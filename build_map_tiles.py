@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Precompute hierarchical map cluster tiles from salon coordinates.
+
+Points are bucketed into a fixed grid at the deepest zoom level and every
+shallower zoom is built by merging 2x2 blocks of child cells, so clusters nest
+cleanly from zoom 18 down to zoom 0 (the same hierarchy supercluster builds,
+but with grid cells so each tile can be rebuilt on its own).
+
+Output is one compact JSON file per non-empty tile:
+
+    public/tiles/{z}/{x}/{y}.json
+    {"c": [[lng, lat, count], ...], "p": [[lng, lat, salon_id], ...]}
+
+"c" holds clusters (count > 1) and "p" holds single salons. A manifest of the
+coordinates used for the last build is kept next to the tiles, and later runs
+only rewrite the tiles touched by salons that were added, moved or removed.
+
+Usage:
+    python build_map_tiles.py            # incremental rebuild
+    python build_map_tiles.py --full     # rebuild every tile
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+
+from nailnav_etl import get_client
+from paged_reads import fetch_all
+
+TILES_DIR = os.path.join('public', 'tiles')
+MANIFEST_FILE = os.path.join(TILES_DIR, 'manifest.json')
+
+MIN_ZOOM = 0
+MAX_ZOOM = 18
+
+# Tile extent and cluster radius in pixels (supercluster defaults), which
+# gives an 8x8 grid of cluster cells inside every tile.
+EXTENT = 512
+RADIUS = 64
+CELLS_PER_TILE_SHIFT = int(np.log2(EXTENT // RADIUS))
+
+
+def fetch_salon_points(supabase):
+    """Fetch id, latitude and longitude for every published, geocoded salon"""
+    rows = fetch_all(lambda: (
+        supabase.table('salons')
+        .select('id, latitude, longitude')
+        .eq('is_published', True)
+        .not_.is_('latitude', 'null')
+        .not_.is_('longitude', 'null')
+        .order('id')
+    ))
+
+    ids = np.array([row['id'] for row in rows], dtype=np.int64)
+    lngs = np.array([float(row['longitude']) for row in rows], dtype=np.float64)
+    lats = np.array([float(row['latitude']) for row in rows], dtype=np.float64)
+    return ids, lngs, lats
+
+
+def project(lngs, lats):
+    """Project lng/lat to web mercator coordinates in the unit square"""
+    x = lngs / 360.0 + 0.5
+    sin = np.sin(np.radians(lats))
+    with np.errstate(divide='ignore'):
+        y = 0.5 - 0.25 * np.log((1 + sin) / (1 - sin)) / np.pi
+    return np.clip(x, 0.0, 1.0 - 1e-12), np.clip(y, 0.0, 1.0 - 1e-12)
+
+
+def cell_indices(lngs, lats):
+    """Return integer grid cells for each point at MAX_ZOOM"""
+    x, y = project(lngs, lats)
+    cells = float(1 << (MAX_ZOOM + CELLS_PER_TILE_SHIFT))
+    return (x * cells).astype(np.int64), (y * cells).astype(np.int64)
+
+
+def tile_keys(cx, cy):
+    """Map MAX_ZOOM cells to the set of (z, x, y) tiles they fall in"""
+    keys = set()
+    for z in range(MIN_ZOOM, MAX_ZOOM + 1):
+        shift = MAX_ZOOM - z + CELLS_PER_TILE_SHIFT
+        for tx, ty in zip((cx >> shift).tolist(), (cy >> shift).tolist()):
+            keys.add((z, tx, ty))
+    return keys
+
+
+def build_zoom(z, ids, lngs, lats, cx, cy):
+    """Cluster all points for one zoom level, grouped by tile"""
+    shift = MAX_ZOOM - z
+    zx = cx >> shift
+    zy = cy >> shift
+    side = np.int64(1) << (z + CELLS_PER_TILE_SHIFT)
+    keys = zx * side + zy
+
+    unique_keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    sum_lng = np.bincount(inverse, weights=lngs)
+    sum_lat = np.bincount(inverse, weights=lats)
+    # Single-point cells keep the salon id; take the id of any member
+    first_id = np.zeros(len(unique_keys), dtype=np.int64)
+    first_id[inverse] = ids
+
+    cell_x = unique_keys // side
+    cell_y = unique_keys % side
+    tile_x = cell_x >> CELLS_PER_TILE_SHIFT
+    tile_y = cell_y >> CELLS_PER_TILE_SHIFT
+
+    tiles = {}
+    for tx, ty, count, slng, slat, sid in zip(
+        tile_x.tolist(), tile_y.tolist(), counts.tolist(),
+        sum_lng.tolist(), sum_lat.tolist(), first_id.tolist()
+    ):
+        tile = tiles.setdefault((z, tx, ty), {'c': [], 'p': []})
+        lng = round(slng / count, 6)
+        lat = round(slat / count, 6)
+        if count > 1:
+            tile['c'].append([lng, lat, count])
+        else:
+            tile['p'].append([lng, lat, sid])
+    return tiles
+
+
+def tile_path(z, x, y):
+    return os.path.join(TILES_DIR, str(z), str(x), f"{y}.json")
+
+
+def write_tile(key, tile):
+    path = tile_path(*key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(tile, f, separators=(',', ':'))
+
+
+def remove_tile(key):
+    path = tile_path(*key)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def load_manifest():
+    if not os.path.exists(MANIFEST_FILE):
+        return None
+    with open(MANIFEST_FILE) as f:
+        manifest = json.load(f)
+    if manifest.get('max_zoom') != MAX_ZOOM or manifest.get('extent') != EXTENT or manifest.get('radius') != RADIUS:
+        return None
+    return {int(k): tuple(v) for k, v in manifest['points'].items()}
+
+
+def save_manifest(ids, lngs, lats):
+    manifest = {
+        'min_zoom': MIN_ZOOM,
+        'max_zoom': MAX_ZOOM,
+        'extent': EXTENT,
+        'radius': RADIUS,
+        'points': {
+            str(i): [lng, lat]
+            for i, lng, lat in zip(ids.tolist(), lngs.tolist(), lats.tolist())
+        },
+    }
+    os.makedirs(TILES_DIR, exist_ok=True)
+    with open(MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+
+def changed_tiles(previous, ids, lngs, lats):
+    """Find the tiles touched by added, moved or removed salons"""
+    current = {
+        i: (lng, lat)
+        for i, lng, lat in zip(ids.tolist(), lngs.tolist(), lats.tolist())
+    }
+    moved = []
+    for salon_id in set(previous) | set(current):
+        old = previous.get(salon_id)
+        new = current.get(salon_id)
+        if old == new:
+            continue
+        if old is not None:
+            moved.append(old)
+        if new is not None:
+            moved.append(new)
+
+    if not moved:
+        return set()
+    moved = np.array(moved, dtype=np.float64)
+    cx, cy = cell_indices(moved[:, 0], moved[:, 1])
+    return tile_keys(cx, cy)
+
+
+def build_tiles(ids, lngs, lats, only=None):
+    """Build tiles for every zoom, writing all of them or just `only`"""
+    cx, cy = cell_indices(lngs, lats)
+    written = 0
+    removed = 0
+    for z in range(MIN_ZOOM, MAX_ZOOM + 1):
+        tiles = build_zoom(z, ids, lngs, lats, cx, cy)
+        if only is None:
+            keys = tiles.keys()
+        else:
+            keys = [key for key in only if key[0] == z]
+        for key in keys:
+            if key in tiles:
+                write_tile(key, tiles[key])
+                written += 1
+            else:
+                remove_tile(key)
+                removed += 1
+    return written, removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute map cluster tiles')
+    parser.add_argument('--full', action='store_true', help='Rebuild every tile')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("🗺️  BUILDING MAP CLUSTER TILES")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    try:
+        supabase = get_client()
+    except RuntimeError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    print("✅ Connected")
+
+    print("\n📍 Fetching salon coordinates...")
+    ids, lngs, lats = fetch_salon_points(supabase)
+    print(f"✅ Loaded {len(ids)} geocoded salons")
+
+    previous = None if args.full else load_manifest()
+
+    if previous is None:
+        print(f"\n🔨 Full rebuild for zoom {MIN_ZOOM}-{MAX_ZOOM}...")
+        if os.path.isdir(TILES_DIR):
+            shutil.rmtree(TILES_DIR)
+        written, removed = build_tiles(ids, lngs, lats)
+    else:
+        touched = changed_tiles(previous, ids, lngs, lats)
+        if not touched:
+            print("\n✅ No salon coordinates changed, tiles are up to date")
+            return
+        print(f"\n🔨 Rebuilding {len(touched)} touched tiles...")
+        written, removed = build_tiles(ids, lngs, lats, only=touched)
+
+    save_manifest(ids, lngs, lats)
+
+    print("\n" + "=" * 80)
+    print("📊 TILE BUILD SUMMARY")
+    print("=" * 80)
+    print(f"✅ Tiles written: {written}")
+    print(f"🗑️  Tiles removed: {removed}")
+    print(f"📁 Output: {TILES_DIR}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
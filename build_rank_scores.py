@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Compute the default-sort rank score for every salon
+
+The listing used to order by raw rating, so one 5-star review beat a 4.8
+across 900 reviews. rank_score shrinks each salon's rating towards the
+catalogue mean with a Bayesian prior worth PRIOR_REVIEWS reviews, then
+weights it by how recently the salon was last reviewed:
+
+    bayes   = (n * rating + m * mean) / (n + m)
+    recency = 0.5 ** (days_since_latest_review / HALF_LIFE_DAYS)
+    score   = bayes * (1 - RECENCY_WEIGHT + RECENCY_WEIGHT * recency)
+
+All salons are scored in one vectorized pass and only changed scores are
+written back. Requires migrations/008_salon_rank_score.sql and the review
+stats from migrations/002_salon_review_stats.sql.
+"""
+
+import numpy as np
+import pandas as pd
+
+from nailnav_etl import get_client, metrics
+from paged_reads import fetch_all
+
+BATCH_SIZE = 1000
+
+PRIOR_REVIEWS = 20
+HALF_LIFE_DAYS = 365
+RECENCY_WEIGHT = 0.1
+
+COLUMNS = ['id', 'rating', 'average_rating', 'review_count', 'latest_review_at', 'rank_score']
+
+
+def compute_rank_scores(salons, now=None):
+    """
+    Return a Series of rank scores indexed like `salons`.
+
+    The rating is the mean of imported reviews when there are any, else
+    the listed rating. Salons with no rating at all score the prior mean.
+    """
+    now = pd.Timestamp.now(tz='UTC') if now is None else now
+
+    rating = pd.to_numeric(salons['average_rating'], errors='coerce').fillna(
+        pd.to_numeric(salons['rating'], errors='coerce')
+    )
+    reviews = pd.to_numeric(salons['review_count'], errors='coerce').fillna(0).clip(lower=0)
+
+    mean = rating.mean() if rating.notna().any() else 0.0
+    bayes = (reviews * rating.fillna(mean) + PRIOR_REVIEWS * mean) / (reviews + PRIOR_REVIEWS)
+
+    latest = pd.to_datetime(salons['latest_review_at'], utc=True, errors='coerce')
+    age_days = ((now - latest).dt.total_seconds() / 86400).clip(lower=0)
+    recency = np.power(0.5, age_days / HALF_LIFE_DAYS).fillna(0)
+
+    return (bayes * (1 - RECENCY_WEIGHT + RECENCY_WEIGHT * recency)).round(6)
+
+
+def refresh_rank_scores(supabase):
+    """Recompute rank_score for every salon; returns rows written"""
+    salons = pd.DataFrame(
+        fetch_all(lambda: supabase.table('salons').select(', '.join(COLUMNS)).order('id')),
+        columns=COLUMNS,
+    )
+    if salons.empty:
+        return 0
+
+    scores = compute_rank_scores(salons)
+    stored = pd.to_numeric(salons['rank_score'], errors='coerce').fillna(-1)
+    changed = (scores - stored).abs() > 1e-6
+
+    records = [
+        {'id': int(salon_id), 'rank_score': float(score)}
+        for salon_id, score in zip(salons.loc[changed, 'id'], scores[changed])
+    ]
+    for i in range(0, len(records), BATCH_SIZE):
+        supabase.rpc('update_salon_rank_scores', {'rows': records[i:i + BATCH_SIZE]}).execute()
+    return len(records)
+
+
+def main():
+    print("=" * 80)
+    print("🏆 COMPUTING SALON RANK SCORES")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    print("\n🔄 Scoring salons...")
+    try:
+        with metrics.stage('refresh_rank_scores'):
+            updated = refresh_rank_scores(supabase)
+    except Exception as e:
+        print(f"❌ Failed to compute rank scores: {e}")
+        print("   Has migrations/008_salon_rank_score.sql been applied?")
+        return
+
+    print(f"✅ Updated rank scores for {updated} salons")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Rebuild the denormalized review snapshot stored on each salon
+
+Runs refresh_salon_review_snapshots (migrations/003_salon_review_snapshot.sql),
+which refreshes the review statistics and stores the top N published reviews
+plus those statistics as one JSON document per salon. Salon detail pages read
+that column instead of querying the reviews table.
+
+Usage:
+    python build_review_snapshots.py [--top N]
+"""
+import argparse
+
+from nailnav_etl import get_client, metrics
+
+TOP_N = 10
+
+
+def refresh_review_snapshots(supabase, salon_ids=None, top_n=TOP_N):
+    """Rebuild snapshots for all salons, or only `salon_ids`; returns rows updated"""
+    params = {'top_n': top_n}
+    if salon_ids is not None:
+        params['salon_ids'] = list(salon_ids)
+    result = supabase.rpc('refresh_salon_review_snapshots', params).execute()
+    return result.data or 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild salon review snapshots')
+    parser.add_argument('--top', type=int, default=TOP_N, help='Reviews kept per salon')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("📸 BUILDING SALON REVIEW SNAPSHOTS")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    print(f"\n🔄 Snapshotting top {args.top} reviews per salon...")
+    try:
+        with metrics.stage('refresh_review_snapshots'):
+            updated = refresh_review_snapshots(supabase, top_n=args.top)
+    except Exception as e:
+        print(f"❌ Failed to build snapshots: {e}")
+        print("   Has migrations/003_salon_review_snapshot.sql been applied?")
+        return
+
+    print(f"✅ Updated snapshots for {updated} salons")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
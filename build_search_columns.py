@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Re-check the normalized trigram search columns on salons and cities
+
+Triggers from migrations/006_trigram_search.sql keep search_name /
+search_address / search_state current on every insert and update, using
+the SQL search_text() function. This script runs refresh_search_columns,
+which rewrites any value that differs from search_text() server-side, e.g.
+after the normalization changes.
+
+normalize_search_text is the pandas twin of search_text() and of
+normalizeSearchText (src/lib/utils/searchText.ts), for indexes built
+client-side such as the autocomplete index.
+Requires migrations/006_trigram_search.sql.
+"""
+
+from nailnav_etl import get_client, metrics
+
+
+def normalize_search_text(values):
+    """
+    Normalize a Series of text for trigram search.
+
+    Same steps as slugify, but words are joined with single spaces instead
+    of hyphens. Missing values stay missing.
+    """
+    text = values.astype('string')
+    return (
+        text.str.lower()
+        .str.normalize('NFKD')
+        .str.encode('ascii', 'ignore')
+        .str.decode('ascii')
+        .str.replace(r'[^\w\s-]', '', regex=True)
+        .str.replace(r'[-\s]+', ' ', regex=True)
+        .str.strip()
+    )
+
+
+def refresh_search_columns(supabase):
+    """Rewrite stale search columns; returns (salons written, cities written)"""
+    result = supabase.rpc('refresh_search_columns', {}).execute()
+    return result.data['salons'], result.data['cities']
+
+
+def main():
+    print("=" * 80)
+    print("🔎 BUILDING TRIGRAM SEARCH COLUMNS")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    print("\n🔄 Normalizing salon and city text...")
+    try:
+        with metrics.stage('refresh_search_columns'):
+            salons, cities = refresh_search_columns(supabase)
+    except Exception as e:
+        print(f"❌ Failed to build search columns: {e}")
+        print("   Has migrations/006_trigram_search.sql been applied?")
+        return
+
+    print(f"✅ Updated {salons} salons and {cities} cities")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Build and query a sharded BM25 full-text index over salon content
+
+Indexes description, detailed_description, about, customers_saying,
+health_wellbeing_care and the published review bodies of every salon. Each
+salon is one document. Postings are split across shard files by term hash,
+so a query only loads the shards of its own terms:
+
+    text_index/docs.json        {salon_id: {"len", "hash", "terms"}}
+    text_index/shard_NN.json    {term: {salon_id: term_frequency}}
+
+Document hashes are compared on every run and only salons whose text changed
+are re-tokenized; their old postings are removed and new ones added, touching
+only the shards those terms live in.
+
+Usage:
+    python build_text_index.py                  # incremental refresh
+    python build_text_index.py --full           # rebuild from scratch
+    python build_text_index.py --query "gel pedicure parking"
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import zlib
+from collections import Counter, defaultdict
+
+from nailnav_etl import get_client
+from paged_reads import fetch_all
+
+INDEX_DIR = 'text_index'
+DOCS_FILE = os.path.join(INDEX_DIR, 'docs.json')
+NUM_SHARDS = 32
+
+TEXT_COLUMNS = ['description', 'detailed_description', 'about', 'customers_saying', 'health_wellbeing_care']
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from had has have i in is it its my of on or
+our so that the their they this to was we were with you your very all
+""".split())
+
+
+def tokenize(text):
+    """Lowercase, strip HTML tags and split into indexable terms"""
+    text = TAG_PATTERN.sub(' ', text.lower())
+    return [t for t in TOKEN_PATTERN.findall(text) if len(t) > 1 and t not in STOPWORDS]
+
+
+def shard_of(term):
+    return zlib.crc32(term.encode('utf-8')) % NUM_SHARDS
+
+
+def shard_path(shard):
+    return os.path.join(INDEX_DIR, f"shard_{shard:02d}.json")
+
+
+def fetch_documents(supabase):
+    """Return {salon_id: full text} for every published salon"""
+    salons = fetch_all(lambda: (
+        supabase.table('salons')
+        .select('id, ' + ', '.join(TEXT_COLUMNS))
+        .eq('is_published', True)
+        .order('id')
+    ))
+    reviews = fetch_all(lambda: (
+        supabase.table('reviews')
+        .select('id, salon_id, content')
+        .eq('is_published', True)
+        .order('id')
+    ))
+
+    parts = defaultdict(list)
+    for salon in salons:
+        parts[str(salon['id'])].extend(salon[col] for col in TEXT_COLUMNS if salon.get(col))
+    for review in reviews:
+        salon_id = str(review['salon_id'])
+        if salon_id in parts and review.get('content'):
+            parts[salon_id].append(review['content'])
+    return {salon_id: '\n'.join(texts) for salon_id, texts in parts.items()}
+
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    os.makedirs(INDEX_DIR, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+
+def update_index(documents, full=False):
+    """Apply changed, new and removed documents; returns (changed, removed)"""
+    docs = {} if full else load_json(DOCS_FILE, {})
+
+    hashes = {
+        salon_id: hashlib.sha1(text.encode('utf-8')).hexdigest()
+        for salon_id, text in documents.items()
+    }
+    changed = [s for s, h in hashes.items() if docs.get(s, {}).get('hash') != h]
+    removed = [s for s in docs if s not in documents]
+
+    # Postings to drop and to add, grouped by shard
+    drops = defaultdict(lambda: defaultdict(list))
+    adds = defaultdict(lambda: defaultdict(dict))
+
+    for salon_id in changed + removed:
+        for term in docs.get(salon_id, {}).get('terms', []):
+            drops[shard_of(term)][term].append(salon_id)
+
+    for salon_id in removed:
+        del docs[salon_id]
+
+    for salon_id in changed:
+        counts = Counter(tokenize(documents[salon_id]))
+        for term, tf in counts.items():
+            adds[shard_of(term)][term][salon_id] = tf
+        docs[salon_id] = {
+            'len': sum(counts.values()),
+            'hash': hashes[salon_id],
+            'terms': sorted(counts),
+        }
+
+    for shard in set(drops) | set(adds):
+        postings = {} if full else load_json(shard_path(shard), {})
+        for term, salon_ids in drops[shard].items():
+            term_postings = postings.get(term, {})
+            for salon_id in salon_ids:
+                term_postings.pop(salon_id, None)
+            if not term_postings:
+                postings.pop(term, None)
+        for term, new_postings in adds[shard].items():
+            postings.setdefault(term, {}).update(new_postings)
+        save_json(shard_path(shard), postings)
+
+    save_json(DOCS_FILE, docs)
+    return len(changed), len(removed)
+
+
+def search(query, limit=20):
+    """Return [(salon_id, score), ...] ranked by BM25 for the query terms"""
+    docs = load_json(DOCS_FILE, {})
+    if not docs:
+        return []
+
+    n_docs = len(docs)
+    avg_len = sum(doc['len'] for doc in docs.values()) / n_docs
+
+    terms = set(tokenize(query))
+    by_shard = defaultdict(list)
+    for term in terms:
+        by_shard[shard_of(term)].append(term)
+
+    scores = defaultdict(float)
+    for shard, shard_terms in by_shard.items():
+        postings = load_json(shard_path(shard), {})
+        for term in shard_terms:
+            term_postings = postings.get(term)
+            if not term_postings:
+                continue
+            df = len(term_postings)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for salon_id, tf in term_postings.items():
+                norm = K1 * (1 - B + B * docs[salon_id]['len'] / avg_len)
+                scores[salon_id] += idf * tf * (K1 + 1) / (tf + norm)
+
+    ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+    return [(int(salon_id), score) for salon_id, score in ranked]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the salon text index')
+    parser.add_argument('--full', action='store_true', help='Rebuild the whole index')
+    parser.add_argument('--query', help='Search the index instead of building it')
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.query:
+        for salon_id, score in search(args.query, args.limit):
+            print(f"{salon_id}\t{score:.3f}")
+        return
+
+    print("=" * 80)
+    print("📚 BUILDING FULL-TEXT INDEX")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    print("\n📥 Loading salon text and reviews...")
+    documents = fetch_documents(supabase)
+    print(f"✅ Loaded {len(documents)} salons")
+
+    if args.full and os.path.isdir(INDEX_DIR):
+        for name in os.listdir(INDEX_DIR):
+            os.remove(os.path.join(INDEX_DIR, name))
+
+    changed, removed = update_index(documents, full=args.full)
+
+    print("\n" + "=" * 80)
+    print("📊 INDEX SUMMARY")
+    print("=" * 80)
+    print(f"✅ Re-indexed salons: {changed}")
+    print(f"🗑️  Removed salons: {removed}")
+    print(f"📁 Output: {INDEX_DIR}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,22 @@
-import os
-from supabase import create_client
+from nailnav_etl import get_client
+from paged_reads import fetch_all
 
-url = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
-key = os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-supabase = create_client(url, key)
+supabase = get_client()
 
-# Get all cities
-result = supabase.table('cities').select('id, name').limit(100).execute()
-print(f"Total cities: {len(result.data)}")
-for city in sorted(result.data, key=lambda x: x['name']):
-    print(f"  {city['name']}")
+# Get all cities with their published salon counts (migrations/013)
+cities = fetch_all(lambda: supabase.table('city_salon_counts').select('city_id, city_name, state_code, salon_count').order('city_id'))
+print(f"Total cities: {len(cities)}")
+for city in sorted(cities, key=lambda x: x['city_name']):
+    print(f"  {city['city_name']}")
 
 # Get count by city
 print("\nSalons per city:")
-salons_result = supabase.table('salons').select('city_id, cities(name)', count='exact').eq('is_published', True).execute()
-city_counts = {}
-for salon in salons_result.data:
-    city_name = salon.get('cities', {}).get('name') if salon.get('cities') else None
-    if city_name:
-        city_counts[city_name] = city_counts.get(city_name, 0) + 1
+for city in sorted(cities, key=lambda x: -x['salon_count'])[:20]:
+    if city['salon_count']:
+        print(f"  {city['city_name']}: {city['salon_count']} salons")
 
-for city, count in sorted(city_counts.items(), key=lambda x: -x[1])[:20]:
-    print(f"  {city}: {count} salons")
+# Get count by state
+print("\nSalons per state:")
+states = supabase.table('state_salon_counts').select('state_code, salon_count').order('salon_count', desc=True).execute()
+for state in states.data:
+    print(f"  {state['state_code'] or 'Unknown'}: {state['salon_count']} salons")
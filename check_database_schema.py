@@ -2,21 +2,16 @@
 """
 Check what tables exist in the Supabase database
 """
-import os
-from dotenv import load_dotenv
-from supabase import create_client, Client
 
-load_dotenv('.env.local')
-
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+from nailnav_etl import get_client
+from schema_cache import schema_version, table_columns
 
 print("=" * 80)
 print("🔍 DATABASE SCHEMA INSPECTION")
 print("=" * 80)
 
 try:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    supabase = get_client()
     
     # List of tables to check
     tables_to_check = [
@@ -62,16 +57,15 @@ try:
     if existing_tables:
         print("\n🔍 Inspecting 'salons' table structure:")
         try:
-            result = supabase.table('salons').select('*').limit(1).execute()
-            if result.data:
-                sample = result.data[0]
-                print(f"\n   Columns found:")
-                for key in sample.keys():
-                    print(f"     - {key}: {type(sample[key]).__name__}")
-            else:
-                print("   No data in salons table yet")
+            # Always refetch here; this also refreshes the importers' cache
+            columns = table_columns(supabase, 'salons', refresh=True)
+            print(f"\n   Schema version: {schema_version('salons')}")
+            print(f"   Columns found ({len(columns)}):")
+            for name, data_type in columns.items():
+                print(f"     - {name}: {data_type}")
         except Exception as e:
             print(f"   Error: {e}")
+            print("   Has migrations/014_table_columns.sql been applied?")
             
 except Exception as e:
     print(f"❌ Connection failed: {e}")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Column statistics for any table in one request
+
+column_stats() calls table_column_stats (migrations/012_table_column_stats.sql),
+which counts rows, non-null values per column, TRUE values per boolean
+column and rows per group value in a single server-side aggregate. The
+result is returned as a DataFrame indexed by column:
+
+    non_null   null_rate   true   true_rate
+
+so a report over 70 columns is one round trip instead of seventy.
+"""
+import pandas as pd
+
+
+def column_stats(supabase, columns, table='salons', group_by=None):
+    """
+    Return (total, stats, groups, missing) for `columns` of `table`.
+
+    `stats` is a DataFrame indexed by column name; `true` / `true_rate` are
+    NaN for non-boolean columns. `groups` is a Series of row counts per
+    value of `group_by`, largest first (empty when group_by is None).
+    `missing` lists requested columns the table doesn't have; their rows
+    in `stats` are all NaN.
+    """
+    result = supabase.rpc('table_column_stats', {
+        'target_table': table,
+        'column_names': list(columns),
+        'group_column': group_by,
+    }).execute()
+    data = result.data
+
+    total = data['total']
+    stats = pd.DataFrame.from_dict(data['columns'], orient='index').reindex(list(columns))
+    if 'non_null' not in stats:
+        stats['non_null'] = float('nan')
+    if 'true' not in stats:
+        stats['true'] = float('nan')
+    stats['null_rate'] = 1 - stats['non_null'] / total if total else float('nan')
+    stats['true_rate'] = stats['true'] / total if total else float('nan')
+
+    groups = pd.Series(data['groups'], dtype='int64').sort_values(ascending=False)
+    return total, stats[['non_null', 'null_rate', 'true', 'true_rate']], groups, list(data['missing'])
@@ -6,15 +6,9 @@ and prepare them for insertion into the database
 
 import openpyxl
 import json
-import re
 from collections import defaultdict
 
-def slugify(text):
-    """Convert text to URL-friendly slug"""
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
-    return text
+from nailnav_etl import slugify
 
 def extract_cities():
     print("Loading Australian nail salon data...")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Stable bit registry for the packed salon filter mask
+
+Every Yes/No filter column in the salons table owns one bit of the
+`filter_mask` BIGINT column, which the trg_salons_filter_mask trigger
+(migrations/004_salon_filter_mask.sql) computes on every write. Bit
+numbers are persisted in the database and mirrored in salon_filter_mask
+(migrations/004) and src/lib/utils/filterBits.ts, so they must never be renumbered: new flags
+are appended with the next free bit, retired flags keep their bit reserved.
+"""
+FILTER_BITS = {
+    # Services
+    'manicure': 0,
+    'gel_manicure': 1,
+    'gel_extensions': 2,
+    'acrylic_nails': 3,
+    'pedicure': 4,
+    'gel_pedicure': 5,
+    'sns_dip_powder': 6,
+    'builders_gel_biab': 7,
+    'nail_art': 8,
+    'massage': 9,
+    'facials': 10,
+    'lash_extensions': 11,
+    'lash_lift_tint': 12,
+    'brows': 13,
+    'waxing': 14,
+    'injectables': 15,
+    'tanning': 16,
+    'cosmetic_tattoo': 17,
+    'haircuts': 18,
+    'spa_hand_foot_treatment': 19,
+    # Languages
+    'english': 20,
+    'spanish': 21,
+    'vietnamese': 22,
+    'chinese': 23,
+    'korean': 24,
+    # Specialties
+    'qualified_technicians': 25,
+    'experienced_team': 26,
+    'quick_service': 27,
+    'award_winning_staff': 28,
+    'master_nail_artist': 29,
+    'bridal_nails': 30,
+    # Appointment Types
+    'appointment_required': 31,
+    'walk_ins_welcome': 32,
+    'group_bookings': 33,
+    'mobile_nails': 34,
+    # Amenities
+    'child_friendly': 35,
+    'adult_only': 36,
+    'pet_friendly': 37,
+    'lgbtqi_friendly': 38,
+    'wheelchair_accessible': 39,
+    'complimentary_drink': 40,
+    'heated_massage_chairs': 41,
+    'foot_spas': 42,
+    'free_wifi': 43,
+    'parking': 44,
+    'autoclave_sterilisation': 45,
+    'led_curing': 46,
+    'clean_ethical_products': 47,
+    'vegan_polish': 48,
+}
+
+# Bit 63 is the sign bit of a Postgres BIGINT
+assert max(FILTER_BITS.values()) < 63
+
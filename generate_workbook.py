@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic salon workbook for scale testing
+
+Writes an .xlsx or .csv with exactly the headers of a template workbook,
+typos and all ("Reveiw summary", "Lash Exensions", "Cosmetic Tatoo"), and
+any number of rows, so importers and refreshes can be timed well past 250
+salons.
+
+The default template is Nail_Salons_Aus_250_updated.xlsx, the layout read
+by import_updated_final.py, import_updated_simple.py and
+import_faq_and_update_filters.py, which take the generated file as their
+first argument. Those importers open workbooks with openpyxl, so give
+them .xlsx output; .csv output is for the readers that stream CSV too
+(profile_workbook.py, inspect_excel.py). Pass --template
+Nail_Salons_Aus_250.xlsx for the original layout.
+
+The template is profiled once (profile_workbook.read_frame) and every
+column is filled to look like it:
+
+- place_id, name, address, Name+Address, phone, website, state, City and
+  Postcode are synthesized per row: names are unique, and addresses use
+  real street / suburb / postcode combinations from the template
+- "Review  N" columns hold "rating N: ..." text built from short phrases,
+  with the template's fill rate and star distribution per column
+- Yes/No flag columns are set to "Yes" at the template's rate; empty flag
+  columns inside the flag block get MIN_FLAG_RATE so every filter is used
+- everything else (categories, hours, prices, summaries) is resampled
+  from the template's values at its fill rate
+
+Rows are built and written CHUNK_SIZE at a time (openpyxl write-only mode
+for .xlsx), so memory stays flat from 1k to 1M rows.
+
+Usage:
+    python generate_workbook.py --rows 100000 --output synthetic_salons_100000.xlsx
+    python import_updated_final.py synthetic_salons_100000.xlsx
+    python generate_workbook.py --rows 1000000 --output synthetic_salons_1m.csv
+"""
+import argparse
+import csv
+import re
+import string
+import sys
+import time
+
+DEFAULT_TEMPLATE = 'Nail_Salons_Aus_250_updated.xlsx'
+CHUNK_SIZE = 10000
+MAX_XLSX_ROWS = 1048575
+MIN_FLAG_RATE = 0.02
+REVIEW_VARIANTS = 200
+
+FLAG_VALUES = frozenset(['Yes', 'No'])
+REVIEW_PREFIX = 'Review  '
+REVIEW_RATING = re.compile(r'^rating\s+(\d+(?:\.\d+)?)\s*:\s*(.*)', re.IGNORECASE | re.DOTALL)
+ADDRESS_PATTERN = re.compile(
+    r'^(?:.*,\s*)?(\d+[A-Za-z]?)\s+([A-Za-z][A-Za-z .\'-]+?)\s*,\s*([^,]+?)\s+'
+    r'(NSW|NT|VIC|QLD|SA|WA|TAS|ACT)\s+(\d{4})$'
+)
+PLACE_ID_ALPHABET = string.ascii_letters + string.digits + '-_'
+
+AREA_CODES = {'NSW': '02', 'ACT': '02', 'VIC': '03', 'TAS': '03', 'QLD': '07', 'SA': '08', 'WA': '08', 'NT': '08'}
+
+NAME_KINDS = [
+    'Nails', 'Nail Bar', 'Nail Spa', 'Nail & Beauty', 'Nails & Spa', 'Beauty Lounge',
+    'Nail Studio', 'Nail Lounge', 'Beauty Bar', 'Nail Art Studio', 'Beauty & Nails',
+]
+NAME_WORDS = [
+    'Orchid', 'Lotus', 'Pearl', 'Luxe', 'Golden', 'Crystal', 'Diamond', 'Velvet', 'Rose',
+    'Jade', 'Lily', 'Ivory', 'Coral', 'Blossom', 'Glow', 'Polished', 'Pure', 'Bella',
+    'Luna', 'Aurora', 'Sakura', 'Saigon', 'Harbour', 'Coastal', 'Urban', 'Sunny', 'Royal',
+    'Opal', 'Willow', 'Magnolia', 'Sapphire', 'Amber', 'Venus', 'Elite', 'Happy', 'Star',
+]
+
+REVIEW_PHRASES = {
+    'good': [
+        'The staff were friendly and very professional.',
+        'My gel manicure lasted over three weeks without chipping.',
+        'Super clean salon and they sterilise everything.',
+        'Booked online and was seated right on time.',
+        'Lovely relaxing pedicure with a great massage.',
+        'The nail art was exactly what I asked for.',
+        'Great value for money, will definitely be back.',
+        'They took their time and the shape is perfect.',
+        'Best acrylics I have had in years.',
+        'Walked in without an appointment and they fitted me in.',
+    ],
+    'mixed': [
+        'Nails look fine but the wait was long.',
+        'Service was okay, a bit rushed at the end.',
+        'Decent result although the price has gone up.',
+        'Friendly staff but the polish chipped after a week.',
+        'Good location, parking was hard to find.',
+    ],
+    'bad': [
+        'I had a really disappointing experience here.',
+        'The technician cut my cuticles and it hurt.',
+        'Waited forty minutes even though I had a booking.',
+        'My nails lifted after two days.',
+        'They were rude when I asked them to fix a nail.',
+    ],
+}
+
+
+def load_template(path):
+    """Template frame (raw headers in attrs['headers']) from profile_workbook"""
+    from profile_workbook import read_frame
+
+    frame, _, _ = read_frame(path)
+    return frame
+
+
+def column_plan(frame):
+    """(kind, details) for every template column, in sheet order"""
+    import numpy as np
+    import pandas as pd
+
+    headers = frame.attrs['headers']
+    total = len(frame)
+    non_null = [frame.iloc[:, i].dropna() for i in range(len(headers))]
+    is_flag = [len(values) > 0 and set(values.astype(str).str.strip()) <= FLAG_VALUES for values in non_null]
+    flag_positions = [i for i, flag in enumerate(is_flag) if flag]
+    first_flag, last_flag = (flag_positions[0], flag_positions[-1]) if flag_positions else (-1, -1)
+    synthesized = {'place_id', 'name', 'address', 'name+address', 'phone', 'website', 'state', 'city', 'postcode'}
+
+    plan = []
+    for position, header in enumerate(headers):
+        values = non_null[position]
+        fill = len(values) / total if total else 0.0
+        key = header.strip().lower()
+
+        if position == 0 and values.astype(str).str.startswith('ChIJ').all():
+            plan.append(('place_id', {}))
+        elif key in synthesized:
+            plan.append((key, {'fill': fill}))
+        elif header.startswith(REVIEW_PREFIX):
+            parts = values.astype(str).str.extract(REVIEW_RATING)
+            stars = np.rint(np.clip(pd.to_numeric(parts[0], errors='coerce').dropna().to_numpy(float), 1, 5)).astype(int)
+            empty = float((parts[1].fillna('').str.strip().str.len() < 10).mean()) if len(values) else 0.0
+            plan.append(('review', {'fill': fill, 'stars': stars if len(stars) else np.array([5]), 'empty': empty}))
+        elif is_flag[position] or first_flag < position < last_flag and not len(values):
+            text = values.astype(str).str.strip()
+            plan.append(('flag', {
+                'yes': max(float((text == 'Yes').sum()) / total, MIN_FLAG_RATE) if total else MIN_FLAG_RATE,
+                'no': float((text == 'No').sum()) / total if total else 0.0,
+            }))
+        elif len(values):
+            plan.append(('sample', {'fill': fill, 'values': values.to_numpy(dtype=object)}))
+        else:
+            plan.append(('empty', {}))
+    return plan
+
+
+def location_pool(frame):
+    """Array of (number, street, suburb, state, postcode, city) parsed from template addresses"""
+    import numpy as np
+
+    columns = {str(c).strip().lower(): c for c in frame.columns}
+    addresses = frame[columns['address']] if 'address' in columns else []
+    cities = frame[columns['city']] if 'city' in columns else [None] * len(frame)
+    pool = []
+    for address, city in zip(addresses, cities):
+        match = ADDRESS_PATTERN.match(str(address).strip()) if address is not None else None
+        if match:
+            _, street, suburb, state, postcode = match.groups()
+            pool.append((street.strip(), suburb.strip(), state, postcode, city if isinstance(city, str) else suburb.strip()))
+    if not pool:
+        pool.append(('George St', 'Sydney', 'NSW', '2000', 'Sydney'))
+    return np.array(pool, dtype=object)
+
+
+def place_ids(rng, n):
+    import numpy as np
+
+    alphabet = np.array(list(PLACE_ID_ALPHABET))
+    chars = alphabet[rng.integers(len(alphabet), size=(n, 23))]
+    return np.array(['ChIJ' + ''.join(row) for row in chars], dtype=object)
+
+
+def unique_names(rng, suburbs, seen):
+    """Salon names, unique across the whole run via `seen` counts"""
+    words = rng.choice(NAME_WORDS, size=len(suburbs))
+    kinds = rng.choice(NAME_KINDS, size=len(suburbs))
+    with_suburb = rng.random(len(suburbs)) < 0.5
+    names = []
+    for word, kind, suburb, add_suburb in zip(words, kinds, suburbs, with_suburb):
+        base = f"{word} {kind} {suburb}" if add_suburb else f"{word} {kind}"
+        count = seen.get(base, 0)
+        seen[base] = count + 1
+        names.append(f"{base} {count + 1}" if count else base)
+    return names
+
+
+def phone_numbers(rng, states):
+    digits = rng.integers(0, 10, size=(len(states), 8))
+    mobile = rng.random(len(states)) < 0.45
+    numbers = []
+    for state, d, is_mobile in zip(states, digits, mobile):
+        d = ''.join(map(str, d))
+        if is_mobile:
+            numbers.append(f"04{d[:2]} {d[2:5]} {d[5:8]}")
+        else:
+            numbers.append(f"({AREA_CODES.get(state, '02')}) {d[:4]} {d[4:8]}")
+    return numbers
+
+
+def websites(rng, names):
+    from nailnav_etl import slugify
+
+    instagram = rng.random(len(names)) < 0.2
+    return [
+        f"https://www.instagram.com/{slugify(name).replace('-', '_')}" if social
+        else f"https://www.{slugify(name).replace('-', '')}.com.au/"
+        for name, social in zip(names, instagram)
+    ]
+
+
+def review_variants(rng, count=REVIEW_VARIANTS):
+    """Per star rating, an array of 'rating N: ...' cells to draw from"""
+    import numpy as np
+
+    variants = {}
+    for star in range(1, 6):
+        pool = REVIEW_PHRASES['good' if star >= 4 else 'mixed' if star == 3 else 'bad']
+        texts = []
+        for length in rng.integers(1, 4, size=count):
+            picks = rng.choice(len(pool), size=min(length, len(pool)), replace=False)
+            texts.append(f"rating {star}: " + ' '.join(pool[i] for i in picks))
+        variants[star] = np.array(texts, dtype=object)
+    return variants
+
+
+def review_texts(rng, stars, empty, variants):
+    """'rating N: ...' cells for an array of star ratings"""
+    import numpy as np
+
+    out = np.empty(len(stars), dtype=object)
+    for star, texts in variants.items():
+        rows = np.flatnonzero(stars == star)
+        out[rows] = texts[rng.integers(len(texts), size=len(rows))]
+    blank = rng.random(len(stars)) < empty
+    out[blank] = np.char.add('rating ', stars[blank].astype(str)).astype(object) + ': '
+    return out
+
+
+def generate_chunk(rng, plan, locations, variants, n, seen_names):
+    """Column arrays for `n` rows"""
+    import numpy as np
+
+    def masked(values, fill):
+        out = np.empty(n, dtype=object)
+        keep = rng.random(n) < fill
+        out[keep] = np.asarray(values, dtype=object)[keep]
+        return out
+
+    picks = locations[rng.integers(len(locations), size=n)]
+    streets, suburbs, states, postcodes, cities = (picks[:, i] for i in range(5))
+    numbers = rng.integers(1, 400, size=n)
+    addresses = [f"{num} {street}, {suburb} {state} {postcode}"
+                 for num, street, suburb, state, postcode in zip(numbers, streets, suburbs, states, postcodes)]
+    names = unique_names(rng, suburbs, seen_names)
+
+    columns = []
+    for kind, details in plan:
+        if kind == 'place_id':
+            columns.append(place_ids(rng, n))
+        elif kind == 'name':
+            columns.append(np.array(names, dtype=object))
+        elif kind == 'address':
+            columns.append(np.array(addresses, dtype=object))
+        elif kind == 'name+address':
+            columns.append(np.array([f"{name} {address.split(',')[0]}, {suburb}"
+                                     for name, address, suburb in zip(names, addresses, suburbs)], dtype=object))
+        elif kind == 'phone':
+            columns.append(masked(phone_numbers(rng, states), details['fill']))
+        elif kind == 'website':
+            columns.append(masked(websites(rng, names), details['fill']))
+        elif kind == 'state':
+            columns.append(states)
+        elif kind == 'city':
+            columns.append(masked(cities, details['fill']))
+        elif kind == 'postcode':
+            columns.append(np.array([int(p) for p in postcodes], dtype=object))
+        elif kind == 'review':
+            stars = details['stars'][rng.integers(len(details['stars']), size=n)]
+            columns.append(masked(review_texts(rng, stars, details['empty'], variants), details['fill']))
+        elif kind == 'flag':
+            draw = rng.random(n)
+            out = np.full(n, None, dtype=object)
+            out[draw < details['yes']] = 'Yes'
+            out[(draw >= details['yes']) & (draw < details['yes'] + details['no'])] = 'No'
+            columns.append(out)
+        elif kind == 'sample':
+            values = details['values']
+            columns.append(masked(values[rng.integers(len(values), size=n)], details['fill']))
+        else:
+            columns.append(np.full(n, None, dtype=object))
+    return columns
+
+
+def generate_rows(template, rows, seed=0, chunk_size=CHUNK_SIZE):
+    """Yield the template headers, then lists of row tuples, chunk by chunk"""
+    import numpy as np
+
+    frame = load_template(template)
+    plan = column_plan(frame)
+    locations = location_pool(frame)
+    rng = np.random.default_rng(seed)
+    variants = review_variants(rng)
+    seen_names = {}
+
+    yield frame.attrs['headers']
+    for start in range(0, rows, chunk_size):
+        n = min(chunk_size, rows - start)
+        columns = generate_chunk(rng, plan, locations, variants, n, seen_names)
+        yield list(zip(*columns))
+
+
+def write_workbook(output, chunks):
+    """Stream header and row chunks to .csv or .xlsx; returns rows written"""
+    headers = next(chunks)
+    written = 0
+
+    if output.lower().endswith('.csv'):
+        with open(output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            for chunk in chunks:
+                writer.writerows(chunk)
+                written += len(chunk)
+                yield written
+        return
+
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(headers)
+    for chunk in chunks:
+        for row in chunk:
+            sheet.append(row)
+        written += len(chunk)
+        yield written
+    workbook.save(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic salon workbook')
+    parser.add_argument('--rows', type=int, default=1000, help='Data rows to generate (default 1000)')
+    parser.add_argument('--output', help='Output .xlsx or .csv (default synthetic_salons_<rows>.xlsx)')
+    parser.add_argument('--template', default=DEFAULT_TEMPLATE, help=f'Workbook to mimic (default {DEFAULT_TEMPLATE})')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default 0)')
+    args = parser.parse_args()
+
+    output = args.output or f"synthetic_salons_{args.rows}.xlsx"
+    if args.rows < 1:
+        parser.error('--rows must be at least 1')
+    if not output.lower().endswith(('.csv', '.xlsx')):
+        parser.error('--output must end in .csv or .xlsx')
+    if output.lower().endswith('.xlsx') and args.rows > MAX_XLSX_ROWS:
+        parser.error(f'.xlsx holds at most {MAX_XLSX_ROWS} data rows; write a .csv instead')
+
+    print("=" * 80)
+    print("🧪 GENERATING SYNTHETIC SALON WORKBOOK")
+    print("=" * 80)
+    print(f"\n📂 Template: {args.template}")
+    print(f"📝 Writing {args.rows:,} rows to {output}...")
+
+    start = time.perf_counter()
+    try:
+        for written in write_workbook(output, generate_rows(args.template, args.rows, seed=args.seed)):
+            if written % (CHUNK_SIZE * 10) == 0 or written == args.rows:
+                print(f"  ✅ {written:,} rows ({written / (time.perf_counter() - start):,.0f} rows/sec)")
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"\n✅ Done in {time.perf_counter() - start:.1f}s")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,21 +5,9 @@ Maps columns 0-CX from Nail_Salons_Aus_250.xlsx to Supabase
 """
 
 import pandas as pd
-import sys
-import os
-from dotenv import load_dotenv
-from supabase import create_client
 
-load_dotenv('.env.local')
-
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-    print("❌ Error: Supabase credentials not found")
-    sys.exit(1)
-
-supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+from nailnav_etl import bool_value, get_client, metrics
+from paged_reads import iter_rows
 
 # Column mapping from spreadsheet to database
 # These are columns AV-CV (indices 47-99) that contain service/amenity booleans
@@ -80,29 +68,25 @@ SERVICE_AMENITY_COLUMNS = {
     99: ('Vegan polish', 'vegan_polish'),  # CV
 }
 
-def bool_value(value):
-    """Convert Excel value to boolean"""
-    if pd.isna(value):
-        return False
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return value > 0
-    if isinstance(value, str):
-        return value.strip().lower() in ['yes', 'true', '1', 'x', 'y']
-    return bool(value)
-
 def main():
+    supabase = get_client()
+
     print("📊 Reading Excel file...")
-    df = pd.read_excel('Nail_Salons_Aus_250.xlsx')
+    with metrics.stage('read') as read:
+        df = pd.read_excel('Nail_Salons_Aus_250.xlsx')
+        read.rows = len(df)
     
     print(f"Found {len(df)} salons in spreadsheet")
     print(f"Spreadsheet has {len(df.columns)} columns")
     
     # Get all salons from database
     print("\n🔍 Fetching salons from database...")
-    result = supabase.table('salons').select('id, name').execute()
-    db_salons = {s['name']: s['id'] for s in result.data}
+    with metrics.stage('resolve') as resolve:
+        db_salons = {
+            s['name']: s['id']
+            for s in iter_rows(lambda: supabase.table('salons').select('id, name').order('id'))
+        }
+        resolve.rows = len(db_salons)
     
     print(f"Found {len(db_salons)} salons in database")
     
@@ -112,7 +96,7 @@ def main():
     
     print("\n🔄 Updating salon data...")
     
-    for idx, row in df.iterrows():
+    for idx, row in metrics.per_row('transform', df.iterrows()):
         salon_name = row.iloc[1] if len(row) > 1 else None  # Column B = name
         
         if pd.isna(salon_name):
@@ -138,7 +122,8 @@ def main():
         
         # Update salon
         try:
-            supabase.table('salons').update(update_data).eq('id', salon_id).execute()
+            with metrics.stage('write', rows=1):
+                supabase.table('salons').update(update_data).eq('id', salon_id).execute()
             updated += 1
             if updated % 10 == 0:
                 print(f"✅ Updated {updated} salons...")
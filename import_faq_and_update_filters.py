@@ -3,14 +3,17 @@
 Import FAQ data and update filter names
 """
 
-import os
+import sys
+
 import openpyxl
-from supabase import create_client, Client
+
+from nailnav_etl import get_client
 
 # Initialize Supabase
-supabase_url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-supabase_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-supabase: Client = create_client(supabase_url, supabase_key)
+supabase = get_client()
+
+# Default workbook; pass another path (e.g. from generate_workbook.py) as the first argument
+WORKBOOK = 'Nail_Salons_Aus_250_updated.xlsx'
 
 def import_faq_data():
     """Import About and FAQ text fields from Excel"""
@@ -18,7 +21,7 @@ def import_faq_data():
     print("IMPORTING FAQ DATA FROM EXCEL")
     print("="*80)
     
-    wb = openpyxl.load_workbook('Nail_Salons_Aus_250_updated.xlsx', data_only=True)
+    wb = openpyxl.load_workbook(sys.argv[1] if len(sys.argv) > 1 else WORKBOOK, data_only=True)
     sheet = wb.active
     
     # Get headers
@@ -33,7 +36,7 @@ def import_faq_data():
     updated = 0
     skipped = 0
     
-    for row_num in range(2, min(sheet.max_row + 1, 252)):
+    for row_num in range(2, sheet.max_row + 1):
         # Get salon name
         salon_name = sheet.cell(row=row_num, column=headers.get('name', 2)).value
         if not salon_name:
@@ -3,38 +3,14 @@
 Import real reviews from Excel file to Supabase reviews table
 """
 import pandas as pd
-import os
-import re
-from dotenv import load_dotenv
-from supabase import create_client, Client
 from datetime import datetime, timedelta
 import random
 
-load_dotenv('.env.local')
-
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-def parse_review_text(review_text):
-    """
-    Parse review text that contains rating and content
-    Format: "rating 5: Review content here..."
-    """
-    if pd.isna(review_text):
-        return None, None
-    
-    text = str(review_text).strip()
-    
-    # Extract rating (format: "rating 5:" or "rating 4.5:")
-    rating_match = re.match(r'rating\s+(\d+(?:\.\d+)?)\s*:\s*(.*)', text, re.IGNORECASE)
-    
-    if rating_match:
-        rating = float(rating_match.group(1))
-        content = rating_match.group(2).strip()
-        return rating, content
-    
-    # If no rating found, assume 5 stars and use full text
-    return 5.0, text
+from nailnav_etl import get_client, metrics
+from parse_reviews import extract_reviews, review_columns
+from build_rank_scores import refresh_rank_scores
+from build_review_snapshots import refresh_review_snapshots
+from paged_reads import iter_rows
 
 def generate_reviewer_names():
     """Generate anonymous reviewer names"""
@@ -50,7 +26,7 @@ def main():
     # Connect to Supabase
     print("\n📡 Connecting to Supabase...")
     try:
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+        supabase = get_client()
         print("✅ Connected")
     except Exception as e:
         print(f"❌ Failed to connect: {e}")
@@ -59,7 +35,9 @@ def main():
     # Read Excel file
     print("\n📂 Reading Excel file...")
     try:
-        df = pd.read_excel('Nail_Salons_Aus_250.xlsx', sheet_name=0)
+        with metrics.stage('read') as read:
+            df = pd.read_excel('Nail_Salons_Aus_250.xlsx', sheet_name=0)
+            read.rows = len(df)
         print(f"✅ Loaded {len(df)} salons")
     except Exception as e:
         print(f"❌ Failed to read Excel: {e}")
@@ -68,8 +46,12 @@ def main():
     # Get salon mapping (Excel row to database ID)
     print("\n🔍 Mapping salons to database IDs...")
     try:
-        salons_result = supabase.table('salons').select('id, name, slug').execute()
-        salon_map = {salon['name']: salon['id'] for salon in salons_result.data}
+        with metrics.stage('resolve') as resolve:
+            salon_map = {
+                salon['name']: salon['id']
+                for salon in iter_rows(lambda: supabase.table('salons').select('id, name').order('id'))
+            }
+            resolve.rows = len(salon_map)
         print(f"✅ Found {len(salon_map)} salons in database")
     except Exception as e:
         print(f"❌ Failed to get salons: {e}")
@@ -78,72 +60,57 @@ def main():
     # Delete existing reviews (optional)
     print("\n🗑️  Deleting existing fake reviews...")
     try:
-        supabase.table('reviews').delete().neq('id', 0).execute()
+        with metrics.stage('write'):
+            supabase.table('reviews').delete().neq('id', 0).execute()
         print("✅ Cleared reviews table")
     except Exception as e:
         print(f"⚠️  Warning: {e}")
     
     # Find review columns
-    review_cols = [col for col in df.columns if col.startswith('Review  ')]
+    review_cols = review_columns(df)
     print(f"\n📋 Found {len(review_cols)} review columns")
     
     # Generate reviewer names pool
     reviewer_names = generate_reviewer_names()
     
+    # Parse every review cell for salons in the database in one pass
+    with metrics.stage('transform'):
+        reviews, total_skipped = extract_reviews(df[df['name'].isin(salon_map)], review_cols)
+    
     # Import reviews
-    print(f"\n📥 Importing reviews...")
+    print(f"\n📥 Importing {len(reviews)} reviews...")
     total_imported = 0
-    total_skipped = 0
     errors = []
     
-    for idx, row in df.iterrows():
-        salon_name = row['name']
-        
-        # Skip if salon not in database
-        if salon_name not in salon_map:
-            continue
+    for review in metrics.per_row('transform', reviews.itertuples(index=False)):
+        salon_name = review.salon_name
         
-        salon_id = salon_map[salon_name]
+        # Generate review data
+        review_data = {
+            'salon_id': salon_map[salon_name],
+            'rating': review.rating,
+            'content': review.content,
+            'reviewer_name': random.choice(reviewer_names),
+            'is_verified': random.random() > 0.3,  # 70% verified
+            'is_published': True,
+            'is_moderated': True,
+            'helpful_count': random.randint(0, 15),
+            'created_at': (datetime.now() - timedelta(days=random.randint(1, 365))).isoformat()
+        }
         
-        # Process each review column
-        for i, review_col in enumerate(review_cols, 1):
-            review_text = row[review_col]
-            
-            if pd.isna(review_text):
-                continue
-            
-            # Parse rating and content
-            rating, content = parse_review_text(review_text)
-            
-            if not content or len(content) < 10:
-                total_skipped += 1
-                continue
-            
-            # Generate review data
-            review_data = {
-                'salon_id': salon_id,
-                'rating': min(5.0, max(1.0, rating)),  # Ensure 1-5 range
-                'content': content[:1000],  # Limit length
-                'reviewer_name': random.choice(reviewer_names),
-                'is_verified': random.random() > 0.3,  # 70% verified
-                'is_published': True,
-                'is_moderated': True,
-                'helpful_count': random.randint(0, 15),
-                'created_at': (datetime.now() - timedelta(days=random.randint(1, 365))).isoformat()
-            }
-            
-            try:
+        try:
+            with metrics.stage('write', rows=1):
                 supabase.table('reviews').insert(review_data).execute()
-                total_imported += 1
+            total_imported += 1
+            
+            if total_imported % 100 == 0:
+                print(f"  ✅ Imported {total_imported} reviews...")
                 
-                if total_imported % 100 == 0:
-                    print(f"  ✅ Imported {total_imported} reviews...")
-                    
-            except Exception as e:
-                errors.append(f"Salon {salon_name}, Review {i}: {str(e)[:50]}")
-                total_skipped += 1
-                if len(errors) <= 5:
-                    print(f"  ⚠️  Error: {errors[-1]}")
+        except Exception as e:
+            errors.append(f"Salon {salon_name}, {review.review_col}: {str(e)[:50]}")
+            total_skipped += 1
+            if len(errors) <= 5:
+                print(f"  ⚠️  Error: {errors[-1]}")
     
     # Summary
     print("\n" + "=" * 80)
@@ -177,6 +144,24 @@ def main():
     except Exception as e:
         print(f"⚠️  Could not verify: {e}")
     
+    # Materialize per-salon review statistics and snapshots
+    print("\n📊 Refreshing salon review snapshots...")
+    try:
+        with metrics.stage('refresh_review_snapshots'):
+            updated = refresh_review_snapshots(supabase)
+        print(f"✅ Updated snapshots for {updated} salons")
+    except Exception as e:
+        print(f"⚠️  Could not refresh snapshots: {e}")
+    
+    # Re-score the default listing order from the fresh stats
+    print("\n🏆 Re-scoring salons...")
+    try:
+        with metrics.stage('refresh_rank_scores'):
+            ranked = refresh_rank_scores(supabase)
+        print(f"✅ Updated rank scores for {ranked} salons")
+    except Exception as e:
+        print(f"⚠️  Could not refresh rank scores: {e}")
+    
     print("\n🎉 Review import complete!")
 
 if __name__ == "__main__":
@@ -9,63 +9,8 @@ This script will:
 
 import pandas as pd
 import sys
-import os
-import json
-from dotenv import load_dotenv
-import re
-import unicodedata
 
-# Load environment variables
-load_dotenv('.env.local')
-
-# Get Supabase credentials
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-    print("❌ Error: Supabase credentials not found in .env.local")
-    print("\nPlease create .env.local with:")
-    print("NEXT_PUBLIC_SUPABASE_URL=https://your-project.supabase.co")
-    print("SUPABASE_SERVICE_ROLE_KEY=your_service_role_key")
-    sys.exit(1)
-
-# Install supabase-py if not available
-try:
-    from supabase import create_client, Client
-except ImportError:
-    print("Installing supabase-py...")
-    os.system("pip install supabase -q")
-    from supabase import create_client, Client
-
-def slugify(text):
-    """Convert text to URL-friendly slug"""
-    if pd.isna(text):
-        return ""
-    text = str(text).lower()
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8')
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text).strip('-')
-    return text
-
-def clean_phone(phone):
-    """Clean and format phone number"""
-    if pd.isna(phone):
-        return None
-    phone = str(phone).strip()
-    if not phone or phone == 'nan':
-        return None
-    return phone
-
-def clean_website(website):
-    """Clean and format website URL"""
-    if pd.isna(website):
-        return None
-    website = str(website).strip()
-    if not website or website == 'nan':
-        return None
-    if not website.startswith('http'):
-        website = 'https://' + website
-    return website
+from nailnav_etl import clean_phone, clean_website, get_client, slugify
 
 def parse_price_range(price_str):
     """Convert price range string to database format"""
@@ -148,7 +93,7 @@ def main():
     # Initialize Supabase client
     print("\n📡 Connecting to Supabase...")
     try:
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+        supabase = get_client()
         print("✅ Connected to Supabase")
     except Exception as e:
         print(f"❌ Failed to connect to Supabase: {e}")
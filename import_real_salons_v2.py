@@ -6,90 +6,8 @@ This script matches the actual database schema found in the project
 
 import pandas as pd
 import sys
-import os
-import json
-from dotenv import load_dotenv
-import re
-import unicodedata
 
-# Load environment variables
-load_dotenv('.env.local')
-
-# Get Supabase credentials
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-    print("❌ Error: Supabase credentials not found in .env.local")
-    sys.exit(1)
-
-from supabase import create_client, Client
-
-def slugify(text):
-    """Convert text to URL-friendly slug"""
-    if pd.isna(text):
-        return ""
-    text = str(text).lower()
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8')
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text).strip('-')
-    return text
-
-def clean_phone(phone):
-    """Clean and format phone number"""
-    if pd.isna(phone):
-        return None
-    phone = str(phone).strip()
-    if not phone or phone == 'nan':
-        return None
-    return phone
-
-def clean_website(website):
-    """Clean and format website URL"""
-    if pd.isna(website):
-        return None
-    website = str(website).strip()
-    if not website or website == 'nan':
-        return None
-    if not website.startswith('http'):
-        website = 'https://' + website
-    return website
-
-def parse_hours(hours_str, closed_on_str=None):
-    """Parse operating hours into JSON format"""
-    if pd.isna(hours_str):
-        return {
-            "monday": "9:00 AM - 6:00 PM",
-            "tuesday": "9:00 AM - 6:00 PM",
-            "wednesday": "9:00 AM - 6:00 PM",
-            "thursday": "9:00 AM - 6:00 PM",
-            "friday": "9:00 AM - 6:00 PM",
-            "saturday": "9:00 AM - 5:00 PM",
-            "sunday": "10:00 AM - 4:00 PM"
-        }
-    
-    # Simple default for now
-    return {
-        "monday": str(hours_str),
-        "tuesday": str(hours_str),
-        "wednesday": str(hours_str),
-        "thursday": str(hours_str),
-        "friday": str(hours_str),
-        "saturday": str(hours_str),
-        "sunday": "Closed" if closed_on_str and 'sunday' in str(closed_on_str).lower() else str(hours_str)
-    }
-
-def bool_value(value):
-    """Convert Excel value to boolean"""
-    if pd.isna(value):
-        return False
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return value > 0
-    if isinstance(value, str):
-        return value.strip().lower() in ['yes', 'true', '1', 'x']
-    return False
+from nailnav_etl import bool_value, clean_phone, clean_website, get_client, parse_hours, slugify
 
 def main():
     print("=" * 80)
@@ -99,7 +17,7 @@ def main():
     # Initialize Supabase client
     print("\n📡 Connecting to Supabase...")
     try:
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+        supabase = get_client()
         print("✅ Connected to Supabase")
     except Exception as e:
         print(f"❌ Failed to connect to Supabase: {e}")
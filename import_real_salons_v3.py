@@ -6,90 +6,11 @@ This version properly handles city_id foreign key constraint
 
 import pandas as pd
 import sys
-import os
-import json
-from dotenv import load_dotenv
-import re
-import unicodedata
 
-# Load environment variables
-load_dotenv('.env.local')
-
-# Get Supabase credentials
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
-    print("❌ Error: Supabase credentials not found in .env.local")
-    sys.exit(1)
-
-from supabase import create_client, Client
-
-def slugify(text):
-    """Convert text to URL-friendly slug"""
-    if pd.isna(text):
-        return ""
-    text = str(text).lower()
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8')
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text).strip('-')
-    return text
-
-def clean_phone(phone):
-    """Clean and format phone number"""
-    if pd.isna(phone):
-        return None
-    phone = str(phone).strip()
-    if not phone or phone == 'nan':
-        return None
-    return phone
-
-def clean_website(website):
-    """Clean and format website URL"""
-    if pd.isna(website):
-        return None
-    website = str(website).strip()
-    if not website or website == 'nan':
-        return None
-    if not website.startswith('http'):
-        website = 'https://' + website
-    return website
-
-def parse_hours(hours_str, closed_on_str=None):
-    """Parse operating hours into JSON format"""
-    if pd.isna(hours_str):
-        return {
-            "monday": "9:00 AM - 6:00 PM",
-            "tuesday": "9:00 AM - 6:00 PM",
-            "wednesday": "9:00 AM - 6:00 PM",
-            "thursday": "9:00 AM - 6:00 PM",
-            "friday": "9:00 AM - 6:00 PM",
-            "saturday": "9:00 AM - 5:00 PM",
-            "sunday": "10:00 AM - 4:00 PM"
-        }
-    
-    # Simple default for now
-    return {
-        "monday": str(hours_str),
-        "tuesday": str(hours_str),
-        "wednesday": str(hours_str),
-        "thursday": str(hours_str),
-        "friday": str(hours_str),
-        "saturday": str(hours_str),
-        "sunday": "Closed" if closed_on_str and 'sunday' in str(closed_on_str).lower() else str(hours_str)
-    }
-
-def bool_value(value):
-    """Convert Excel value to boolean"""
-    if pd.isna(value):
-        return False
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return value > 0
-    if isinstance(value, str):
-        return value.strip().lower() in ['yes', 'true', '1', 'x']
-    return bool(value)
+from build_rank_scores import refresh_rank_scores
+from nailnav_etl import bool_value, clean_phone, clean_website, get_client, metrics, parse_hours, slugify
+from opening_hours import compile_open_minutes
+from refresh_city_counts import refresh_city_counts
 
 def get_city_id_mapping(supabase):
     """Create a mapping of city names to IDs"""
@@ -163,7 +84,7 @@ def main():
     # Initialize Supabase client
     print("\n📡 Connecting to Supabase...")
     try:
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+        supabase = get_client()
         print("✅ Connected to Supabase")
     except Exception as e:
         print(f"❌ Failed to connect to Supabase: {e}")
@@ -182,17 +103,20 @@ def main():
     # Read Excel file
     print("\n📂 Reading Excel file: Nail_Salons_Aus_250.xlsx")
     try:
-        df = pd.read_excel('Nail_Salons_Aus_250.xlsx', sheet_name=0)
+        with metrics.stage('read') as read:
+            df = pd.read_excel('Nail_Salons_Aus_250.xlsx', sheet_name=0)
+            read.rows = len(df)
         print(f"✅ Loaded {len(df)} rows from Excel")
     except Exception as e:
         print(f"❌ Failed to read Excel file: {e}")
         sys.exit(1)
     
-    # Create missing cities first
-    create_missing_cities(supabase, df)
-    
-    # Get city mapping
-    city_map = get_city_id_mapping(supabase)
+    with metrics.stage('resolve'):
+        # Create missing cities first
+        create_missing_cities(supabase, df)
+        
+        # Get city mapping
+        city_map = get_city_id_mapping(supabase)
     if not city_map:
         print("❌ Could not load city mapping. Aborting.")
         sys.exit(1)
@@ -208,7 +132,8 @@ def main():
     # Delete existing salon data
     print("\n🗑️  Deleting existing fake salon data...")
     try:
-        result = supabase.table('salons').delete().neq('id', 0).execute()
+        with metrics.stage('write'):
+            result = supabase.table('salons').delete().neq('id', 0).execute()
         print(f"✅ Deleted existing salon data")
     except Exception as e:
         print(f"⚠️  Warning: Could not delete existing data: {e}")
@@ -220,7 +145,14 @@ def main():
     error_count = 0
     errors = []
     
-    for idx, row in df.iterrows():
+    # Minute-of-week open ranges for the "open now" filter, parsed in one pass
+    with metrics.stage('transform'):
+        open_minutes = compile_open_minutes(
+            df.get('workday_timing', pd.Series(index=df.index, dtype=object)),
+            df.get('closed_on', pd.Series(index=df.index, dtype=object)),
+        )
+    
+    for idx, row in metrics.per_row('transform', df.iterrows()):
         try:
             # Extract basic information
             name = str(row['name']) if not pd.isna(row['name']) else f"Salon {idx+1}"
@@ -264,6 +196,7 @@ def main():
                     row['workday_timing'] if 'workday_timing' in row else None,
                     row['closed_on'] if 'closed_on' in row else None
                 ),
+                'open_minutes': open_minutes[idx],
                 
                 # Amenities
                 'kid_friendly': bool_value(row.get('Kid friendly')),
@@ -308,7 +241,8 @@ def main():
             }
             
             # Insert salon
-            result = supabase.table('salons').insert(salon_data).execute()
+            with metrics.stage('write', rows=1):
+                result = supabase.table('salons').insert(salon_data).execute()
             
             if result.data:
                 success_count += 1
@@ -340,6 +274,23 @@ def main():
     print("=" * 80)
     
     if success_count > 0:
+        print("\n🏙️  Refreshing city salon counts...")
+        try:
+            with metrics.stage('refresh_city_counts'):
+                cities = refresh_city_counts(supabase)
+            print(f"✅ Counted salons in {cities} cities")
+        except Exception as e:
+            print(f"⚠️  Could not refresh city counts: {e}")
+        
+        # New salons start at rank_score 0; score them from their listed rating
+        print("\n🏆 Scoring salons...")
+        try:
+            with metrics.stage('refresh_rank_scores'):
+                ranked = refresh_rank_scores(supabase)
+            print(f"✅ Updated rank scores for {ranked} salons")
+        except Exception as e:
+            print(f"⚠️  Could not refresh rank scores: {e}")
+        
         print("\n🎉 Import complete!")
         print("\n📋 Next steps:")
         print("   1. Visit your Supabase dashboard to verify the data")
@@ -3,32 +3,14 @@
 Import real reviews from Excel file to Supabase (BATCH VERSION)
 """
 import pandas as pd
-import os
-import re
-from dotenv import load_dotenv
-from supabase import create_client, Client
 from datetime import datetime, timedelta
 import random
 
-load_dotenv('.env.local')
-
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-def parse_review_text(review_text):
-    """Parse review text with rating"""
-    if pd.isna(review_text):
-        return None, None
-    
-    text = str(review_text).strip()
-    rating_match = re.match(r'rating\s+(\d+(?:\.\d+)?)\s*:\s*(.*)', text, re.IGNORECASE)
-    
-    if rating_match:
-        rating = float(rating_match.group(1))
-        content = rating_match.group(2).strip()
-        return rating, content
-    
-    return 5.0, text
+from nailnav_etl import get_client, metrics
+from parse_reviews import extract_reviews, review_columns
+from build_rank_scores import refresh_rank_scores
+from build_review_snapshots import refresh_review_snapshots
+from paged_reads import iter_rows
 
 def generate_reviewer_name():
     """Generate a reviewer name"""
@@ -41,52 +23,46 @@ def main():
     print("🌟 IMPORTING REAL REVIEWS (BATCH MODE)")
     print("=" * 80)
     
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    supabase = get_client()
     
     print("\n📂 Reading Excel file...")
-    df = pd.read_excel('Nail_Salons_Aus_250.xlsx', sheet_name=0)
+    with metrics.stage('read') as read:
+        df = pd.read_excel('Nail_Salons_Aus_250.xlsx', sheet_name=0)
+        read.rows = len(df)
     print(f"✅ Loaded {len(df)} salons")
     
     print("\n🔍 Mapping salons...")
-    salons_result = supabase.table('salons').select('id, name').execute()
-    salon_map = {salon['name']: salon['id'] for salon in salons_result.data}
+    with metrics.stage('resolve') as resolve:
+        salon_map = {
+            salon['name']: salon['id']
+            for salon in iter_rows(lambda: supabase.table('salons').select('id, name').order('id'))
+        }
+        resolve.rows = len(salon_map)
     print(f"✅ Found {len(salon_map)} salons")
     
     # Prepare batch reviews
     print("\n📋 Preparing reviews...")
-    review_cols = [col for col in df.columns if col.startswith('Review  ')]
-    all_reviews = []
-    
-    for idx, row in df.iterrows():
-        salon_name = row['name']
-        if salon_name not in salon_map:
-            continue
-        
-        salon_id = salon_map[salon_name]
+    with metrics.stage('transform') as transform:
+        review_cols = review_columns(df)
         
         # Limit to first 5 reviews per salon for speed
-        for i, review_col in enumerate(review_cols[:5], 1):
-            review_text = row[review_col]
-            
-            if pd.isna(review_text):
-                continue
-            
-            rating, content = parse_review_text(review_text)
-            
-            if not content or len(content) < 10:
-                continue
-            
-            all_reviews.append({
-                'salon_id': salon_id,
-                'rating': min(5.0, max(1.0, rating)),
-                'content': content[:1000],
+        reviews, _ = extract_reviews(df[df['name'].isin(salon_map)], review_cols[:5])
+        
+        all_reviews = [
+            {
+                'salon_id': salon_map[review.salon_name],
+                'rating': review.rating,
+                'content': review.content,
                 'reviewer_name': generate_reviewer_name(),
                 'is_verified': random.random() > 0.3,
                 'is_published': True,
                 'is_moderated': True,
                 'helpful_count': random.randint(0, 15),
                 'created_at': (datetime.now() - timedelta(days=random.randint(1, 365))).isoformat()
-            })
+            }
+            for review in reviews.itertuples(index=False)
+        ]
+        transform.rows = len(all_reviews)
     
     print(f"✅ Prepared {len(all_reviews)} reviews")
     
@@ -98,7 +74,8 @@ def main():
     for i in range(0, len(all_reviews), batch_size):
         batch = all_reviews[i:i+batch_size]
         try:
-            supabase.table('reviews').insert(batch).execute()
+            with metrics.stage('write', rows=len(batch)):
+                supabase.table('reviews').insert(batch).execute()
             total_imported += len(batch)
             print(f"  ✅ Imported {total_imported}/{len(all_reviews)} reviews...")
         except Exception as e:
@@ -115,6 +92,25 @@ def main():
     result = supabase.table('reviews').select('*', count='exact').execute()
     count = result.count if hasattr(result, 'count') else len(result.data)
     print(f"\n✅ Total reviews in database: {count}")
+    
+    # Materialize per-salon review statistics and snapshots
+    print("\n📊 Refreshing salon review snapshots...")
+    try:
+        with metrics.stage('refresh_review_snapshots'):
+            updated = refresh_review_snapshots(supabase)
+        print(f"✅ Updated snapshots for {updated} salons")
+    except Exception as e:
+        print(f"⚠️  Could not refresh snapshots: {e}")
+    
+    # Re-score the default listing order from the fresh stats
+    print("\n🏆 Re-scoring salons...")
+    try:
+        with metrics.stage('refresh_rank_scores'):
+            ranked = refresh_rank_scores(supabase)
+        print(f"✅ Updated rank scores for {ranked} salons")
+    except Exception as e:
+        print(f"⚠️  Could not refresh rank scores: {e}")
+    
     print("\n🎉 Done!")
 
 if __name__ == "__main__":
@@ -4,19 +4,15 @@ Import updated salon data from Excel file with all new filter columns and FAQ fi
 Handles column additions and data population in one comprehensive script.
 """
 
-import os
 import openpyxl
-from supabase import create_client, Client
 from typing import Dict, Any, Optional
 
-# Initialize Supabase client
-supabase_url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-supabase_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-
-if not supabase_url or not supabase_key:
-    raise ValueError("Missing Supabase environment variables")
+from nailnav_etl import get_client
+from schema_cache import invalidate, pending_ddl, unknown_columns
+from sql_statements import split_statements
 
-supabase: Client = create_client(supabase_url, supabase_key)
+# Initialize Supabase client
+supabase = get_client()
 
 # Complete column mapping from Excel to database
 COLUMN_MAPPING = {
@@ -96,17 +92,28 @@ def add_missing_columns():
     
     # Read SQL migration file
     with open('add_new_columns.sql', 'r') as f:
-        sql_commands = f.read()
-    
-    # Execute each ALTER TABLE statement
-    for command in sql_commands.split(';'):
-        command = command.strip()
-        if command and not command.startswith('--'):
-            try:
-                result = supabase.rpc('exec_sql', {'query': command}).execute()
-                print(f"  ✓ Executed: {command[:60]}...")
-            except Exception as e:
-                print(f"  ⚠ Warning (may already exist): {str(e)[:80]}")
+        statements = split_statements(f.read())
+    
+    # Only run ALTER TABLE statements for columns the cached schema lacks
+    try:
+        commands = pending_ddl(supabase, statements)
+    except Exception as e:
+        print(f"  ⚠ Schema introspection unavailable, running all statements: {str(e)[:80]}")
+        commands = statements
+    print(f"  ✓ {len(statements) - len(commands)} of {len(statements)} columns already exist")
+    
+    # All pending statements in one request and one transaction
+    # (run_sql_statements, migrations/015_migration_runner.sql)
+    if commands:
+        try:
+            supabase.rpc('run_sql_statements', {'statements': commands}).execute()
+        except Exception as e:
+            print(f"  ⚠ Warning (migration runner unavailable; has migrations/015 been applied?): {str(e)[:80]}")
+            print("  ⚠ Skipping column additions; unknown columns are reported before the import\n")
+            return
+        invalidate('salons')
+        for command in commands:
+            print(f"  ✓ Executed: {command[:60]}...")
     
     print("  ✓ Column additions complete\n")
 
@@ -128,7 +135,7 @@ def load_excel_data(filename: str):
     
     return sheet, headers
 
-def process_salon_row(sheet, row_num: int, headers: Dict[str, int]) -> Optional[Dict[str, Any]]:
+def process_salon_row(sheet, row_num: int, headers: Dict[str, int], column_mapping: Dict[str, str]) -> Optional[Dict[str, Any]]:
     """Process a single salon row and return update data."""
     row = sheet[row_num]
     
@@ -145,7 +152,7 @@ def process_salon_row(sheet, row_num: int, headers: Dict[str, int]) -> Optional[
     update_data = {}
     
     # Process all mapped columns
-    for excel_col_name, db_col_name in COLUMN_MAPPING.items():
+    for excel_col_name, db_col_name in column_mapping.items():
         if excel_col_name not in headers:
             continue
         
@@ -170,13 +177,24 @@ def import_all_data(sheet, headers: Dict[str, int]):
     print("Step 3: Importing salon data...")
     
     total_salons = sheet.max_row - 1  # Minus header row
+    
+    # Drop mapped columns the salons table doesn't have, instead of
+    # failing every row's update on them
+    try:
+        missing = unknown_columns(supabase, COLUMN_MAPPING.values())
+    except Exception as e:
+        print(f"  ⚠ Schema introspection unavailable, assuming all columns exist: {str(e)[:80]}")
+        missing = []
+    if missing:
+        print(f"  ⚠ Skipping columns missing from salons: {', '.join(missing)}")
+    column_mapping = {excel: db for excel, db in COLUMN_MAPPING.items() if db not in missing}
     updated_count = 0
     skipped_count = 0
     error_count = 0
     
     for row_num in range(2, sheet.max_row + 1):  # Start from row 2 (skip header)
         try:
-            salon_info = process_salon_row(sheet, row_num, headers)
+            salon_info = process_salon_row(sheet, row_num, headers, column_mapping)
             
             if not salon_info:
                 skipped_count += 1
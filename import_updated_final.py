@@ -3,18 +3,20 @@
 Final import script with proper price range handling
 """
 
-import os
+import sys
+
 import openpyxl
-from supabase import create_client, Client
 
-# Initialize Supabase client
-supabase_url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-supabase_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+from build_facets import refresh_facets
+from refresh_city_counts import refresh_city_counts
+from nailnav_etl import get_client, metrics
+from schema_cache import unknown_columns
 
-if not supabase_url or not supabase_key:
-    raise ValueError("Missing Supabase environment variables")
+# Initialize Supabase client
+supabase = get_client()
 
-supabase: Client = create_client(supabase_url, supabase_key)
+# Default workbook; pass another path (e.g. from generate_workbook.py) as the first argument
+WORKBOOK = 'Nail_Salons_Aus_250_updated.xlsx'
 
 # Complete column mapping (Excel name -> DB name)
 COLUMN_MAPPING = {
@@ -113,7 +115,21 @@ def import_all_data(sheet, headers):
     skipped_count = 0
     error_count = 0
     
-    for row_num in range(2, min(sheet.max_row + 1, 252)):  # Only first 250 data rows
+    last_row = sheet.max_row
+    
+    # Drop mapped columns the salons table doesn't have, instead of
+    # failing every row's update on them
+    try:
+        with metrics.stage('resolve'):
+            missing = unknown_columns(supabase, [*COLUMN_MAPPING.values(), 'price_range'])
+    except Exception as e:
+        print(f"  ⚠ Schema introspection unavailable, assuming all columns exist: {str(e)[:80]}")
+        missing = []
+    if missing:
+        print(f"  ⚠ Skipping columns missing from salons: {', '.join(missing)}")
+    column_mapping = {excel: db for excel, db in COLUMN_MAPPING.items() if db not in missing}
+    
+    for row_num in metrics.per_row('transform', range(2, last_row + 1)):
         try:
             # Get salon name
             salon_name_col = headers.get('name', 2)
@@ -128,7 +144,7 @@ def import_all_data(sheet, headers):
             # Build update data
             update_data = {}
             
-            for excel_col_name, db_col_name in COLUMN_MAPPING.items():
+            for excel_col_name, db_col_name in column_mapping.items():
                 if excel_col_name not in headers:
                     continue
                 
@@ -141,8 +157,11 @@ def import_all_data(sheet, headers):
                 else:
                     update_data[db_col_name] = False
             
+            # filter_mask is recomputed from these flags by
+            # trg_salons_filter_mask (migrations/004)
+            
             # Handle price range separately
-            if 'Price ($-$$$)' in headers:
+            if 'Price ($-$$$)' in headers and 'price_range' not in missing:
                 price_col = headers['Price ($-$$$)']
                 price_value = sheet.cell(row=row_num, column=price_col).value
                 normalized_price = normalize_price_range(price_value)
@@ -150,7 +169,8 @@ def import_all_data(sheet, headers):
                     update_data['price_range'] = normalized_price
             
             # Update salon
-            result = supabase.table('salons').update(update_data).eq('name', salon_name).execute()
+            with metrics.stage('write', rows=1):
+                result = supabase.table('salons').update(update_data).eq('name', salon_name).execute()
             
             if result.data:
                 updated_count += 1
@@ -179,9 +199,20 @@ def main():
     print()
     
     try:
-        sheet, headers = load_excel_data('Nail_Salons_Aus_250_updated.xlsx')
+        with metrics.stage('read'):
+            sheet, headers = load_excel_data(sys.argv[1] if len(sys.argv) > 1 else WORKBOOK)
         import_all_data(sheet, headers)
         
+        print("\nRefreshing search facets...")
+        with metrics.stage('refresh_facets'):
+            written = refresh_facets(supabase)
+        print(f"  ✓ Wrote {written} changed facet rows")
+        
+        print("\nRefreshing city salon counts...")
+        with metrics.stage('refresh_city_counts'):
+            cities = refresh_city_counts(supabase)
+        print(f"  ✓ Counted salons in {cities} cities")
+        
         print("\n" + "="*80)
         print("✓ IMPORT COMPLETED SUCCESSFULLY")
         print("="*80)
@@ -3,18 +3,17 @@
 Import updated salon data - simplified version that updates only existing columns first
 """
 
-import os
+import sys
+
 import openpyxl
-from supabase import create_client, Client
 
-# Initialize Supabase client
-supabase_url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-supabase_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+from nailnav_etl import get_client
 
-if not supabase_url or not supabase_key:
-    raise ValueError("Missing Supabase environment variables")
+# Initialize Supabase client
+supabase = get_client()
 
-supabase: Client = create_client(supabase_url, supabase_key)
+# Default workbook; pass another path (e.g. from generate_workbook.py) as the first argument
+WORKBOOK = 'Nail_Salons_Aus_250_updated.xlsx'
 
 # Complete column mapping (Excel name -> DB name)
 COLUMN_MAPPING = {
@@ -97,7 +96,7 @@ def import_all_data(sheet, headers):
     skipped_count = 0
     error_count = 0
     
-    for row_num in range(2, min(sheet.max_row + 1, 252)):  # Only first 250 data rows
+    for row_num in range(2, sheet.max_row + 1):
         try:
             # Get salon name
             salon_name_col = headers.get('name', 2)
@@ -157,7 +156,7 @@ def main():
     print()
     
     try:
-        sheet, headers = load_excel_data('Nail_Salons_Aus_250_updated.xlsx')
+        sheet, headers = load_excel_data(sys.argv[1] if len(sys.argv) > 1 else WORKBOOK)
         import_all_data(sheet, headers)
         
         print("\\n" + "="*80)
@@ -1,44 +1,76 @@
 #!/usr/bin/env python3
 """
-Inspect the Excel file structure to understand the data format
+Profile an Excel (or CSV) file before importing it
+
+Streams the sheet through profile_workbook.py and prints header problems,
+Yes/No flag ratios, row anomalies and per-column fill rates, then writes
+the full JSON report next to the file (or to --report).
+
+Usage:
+    python inspect_excel.py [file] [--sample 50000] [--report report.json]
 """
-import pandas as pd
+import argparse
+import json
+import os
 import sys
 
-def inspect_excel(file_path):
-    """Inspect Excel file structure"""
+
+def inspect_excel(file_path, sample=None, report_path=None):
+    """Profile a workbook, print a summary and write the JSON report"""
+    from profile_workbook import profile_workbook
+
     print(f"Reading Excel file: {file_path}\n")
     
     try:
-        # Read the Excel file
-        df = pd.read_excel(file_path, sheet_name=0)
-        
-        print(f"Total rows: {len(df)}")
-        print(f"Total columns: {len(df.columns)}")
-        print(f"\nColumn names:")
-        for i, col in enumerate(df.columns, 1):
-            print(f"  {i}. {col}")
-        
-        print(f"\nFirst 3 rows sample:")
-        print("=" * 100)
-        pd.set_option('display.max_columns', None)
-        pd.set_option('display.width', None)
-        pd.set_option('display.max_colwidth', 50)
-        print(df.head(3).to_string())
-        
-        print(f"\n\nData types:")
-        print("=" * 100)
-        print(df.dtypes)
-        
-        print(f"\n\nNull values count:")
-        print("=" * 100)
-        print(df.isnull().sum())
-        
-        return df
-        
+        report = profile_workbook(file_path, sample=sample)
     except Exception as e:
         print(f"Error reading Excel file: {e}")
         sys.exit(1)
+    
+    print(f"Total rows: {report['rows']} ({report['blank_rows']} blank rows skipped)")
+    if report['sampled']:
+        print(f"Profiled a random sample of {report['profiled_rows']} rows")
+    print(f"Total columns: {report['column_count']}")
+    
+    print(f"\nHeader issues:")
+    print("=" * 100)
+    for issue in report['header_issues']:
+        print(f"  {issue['column']!r}: {issue['issue']}")
+    
+    print(f"\nYes/No columns:")
+    print("=" * 100)
+    for column in report['flag_columns']:
+        profile = report['columns'][column]
+        print(f"  {column:<45} {profile['yes']:>7} yes  {profile['yes_ratio']:>7.1%} of filled  {profile['null_rate']:>7.1%} blank")
+    for column, values in report['non_flag_values'].items():
+        print(f"  {column:<45} unexpected values: {values}")
+    
+    print(f"\nRow anomalies:")
+    print("=" * 100)
+    for check, result in report['anomalies'].items():
+        if result['count']:
+            print(f"  {check:<25} {result['count']:>7} rows, e.g. {result['rows'][:5]}")
+    
+    print(f"\nColumns:")
+    print("=" * 100)
+    for column, profile in report['columns'].items():
+        if column in report['flag_columns']:
+            continue
+        top = profile['top_values'][0][0] if profile['top_values'] else ''
+        print(f"  {column[:45]:<45} {profile['null_rate']:>7.1%} blank  {profile['cardinality']:>7} distinct  top: {str(top)[:30]}")
+    
+    report_path = report_path or os.path.splitext(file_path)[0] + '.profile.json'
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"\n📄 Report written to {report_path}")
+    
+    return report
 
 if __name__ == "__main__":
-    df = inspect_excel("Nail_Salons_Aus_250.xlsx")
+    parser = argparse.ArgumentParser(description='Profile a salon workbook')
+    parser.add_argument('file', nargs='?', default='Nail_Salons_Aus_250.xlsx')
+    parser.add_argument('--sample', type=int, help='Profile a random sample of this many rows')
+    parser.add_argument('--report', help='JSON report path (default: <file>.profile.json)')
+    args = parser.parse_args()
+    
+    report = inspect_excel(args.file, sample=args.sample, report_path=args.report)
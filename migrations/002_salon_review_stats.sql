@@ -0,0 +1,83 @@
+-- =====================================================
+-- PHASE 2: MATERIALIZED REVIEW STATISTICS PER SALON
+-- =====================================================
+-- Stores exact review statistics on each salon row so listing and
+-- detail pages don't have to count reviews per request.
+--
+-- Refreshed by update_review_stats.py after every review import.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Add statistics columns to salons table
+-- =====================================================
+
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS review_count INTEGER DEFAULT 0;
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS average_rating DECIMAL(3,2);
+
+-- Number of published reviews with 1, 2, 3, 4 and 5 stars
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS rating_histogram INTEGER[] DEFAULT ARRAY[0,0,0,0,0];
+
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS latest_review_at TIMESTAMP WITH TIME ZONE;
+
+-- Step 2: Index used by the grouped aggregate
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_reviews_salon_published ON reviews(salon_id, is_published);
+
+-- Step 3: Refresh function
+-- =====================================================
+-- Computes count, mean, histogram and latest review date for every salon
+-- (or only `salon_ids`) in one grouped pass and writes them back in one
+-- UPDATE. Rows whose statistics are unchanged are not rewritten.
+
+CREATE OR REPLACE FUNCTION refresh_salon_review_stats(salon_ids INTEGER[] DEFAULT NULL)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE salons s
+    SET review_count = agg.review_count,
+        average_rating = agg.average_rating,
+        rating_histogram = agg.rating_histogram,
+        latest_review_at = agg.latest_review_at
+    FROM (
+        SELECT
+            s2.id AS salon_id,
+            COUNT(r.id)::INTEGER AS review_count,
+            ROUND(AVG(r.rating)::NUMERIC, 2) AS average_rating,
+            ARRAY[
+                COUNT(r.id) FILTER (WHERE ROUND(r.rating) <= 1),
+                COUNT(r.id) FILTER (WHERE ROUND(r.rating) = 2),
+                COUNT(r.id) FILTER (WHERE ROUND(r.rating) = 3),
+                COUNT(r.id) FILTER (WHERE ROUND(r.rating) = 4),
+                COUNT(r.id) FILTER (WHERE ROUND(r.rating) >= 5)
+            ]::INTEGER[] AS rating_histogram,
+            MAX(r.created_at) AS latest_review_at
+        FROM salons s2
+        LEFT JOIN reviews r ON r.salon_id = s2.id AND r.is_published = true
+        WHERE salon_ids IS NULL OR s2.id = ANY(salon_ids)
+        GROUP BY s2.id
+    ) agg
+    WHERE s.id = agg.salon_id
+        AND (s.review_count, s.average_rating, s.rating_histogram, s.latest_review_at)
+            IS DISTINCT FROM
+            (agg.review_count, agg.average_rating, agg.rating_histogram, agg.latest_review_at);
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Step 4: Initial backfill
+-- =====================================================
+
+SELECT refresh_salon_review_stats();
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Check stats: SELECT name, review_count, average_rating, rating_histogram FROM salons LIMIT 5;
+-- 2. Re-run after imports: python update_review_stats.py
+-- =====================================================
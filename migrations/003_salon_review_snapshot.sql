@@ -0,0 +1,143 @@
+-- =====================================================
+-- PHASE 3: DENORMALIZED REVIEW SNAPSHOT PER SALON
+-- =====================================================
+-- Stores the top published reviews and the review statistics from
+-- 002_salon_review_stats.sql as one JSON document on each salon row,
+-- so a salon detail page is a single row read.
+--
+-- Refreshed by build_review_snapshots.py at import time and by the
+-- triggers below whenever reviews are added, moderated or deleted.
+-- Requires: 002_salon_review_stats.sql
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Add snapshot column to salons table
+-- =====================================================
+
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS review_snapshot JSONB DEFAULT '{}'::jsonb;
+
+-- Step 2: Index matching the top-N ordering
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_reviews_salon_top
+    ON reviews(salon_id, helpful_count DESC, created_at DESC)
+    WHERE is_published = true;
+
+-- Step 3: Refresh function
+-- =====================================================
+-- Refreshes the statistics columns first, then rebuilds the snapshot
+-- for every salon (or only `salon_ids`) in one UPDATE. SECURITY DEFINER
+-- with a fixed search_path, so a moderator whose RLS policies don't
+-- allow updating salons still refreshes them; callable by the service
+-- role and the triggers below only.
+
+CREATE OR REPLACE FUNCTION refresh_salon_review_snapshots(
+    salon_ids INTEGER[] DEFAULT NULL,
+    top_n INTEGER DEFAULT 10
+)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    PERFORM refresh_salon_review_stats(salon_ids);
+
+    UPDATE salons s
+    SET review_snapshot = jsonb_build_object(
+        'review_count', s.review_count,
+        'average_rating', s.average_rating,
+        'rating_histogram', to_jsonb(s.rating_histogram),
+        'latest_review_at', s.latest_review_at,
+        'reviews', COALESCE(top.reviews, '[]'::jsonb)
+    )
+    FROM (
+        SELECT
+            s2.id AS salon_id,
+            (
+                SELECT jsonb_agg(to_jsonb(t))
+                FROM (
+                    SELECT r.id, r.rating, r.title, r.content, r.service_type,
+                           r.reviewer_name, r.is_verified, r.helpful_count, r.created_at
+                    FROM reviews r
+                    WHERE r.salon_id = s2.id AND r.is_published = true
+                    ORDER BY r.helpful_count DESC, r.created_at DESC
+                    LIMIT top_n
+                ) t
+            ) AS reviews
+        FROM salons s2
+        WHERE salon_ids IS NULL OR s2.id = ANY(salon_ids)
+    ) top
+    WHERE s.id = top.salon_id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+REVOKE EXECUTE ON FUNCTION refresh_salon_review_snapshots(INTEGER[], INTEGER) FROM PUBLIC, anon, authenticated;
+
+-- Step 4: Refresh on insert and moderation
+-- =====================================================
+-- Statement-level triggers so a bulk insert or moderation refreshes
+-- each affected salon once. Inserts only matter when published.
+
+CREATE OR REPLACE FUNCTION refresh_review_snapshots_on_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_salon_review_snapshots(
+            ARRAY(
+                SELECT DISTINCT salon_id FROM new_reviews
+                WHERE salon_id IS NOT NULL AND is_published = true
+            )
+        );
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM refresh_salon_review_snapshots(
+            ARRAY(SELECT DISTINCT salon_id FROM old_reviews WHERE salon_id IS NOT NULL)
+        );
+    ELSE
+        PERFORM refresh_salon_review_snapshots(
+            ARRAY(
+                SELECT salon_id FROM old_reviews WHERE salon_id IS NOT NULL
+                UNION
+                SELECT salon_id FROM new_reviews WHERE salon_id IS NOT NULL
+            )
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+DROP TRIGGER IF EXISTS reviews_refresh_snapshot_insert ON reviews;
+CREATE TRIGGER reviews_refresh_snapshot_insert
+    AFTER INSERT ON reviews
+    REFERENCING NEW TABLE AS new_reviews
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION refresh_review_snapshots_on_change();
+
+DROP TRIGGER IF EXISTS reviews_refresh_snapshot_update ON reviews;
+CREATE TRIGGER reviews_refresh_snapshot_update
+    AFTER UPDATE ON reviews
+    REFERENCING OLD TABLE AS old_reviews NEW TABLE AS new_reviews
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION refresh_review_snapshots_on_change();
+
+DROP TRIGGER IF EXISTS reviews_refresh_snapshot_delete ON reviews;
+CREATE TRIGGER reviews_refresh_snapshot_delete
+    AFTER DELETE ON reviews
+    REFERENCING OLD TABLE AS old_reviews
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION refresh_review_snapshots_on_change();
+
+-- Step 5: Initial backfill
+-- =====================================================
+
+SELECT refresh_salon_review_snapshots();
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Check snapshots: SELECT name, review_snapshot FROM salons LIMIT 5;
+-- 2. Re-run after imports: python build_review_snapshots.py
+-- =====================================================
@@ -0,0 +1,156 @@
+-- =====================================================
+-- PHASE 4: PACKED FILTER MASK FOR SALON SEARCH
+-- =====================================================
+-- Packs the Yes/No service, language, specialty, appointment and
+-- amenity columns into one BIGINT so a multi-filter search is a
+-- single bitwise test instead of one predicate per boolean column.
+--
+-- Bit numbers come from filter_bits.py (mirrored in
+-- src/lib/utils/filterBits.ts) and must never be renumbered.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Add filter_mask column to salons table
+-- =====================================================
+
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS filter_mask BIGINT NOT NULL DEFAULT 0;
+
+-- Step 2: Compute the mask from the boolean columns
+-- =====================================================
+-- Bit N is the (N + 1)th name in the array. Columns are read through
+-- to_jsonb, so a flag column that has been dropped (injectables,
+-- tanning, cosmetic_tattoo) simply leaves its bit unset.
+
+CREATE OR REPLACE FUNCTION salon_filter_mask(salon JSONB)
+RETURNS BIGINT AS $$
+    SELECT COALESCE(SUM(1::BIGINT << (flag.bit - 1)::INTEGER), 0)::BIGINT
+    FROM unnest(ARRAY[
+        'manicure',                 -- bit 0
+        'gel_manicure',             -- bit 1
+        'gel_extensions',           -- bit 2
+        'acrylic_nails',            -- bit 3
+        'pedicure',                 -- bit 4
+        'gel_pedicure',             -- bit 5
+        'sns_dip_powder',           -- bit 6
+        'builders_gel_biab',        -- bit 7
+        'nail_art',                 -- bit 8
+        'massage',                  -- bit 9
+        'facials',                  -- bit 10
+        'lash_extensions',          -- bit 11
+        'lash_lift_tint',           -- bit 12
+        'brows',                    -- bit 13
+        'waxing',                   -- bit 14
+        'injectables',              -- bit 15
+        'tanning',                  -- bit 16
+        'cosmetic_tattoo',          -- bit 17
+        'haircuts',                 -- bit 18
+        'spa_hand_foot_treatment',  -- bit 19
+        'english',                  -- bit 20
+        'spanish',                  -- bit 21
+        'vietnamese',               -- bit 22
+        'chinese',                  -- bit 23
+        'korean',                   -- bit 24
+        'qualified_technicians',    -- bit 25
+        'experienced_team',         -- bit 26
+        'quick_service',            -- bit 27
+        'award_winning_staff',      -- bit 28
+        'master_nail_artist',       -- bit 29
+        'bridal_nails',             -- bit 30
+        'appointment_required',     -- bit 31
+        'walk_ins_welcome',         -- bit 32
+        'group_bookings',           -- bit 33
+        'mobile_nails',             -- bit 34
+        'child_friendly',           -- bit 35
+        'adult_only',               -- bit 36
+        'pet_friendly',             -- bit 37
+        'lgbtqi_friendly',          -- bit 38
+        'wheelchair_accessible',    -- bit 39
+        'complimentary_drink',      -- bit 40
+        'heated_massage_chairs',    -- bit 41
+        'foot_spas',                -- bit 42
+        'free_wifi',                -- bit 43
+        'parking',                  -- bit 44
+        'autoclave_sterilisation',  -- bit 45
+        'led_curing',               -- bit 46
+        'clean_ethical_products',   -- bit 47
+        'vegan_polish'              -- bit 48
+    ]) WITH ORDINALITY AS flag(name, bit)
+    WHERE (salon ->> flag.name)::BOOLEAN
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Step 3: Keep the mask current on every write
+-- =====================================================
+-- Importers, populate_service_data.py and the vendor/admin UI all write
+-- the boolean columns directly, so the mask is recomputed by trigger
+-- instead of by any one of them.
+
+CREATE OR REPLACE FUNCTION set_salon_filter_mask()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.filter_mask := salon_filter_mask(to_jsonb(NEW));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_salons_filter_mask ON salons;
+CREATE TRIGGER trg_salons_filter_mask
+    BEFORE INSERT OR UPDATE ON salons
+    FOR EACH ROW EXECUTE FUNCTION set_salon_filter_mask();
+
+-- Step 4: Backfill existing rows
+-- =====================================================
+
+UPDATE salons s
+SET filter_mask = salon_filter_mask(to_jsonb(s))
+WHERE filter_mask IS DISTINCT FROM salon_filter_mask(to_jsonb(s));
+
+-- Step 5: Index
+-- =====================================================
+-- A btree can't answer "has all of these bits", so the index is a GIN
+-- over the mask's set bit numbers: "(filter_mask & m) = m" becomes
+-- "filter_mask_bits(filter_mask) @> filter_mask_bits(m)", which GIN
+-- serves directly.
+
+CREATE OR REPLACE FUNCTION filter_mask_bits(mask BIGINT)
+RETURNS INTEGER[] AS $$
+    SELECT COALESCE(array_agg(bit ORDER BY bit), ARRAY[]::INTEGER[])
+    FROM generate_series(0, 62) AS bit
+    WHERE (mask & (1::BIGINT << bit)) <> 0
+$$ LANGUAGE sql IMMUTABLE STRICT;
+
+DROP INDEX IF EXISTS idx_salons_filter_mask;
+CREATE INDEX idx_salons_filter_mask
+    ON salons USING GIN (filter_mask_bits(filter_mask));
+
+-- Step 6: Filter function
+-- =====================================================
+-- Returns salons that have every bit in `all_mask` and, for each entry
+-- of `any_masks`, at least one of its bits. The `all_mask` test uses
+-- idx_salons_filter_mask; the `any_masks` groups are checked on the
+-- rows it returns. PostgREST lets callers chain select/filter/order/range
+-- on the result like a table.
+
+CREATE OR REPLACE FUNCTION salons_matching_filters(
+    all_mask BIGINT DEFAULT 0,
+    any_masks BIGINT[] DEFAULT ARRAY[]::BIGINT[]
+)
+RETURNS SETOF salons AS $$
+    SELECT s.*
+    FROM salons s
+    WHERE filter_mask_bits(s.filter_mask) @> filter_mask_bits(all_mask)
+        AND NOT EXISTS (
+            SELECT 1 FROM unnest(any_masks) AS m(mask)
+            WHERE (s.filter_mask & m.mask) = 0
+        )
+$$ LANGUAGE sql STABLE;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Check masks: SELECT name, filter_mask FROM salons LIMIT 5;
+--    (masks are kept current by trg_salons_filter_mask from now on)
+-- 2. Test filter (manicure AND parking):
+--    SELECT name FROM salons_matching_filters(1 + 17592186044416);
+-- =====================================================
@@ -0,0 +1,41 @@
+-- =====================================================
+-- PHASE 5: PRECOMPUTED SEARCH FACET COUNTS
+-- =====================================================
+-- Salon counts per (state, city, filter flag, price tier), built by
+-- build_facets.py so facet sidebars render from one indexed read.
+--
+-- flag is a filter_mask column name from filter_bits.py, or 'all' for
+-- the total number of published salons in the group. updated_at is set
+-- by build_facets.py whenever a row's count is rewritten.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS salon_facets (
+    state VARCHAR(100) NOT NULL,
+    city VARCHAR(100) NOT NULL,
+    flag VARCHAR(50) NOT NULL,
+    price_tier VARCHAR(20) NOT NULL,
+    salon_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    PRIMARY KEY (state, city, flag, price_tier)
+);
+
+-- Sidebar lookups by city and by state
+CREATE INDEX IF NOT EXISTS idx_salon_facets_city ON salon_facets(city, flag);
+CREATE INDEX IF NOT EXISTS idx_salon_facets_state ON salon_facets(state, flag);
+
+ALTER TABLE salon_facets ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Facets are viewable by everyone" ON salon_facets;
+CREATE POLICY "Facets are viewable by everyone" ON salon_facets
+    FOR SELECT USING (true);
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Build facets: python build_facets.py
+-- 2. Query: SELECT SUM(salon_count) FROM salon_facets
+--           WHERE city = 'Darwin' AND flag = 'gel_pedicure';
+-- =====================================================
@@ -0,0 +1,139 @@
+-- =====================================================
+-- PHASE 6: TRIGRAM SEARCH COLUMNS
+-- =====================================================
+-- Normalized (lowercased, unaccented, punctuation-free) copies of the
+-- searchable text columns with pg_trgm GIN indexes, so the
+-- '%term%' lookups in the salons and cities APIs use an index
+-- instead of scanning the whole table.
+--
+-- Values are set by triggers on every insert and update, using the
+-- same normalization as slugify (search_text below); build_search_columns.py
+-- and src/lib/utils/searchText.ts normalize the same way.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Enable trigram matching
+-- =====================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Step 2: Add normalized search columns
+-- =====================================================
+
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS search_name TEXT;
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS search_address TEXT;
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS search_state TEXT;
+
+ALTER TABLE cities ADD COLUMN IF NOT EXISTS search_name TEXT;
+
+-- Step 3: Trigram GIN indexes
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_salons_search_name_trgm
+    ON salons USING GIN (search_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_salons_search_address_trgm
+    ON salons USING GIN (search_address gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_salons_search_state_trgm
+    ON salons USING GIN (search_state gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_cities_search_name_trgm
+    ON cities USING GIN (search_name gin_trgm_ops);
+
+-- Step 4: Normalization and triggers
+-- =====================================================
+-- search_text is the one normalization for these columns, step for step
+-- the same as normalizeSearchText (src/lib/utils/searchText.ts) and
+-- normalize_search_text (build_search_columns.py): lowercase, NFKD,
+-- drop every non-ASCII character, drop punctuation, collapse hyphens
+-- and whitespace to single spaces ("Ørsted Straße" -> "rsted strae").
+-- The triggers keep the search columns current for every writer
+-- (importers, renames in the admin UI, new cities).
+-- normalize() needs PostgreSQL 13+ and a UTF8 database.
+
+CREATE OR REPLACE FUNCTION search_text(value TEXT)
+RETURNS TEXT AS $$
+    SELECT btrim(regexp_replace(
+        regexp_replace(
+            regexp_replace(normalize(lower(value), NFKD), '[^\x01-\x7f]', '', 'g'),
+            '[^a-z0-9_\s-]', '', 'g'
+        ),
+        '[-\s]+', ' ', 'g'
+    ))
+$$ LANGUAGE sql STABLE STRICT;
+
+CREATE OR REPLACE FUNCTION set_salon_search_columns()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_name := search_text(NEW.name);
+    NEW.search_address := search_text(NEW.address);
+    NEW.search_state := search_text(NEW.state);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_salons_search_columns ON salons;
+CREATE TRIGGER trg_salons_search_columns
+    BEFORE INSERT OR UPDATE OF name, address, state ON salons
+    FOR EACH ROW EXECUTE FUNCTION set_salon_search_columns();
+
+CREATE OR REPLACE FUNCTION set_city_search_columns()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_name := search_text(NEW.name);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_cities_search_columns ON cities;
+CREATE TRIGGER trg_cities_search_columns
+    BEFORE INSERT OR UPDATE OF name ON cities
+    FOR EACH ROW EXECUTE FUNCTION set_city_search_columns();
+
+-- Step 5: Backfill function
+-- =====================================================
+-- Rewrites the search columns that differ from search_text, for the
+-- initial backfill and for build_search_columns.py after the
+-- normalization changes. Returns {"salons": n, "cities": n}.
+
+DROP FUNCTION IF EXISTS update_salon_search_columns(JSONB);
+DROP FUNCTION IF EXISTS update_city_search_columns(JSONB);
+
+CREATE OR REPLACE FUNCTION refresh_search_columns()
+RETURNS JSONB AS $$
+DECLARE
+    salon_count INTEGER;
+    city_count INTEGER;
+BEGIN
+    UPDATE salons
+    SET search_name = search_text(name),
+        search_address = search_text(address),
+        search_state = search_text(state)
+    WHERE search_name IS DISTINCT FROM search_text(name)
+        OR search_address IS DISTINCT FROM search_text(address)
+        OR search_state IS DISTINCT FROM search_text(state);
+    GET DIAGNOSTICS salon_count = ROW_COUNT;
+
+    UPDATE cities
+    SET search_name = search_text(name)
+    WHERE search_name IS DISTINCT FROM search_text(name);
+    GET DIAGNOSTICS city_count = ROW_COUNT;
+
+    RETURN jsonb_build_object('salons', salon_count, 'cities', city_count);
+END;
+$$ LANGUAGE plpgsql;
+
+REVOKE EXECUTE ON FUNCTION refresh_search_columns() FROM PUBLIC, anon, authenticated;
+
+-- Step 6: Backfill existing rows
+-- =====================================================
+
+SELECT refresh_search_columns();
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Check values: SELECT name, search_name FROM salons LIMIT 5;
+-- 2. Check plan: EXPLAIN SELECT id FROM salons WHERE search_address LIKE '%bondi%';
+-- =====================================================
@@ -0,0 +1,59 @@
+-- =====================================================
+-- PHASE 7: OPEN MINUTES
+-- =====================================================
+-- Opening hours compiled into minute-of-week ranges (minute 0 =
+-- Monday 00:00 salon local time) with a GiST index, so "open now"
+-- is a single containment test instead of parsing the
+-- opening_hours JSON of every salon:
+--
+--     WHERE open_minutes @> '{[570,571)}'::int4multirange
+--
+-- Values are written by import_real_salons_v3.py using
+-- opening_hours.compile_open_minutes, and backfilled for existing salons
+-- from their opening_hours JSON by `python opening_hours.py`;
+-- src/lib/utils/openMinutes.ts
+-- computes the current minute per state time zone.
+-- Requires PostgreSQL 14+ (multiranges).
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Add open_minutes column
+-- =====================================================
+-- NULL means the hours could not be parsed; '{}' means closed all week.
+
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS open_minutes INT4MULTIRANGE;
+
+-- Step 2: GiST index for containment lookups
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_salons_open_minutes
+    ON salons USING GIST (open_minutes);
+
+-- Step 3: Bulk backfill function
+-- =====================================================
+-- Apply a JSON array of {id, open_minutes} objects in one UPDATE.
+
+CREATE OR REPLACE FUNCTION update_salon_open_minutes(rows JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE salons s
+    SET open_minutes = r.open_minutes::INT4MULTIRANGE
+    FROM jsonb_to_recordset(rows) AS r(id INTEGER, open_minutes TEXT)
+    WHERE s.id = r.id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Backfill existing salons: python opening_hours.py
+-- 2. Check plan: EXPLAIN SELECT id FROM salons
+--    WHERE is_published AND open_minutes @> '{[570,571)}'::int4multirange;
+-- =====================================================
@@ -0,0 +1,55 @@
+-- =====================================================
+-- PHASE 8: SALON RANK SCORE
+-- =====================================================
+-- Precomputed default-sort score (Bayesian-weighted rating with a
+-- recency factor) so the salon listing is one index-ordered range
+-- scan instead of sorting on raw rating.
+--
+-- Scores are written by build_rank_scores.py, which the salon and
+-- review importers and update_review_stats.py run after each import.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Add rank_score column
+-- =====================================================
+
+ALTER TABLE salons ADD COLUMN IF NOT EXISTS rank_score DOUBLE PRECISION NOT NULL DEFAULT 0;
+
+-- Step 2: Listing index
+-- =====================================================
+-- ORDER BY is_featured DESC, rank_score DESC, id DESC in
+-- src/app/api/salons/route.ts is a backward scan of this index.
+
+CREATE INDEX IF NOT EXISTS idx_salons_listing_rank
+    ON salons (is_featured, rank_score, id)
+    WHERE is_published = true;
+
+-- Step 3: Bulk write function
+-- =====================================================
+-- Apply a JSON array of {id, rank_score} objects in one UPDATE.
+
+CREATE OR REPLACE FUNCTION update_salon_rank_scores(rows JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE salons s
+    SET rank_score = r.rank_score
+    FROM jsonb_to_recordset(rows) AS r(id INTEGER, rank_score DOUBLE PRECISION)
+    WHERE s.id = r.id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Refresh review stats: python update_review_stats.py
+-- 2. Score salons: python build_rank_scores.py
+-- 3. Check plan: EXPLAIN SELECT id FROM salons WHERE is_published
+--    ORDER BY is_featured DESC, rank_score DESC, id DESC LIMIT 20;
+-- =====================================================
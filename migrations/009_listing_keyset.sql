@@ -0,0 +1,55 @@
+-- =====================================================
+-- PHASE 9: LISTING KEYSET PAGINATION
+-- =====================================================
+-- The salons API pages with an opaque cursor holding the last row's
+-- (is_featured, rank_score, id) instead of OFFSET. Every sort key is
+-- descending, so the rows after the cursor are one row comparison
+--
+--     (is_featured, rank_score, id) < (f, s, i)
+--
+-- which Postgres turns into a seek into idx_salons_listing_rank (built by
+-- migrations/008 on the same three keys): the scan starts at the cursor
+-- instead of counting past every skipped row.
+-- PostgREST filters can't express row comparisons, so the cursor is
+-- applied by salon_listing_page below.
+-- Requires migrations/004_salon_filter_mask.sql and
+-- migrations/008_salon_rank_score.sql.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Make is_featured a total order
+-- =====================================================
+
+UPDATE salons SET is_featured = false WHERE is_featured IS NULL;
+ALTER TABLE salons ALTER COLUMN is_featured SET DEFAULT false;
+ALTER TABLE salons ALTER COLUMN is_featured SET NOT NULL;
+
+-- Step 2: Cursor page function
+-- =====================================================
+-- Filtered salons (as salons_matching_filters) sorting strictly after
+-- the cursor. A plain SQL function, so Postgres inlines it and the
+-- caller's filters, ORDER BY and LIMIT apply to the index scan.
+
+CREATE OR REPLACE FUNCTION salon_listing_page(
+    cursor_featured BOOLEAN,
+    cursor_rank_score DOUBLE PRECISION,
+    cursor_id INTEGER,
+    all_mask BIGINT DEFAULT 0,
+    any_masks BIGINT[] DEFAULT ARRAY[]::BIGINT[]
+)
+RETURNS SETOF salons AS $$
+    SELECT s.*
+    FROM salons_matching_filters(all_mask, any_masks) s
+    WHERE (s.is_featured, s.rank_score, s.id) < (cursor_featured, cursor_rank_score, cursor_id)
+$$ LANGUAGE sql STABLE;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Page through: /api/salons?limit=20, then ?cursor=<nextCursor>
+-- 2. Check plan: EXPLAIN SELECT id FROM salons WHERE is_published
+--    AND (is_featured, rank_score, id) < (false, 4.2, 100)
+--    ORDER BY is_featured DESC, rank_score DESC, id DESC LIMIT 20;
+-- =====================================================
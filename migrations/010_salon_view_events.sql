@@ -0,0 +1,99 @@
+-- =====================================================
+-- PHASE 10: BUFFERED SALON VIEW COUNTS
+-- =====================================================
+-- Page views are appended to salon_view_events instead of updating
+-- salons.view_count in place, so a popular salon's row isn't locked
+-- once per view. rollup_view_events.py periodically folds the buffer
+-- into per-salon, per-day counters (salon_view_daily) and applies the
+-- totals to salons.view_count in one bulk statement.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Append-only event buffer
+-- =====================================================
+-- salon_id has the type of salons(id). The foreign key only takes a
+-- KEY SHARE lock on the salon row, which doesn't block view_count
+-- updates.
+
+CREATE TABLE IF NOT EXISTS salon_view_events (
+    id BIGSERIAL PRIMARY KEY,
+    salon_id INTEGER NOT NULL REFERENCES salons(id) ON DELETE CASCADE,
+    viewed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+);
+
+-- Tables created by an earlier run of this migration had no foreign key
+DELETE FROM salon_view_events e
+WHERE NOT EXISTS (SELECT 1 FROM salons s WHERE s.id = e.salon_id);
+ALTER TABLE salon_view_events DROP CONSTRAINT IF EXISTS salon_view_events_salon_id_fkey;
+ALTER TABLE salon_view_events ADD CONSTRAINT salon_view_events_salon_id_fkey
+    FOREIGN KEY (salon_id) REFERENCES salons(id) ON DELETE CASCADE;
+
+ALTER TABLE salon_view_events ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Anyone can record a salon view" ON salon_view_events;
+CREATE POLICY "Anyone can record a salon view" ON salon_view_events
+    FOR INSERT WITH CHECK (true);
+
+-- Step 2: Daily counters
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS salon_view_daily (
+    salon_id INTEGER NOT NULL REFERENCES salons(id) ON DELETE CASCADE,
+    view_date DATE NOT NULL,
+    view_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (salon_id, view_date)
+);
+
+ALTER TABLE salon_view_daily ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "View counters are viewable by everyone" ON salon_view_daily;
+CREATE POLICY "View counters are viewable by everyone" ON salon_view_daily
+    FOR SELECT USING (true);
+
+-- Step 3: Rollup function
+-- =====================================================
+-- Moves every buffered event up to through_id (default: all) into the
+-- daily counters and salons.view_count in one transaction. Events are
+-- counted from the DELETE ... RETURNING set, so a view committed late
+-- below through_id is picked up by the next run rather than lost.
+-- Returns the number of events rolled up.
+
+CREATE OR REPLACE FUNCTION rollup_salon_view_events(through_id BIGINT DEFAULT NULL)
+RETURNS INTEGER AS $$
+DECLARE
+    event_count INTEGER;
+BEGIN
+    CREATE TEMP TABLE rolled_views ON COMMIT DROP AS
+    WITH moved AS (
+        DELETE FROM salon_view_events
+        WHERE through_id IS NULL OR id <= through_id
+        RETURNING salon_id, viewed_at
+    )
+    SELECT salon_id, (viewed_at AT TIME ZONE 'UTC')::DATE AS view_date, COUNT(*)::INTEGER AS views
+    FROM moved
+    GROUP BY 1, 2;
+
+    INSERT INTO salon_view_daily (salon_id, view_date, view_count)
+    SELECT salon_id, view_date, views FROM rolled_views
+    ON CONFLICT (salon_id, view_date)
+    DO UPDATE SET view_count = salon_view_daily.view_count + EXCLUDED.view_count;
+
+    UPDATE salons s
+    SET view_count = COALESCE(s.view_count, 0) + t.views
+    FROM (SELECT salon_id, SUM(views) AS views FROM rolled_views GROUP BY salon_id) t
+    WHERE s.id = t.salon_id;
+
+    SELECT COALESCE(SUM(views), 0) INTO event_count FROM rolled_views;
+    DROP TABLE rolled_views;
+    RETURN event_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Run the rollup job: python rollup_view_events.py --interval 300
+-- 2. Check counters: SELECT * FROM salon_view_daily ORDER BY view_date DESC LIMIT 10;
+-- =====================================================
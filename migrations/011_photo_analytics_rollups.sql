@@ -0,0 +1,128 @@
+-- =====================================================
+-- PHASE 11: PHOTO ANALYTICS ROLLUPS
+-- =====================================================
+-- Hourly and daily summaries of the raw photo_analytics events
+-- (UPDATE_PHOTO_MANAGEMENT.sql), so admin dashboards read a few
+-- hundred summary rows instead of aggregating every raw event.
+--
+-- rollup_photo_analytics.py folds new events in incrementally: it
+-- reads past the high-water mark in photo_analytics_rollup_state,
+-- aggregates, and applies the sums and the new mark together through
+-- apply_photo_analytics_rollup.
+-- Requires UPDATE_PHOTO_MANAGEMENT.sql.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Summary tables
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS photo_analytics_hourly (
+    salon_id UUID NOT NULL,
+    photo_id UUID NOT NULL,
+    bucket TIMESTAMP WITH TIME ZONE NOT NULL,
+    views INTEGER NOT NULL DEFAULT 0,
+    clicks INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (salon_id, bucket, photo_id)
+);
+
+CREATE TABLE IF NOT EXISTS photo_analytics_daily (
+    salon_id UUID NOT NULL,
+    photo_id UUID NOT NULL,
+    date DATE NOT NULL,
+    views INTEGER NOT NULL DEFAULT 0,
+    clicks INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (salon_id, date, photo_id)
+);
+
+-- Raw events are read in (created_at, id) order past the high-water mark
+CREATE INDEX IF NOT EXISTS idx_photo_analytics_created
+    ON photo_analytics(created_at, id);
+
+-- Step 2: High-water mark
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS photo_analytics_rollup_state (
+    id BOOLEAN PRIMARY KEY DEFAULT true CHECK (id),
+    last_created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT '-infinity',
+    last_id UUID NOT NULL DEFAULT '00000000-0000-0000-0000-000000000000',
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+INSERT INTO photo_analytics_rollup_state (id) VALUES (true)
+ON CONFLICT (id) DO NOTHING;
+
+-- Step 3: Row level security
+-- =====================================================
+
+ALTER TABLE photo_analytics_hourly ENABLE ROW LEVEL SECURITY;
+ALTER TABLE photo_analytics_daily ENABLE ROW LEVEL SECURITY;
+ALTER TABLE photo_analytics_rollup_state ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Photo analytics hourly are viewable by everyone" ON photo_analytics_hourly;
+CREATE POLICY "Photo analytics hourly are viewable by everyone" ON photo_analytics_hourly
+    FOR SELECT USING (true);
+
+DROP POLICY IF EXISTS "Photo analytics daily are viewable by everyone" ON photo_analytics_daily;
+CREATE POLICY "Photo analytics daily are viewable by everyone" ON photo_analytics_daily
+    FOR SELECT USING (true);
+
+-- Step 4: Apply function
+-- =====================================================
+-- Adds JSON arrays of hourly {salon_id, photo_id, bucket, views,
+-- clicks} and daily {salon_id, photo_id, date, views, clicks} sums and
+-- advances the high-water mark in one transaction. Fails without
+-- writing if the mark moved since the caller read it, so two jobs can
+-- never count the same events twice.
+
+CREATE OR REPLACE FUNCTION apply_photo_analytics_rollup(
+    hourly JSONB,
+    daily JSONB,
+    from_created_at TIMESTAMP WITH TIME ZONE,
+    from_id UUID,
+    to_created_at TIMESTAMP WITH TIME ZONE,
+    to_id UUID
+)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE photo_analytics_rollup_state
+    SET last_created_at = to_created_at,
+        last_id = to_id,
+        updated_at = now()
+    WHERE last_created_at = from_created_at AND last_id = from_id;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'photo analytics high-water mark moved; rerun the rollup';
+    END IF;
+
+    INSERT INTO photo_analytics_hourly (salon_id, photo_id, bucket, views, clicks)
+    SELECT salon_id, photo_id, bucket, views, clicks
+    FROM jsonb_to_recordset(hourly)
+        AS r(salon_id UUID, photo_id UUID, bucket TIMESTAMP WITH TIME ZONE, views INTEGER, clicks INTEGER)
+    ON CONFLICT (salon_id, bucket, photo_id) DO UPDATE
+    SET views = photo_analytics_hourly.views + EXCLUDED.views,
+        clicks = photo_analytics_hourly.clicks + EXCLUDED.clicks;
+
+    INSERT INTO photo_analytics_daily (salon_id, photo_id, date, views, clicks)
+    SELECT salon_id, photo_id, date, views, clicks
+    FROM jsonb_to_recordset(daily)
+        AS r(salon_id UUID, photo_id UUID, date DATE, views INTEGER, clicks INTEGER)
+    ON CONFLICT (salon_id, date, photo_id) DO UPDATE
+    SET views = photo_analytics_daily.views + EXCLUDED.views,
+        clicks = photo_analytics_daily.clicks + EXCLUDED.clicks;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Backfill and keep current: python rollup_photo_analytics.py --interval 300
+-- 2. Query: SELECT date, SUM(views), SUM(clicks) FROM photo_analytics_daily
+--           WHERE salon_id = '...' GROUP BY date ORDER BY date;
+-- =====================================================
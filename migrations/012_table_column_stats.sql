@@ -0,0 +1,103 @@
+-- =====================================================
+-- PHASE 12: SINGLE-QUERY COLUMN STATISTICS
+-- =====================================================
+-- table_column_stats computes the row count, non-null count of every
+-- requested column, the TRUE count of boolean columns and an optional
+-- per-group row count in one table scan, so verification reports cost
+-- one request however many columns they cover.
+--
+-- Called by column_stats.py (verify_import.py).
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Stats function
+-- =====================================================
+-- Returns:
+--   {"total": N,
+--    "columns": {"<column>": {"non_null": n, "true": t}, ...},
+--    "groups": {"<group value>": n, ...},
+--    "missing": ["<requested column not in table>", ...]}
+-- Column names are checked against information_schema and quoted, so
+-- arbitrary input can't inject SQL. Each column's stats are built with
+-- their own jsonb_build_object and concatenated, which keeps wide
+-- reports under the 100-argument function limit.
+
+CREATE OR REPLACE FUNCTION table_column_stats(
+    target_table TEXT,
+    column_names TEXT[],
+    group_column TEXT DEFAULT NULL
+)
+RETURNS JSONB AS $$
+DECLARE
+    col RECORD;
+    column_exprs TEXT := '''{}''::JSONB';
+    found_columns TEXT[] := '{}';
+    stats JSONB;
+    groups JSONB := '{}'::JSONB;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.tables t
+        WHERE t.table_schema = 'public' AND t.table_name = target_table
+    ) THEN
+        RAISE EXCEPTION 'Unknown table: %', target_table;
+    END IF;
+
+    FOR col IN
+        SELECT c.column_name, c.data_type
+        FROM information_schema.columns c
+        WHERE c.table_schema = 'public'
+            AND c.table_name = target_table
+            AND c.column_name = ANY(column_names)
+        ORDER BY c.ordinal_position
+    LOOP
+        found_columns := found_columns || col.column_name::TEXT;
+        column_exprs := column_exprs || format(
+            ' || jsonb_build_object(%L, jsonb_build_object(''non_null'', COUNT(%I)%s))',
+            col.column_name,
+            col.column_name,
+            CASE WHEN col.data_type = 'boolean'
+                THEN format(', ''true'', COUNT(*) FILTER (WHERE %I)', col.column_name)
+                ELSE ''
+            END
+        );
+    END LOOP;
+
+    EXECUTE format(
+        'SELECT jsonb_build_object(''total'', COUNT(*), ''columns'', %s) FROM public.%I',
+        column_exprs, target_table
+    ) INTO stats;
+
+    IF group_column IS NOT NULL THEN
+        IF NOT EXISTS (
+            SELECT 1 FROM information_schema.columns c
+            WHERE c.table_schema = 'public' AND c.table_name = target_table
+                AND c.column_name = group_column
+        ) THEN
+            RAISE EXCEPTION 'Unknown column: %.%', target_table, group_column;
+        END IF;
+
+        EXECUTE format(
+            'SELECT COALESCE(jsonb_object_agg(COALESCE(g::TEXT, ''null''), n), ''{}''::JSONB)
+             FROM (SELECT %I AS g, COUNT(*) AS n FROM public.%I GROUP BY 1) t',
+            group_column, target_table
+        ) INTO groups;
+    END IF;
+
+    RETURN stats || jsonb_build_object(
+        'groups', groups,
+        'missing', to_jsonb(ARRAY(
+            SELECT name FROM unnest(column_names) AS name
+            WHERE name <> ALL(found_columns)
+        ))
+    );
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Verify an import: python verify_import.py
+-- 2. Query: SELECT table_column_stats('salons', ARRAY['manicure', 'phone'], 'city_id');
+-- =====================================================
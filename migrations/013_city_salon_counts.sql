@@ -0,0 +1,75 @@
+-- =====================================================
+-- PHASE 13: SALON COUNTS PER CITY AND STATE
+-- =====================================================
+-- Published salon counts per city, materialized so city listings and
+-- check_cities.py read one row per city instead of grouping the whole
+-- salons table. state_salon_counts sums the city rows per state.
+--
+-- Refreshed after imports by refresh_city_counts.py.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Per-city counts
+-- =====================================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS city_salon_counts AS
+SELECT
+    c.id AS city_id,
+    c.name AS city_name,
+    c.state_id,
+    st.code AS state_code,
+    COUNT(s.id)::INTEGER AS salon_count
+FROM cities c
+LEFT JOIN states st ON st.id = c.state_id
+LEFT JOIN salons s ON s.city_id = c.id AND s.is_published = true
+GROUP BY c.id, c.name, c.state_id, st.code;
+
+-- Unique index lets the view be refreshed CONCURRENTLY (no read lock)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_city_salon_counts_city
+    ON city_salon_counts(city_id);
+CREATE INDEX IF NOT EXISTS idx_city_salon_counts_state
+    ON city_salon_counts(state_code, salon_count DESC);
+
+-- Step 2: Per-state counts
+-- =====================================================
+
+CREATE OR REPLACE VIEW state_salon_counts AS
+SELECT
+    state_id,
+    state_code,
+    COUNT(*)::INTEGER AS city_count,
+    SUM(salon_count)::INTEGER AS salon_count
+FROM city_salon_counts
+GROUP BY state_id, state_code;
+
+GRANT SELECT ON city_salon_counts TO anon, authenticated;
+GRANT SELECT ON state_salon_counts TO anon, authenticated;
+
+-- Step 3: Refresh function
+-- =====================================================
+-- SECURITY DEFINER because only the view owner may refresh it, with a
+-- fixed search_path so callers can't shadow the objects it uses.
+-- Returns the number of cities in the view.
+
+CREATE OR REPLACE FUNCTION refresh_city_salon_counts()
+RETURNS INTEGER AS $$
+DECLARE
+    city_count INTEGER;
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY city_salon_counts;
+    SELECT COUNT(*) INTO city_count FROM city_salon_counts;
+    RETURN city_count;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+REVOKE EXECUTE ON FUNCTION refresh_city_salon_counts() FROM PUBLIC, anon, authenticated;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Refresh after imports: python refresh_city_counts.py
+-- 2. Query: SELECT city_name, salon_count FROM city_salon_counts
+--           ORDER BY salon_count DESC LIMIT 20;
+-- =====================================================
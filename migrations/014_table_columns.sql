@@ -0,0 +1,54 @@
+-- =====================================================
+-- PHASE 14: SCHEMA INTROSPECTION
+-- =====================================================
+-- table_columns returns a table's column set from information_schema
+-- in one call, with a version stamp (md5 of the column names and
+-- types) that changes whenever a column is added, dropped or retyped.
+--
+-- Cached locally by schema_cache.py so importers can check payload
+-- columns and skip no-op DDL without trial-and-error requests.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Introspection function
+-- =====================================================
+-- Returns:
+--   {"version": "<md5>",
+--    "columns": [{"name", "data_type", "nullable", "default"}, ...]}
+
+CREATE OR REPLACE FUNCTION table_columns(target_table TEXT)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'version', md5(COALESCE(string_agg(c.column_name || ':' || c.data_type, ',' ORDER BY c.column_name), '')),
+        'columns', COALESCE(jsonb_agg(jsonb_build_object(
+            'name', c.column_name,
+            'data_type', c.data_type,
+            'nullable', c.is_nullable = 'YES',
+            'default', c.column_default
+        ) ORDER BY c.ordinal_position), '[]'::JSONB)
+    )
+    FROM information_schema.columns c
+    WHERE c.table_schema = 'public' AND c.table_name = target_table;
+$$ LANGUAGE sql STABLE;
+
+-- Step 2: Version-only check
+-- =====================================================
+-- The same stamp without the column list, so a cached column set can be
+-- checked for drift in one small call.
+
+CREATE OR REPLACE FUNCTION table_schema_version(target_table TEXT)
+RETURNS TEXT AS $$
+    SELECT md5(COALESCE(string_agg(c.column_name || ':' || c.data_type, ',' ORDER BY c.column_name), ''))
+    FROM information_schema.columns c
+    WHERE c.table_schema = 'public' AND c.table_name = target_table;
+$$ LANGUAGE sql STABLE;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Inspect: python check_database_schema.py
+-- 2. Query: SELECT table_columns('salons') -> 'version';
+--    SELECT table_schema_version('salons');  -- same value
+-- =====================================================
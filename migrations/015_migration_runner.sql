@@ -0,0 +1,91 @@
+-- =====================================================
+-- PHASE 15: MIGRATION RUNNER
+-- =====================================================
+-- Lets run_schema_migration.py apply migration files over the API:
+-- each file is split into statements client-side and sent in one
+-- apply_migration call, which runs them all in the request's single
+-- transaction and records the file in schema_migrations. A failing
+-- statement rolls back the whole file.
+--
+-- This file has to be pasted into the SQL Editor once; after that
+-- the runner applies (and records) everything else.
+-- Run this in Supabase SQL Editor
+-- =====================================================
+
+-- Step 1: Tracking table
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    name TEXT PRIMARY KEY,
+    checksum TEXT NOT NULL,
+    statement_count INTEGER NOT NULL DEFAULT 0,
+    applied_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+ALTER TABLE schema_migrations ENABLE ROW LEVEL SECURITY;
+
+-- Step 2: Statement runner
+-- =====================================================
+-- SECURITY DEFINER so DDL runs as the table owner; callable by the
+-- service role only. Both functions pin search_path so unqualified
+-- names in migrations always resolve to public. Returns the number of statements executed.
+
+CREATE OR REPLACE FUNCTION run_sql_statements(statements TEXT[])
+RETURNS INTEGER AS $$
+DECLARE
+    stmt TEXT;
+    executed INTEGER := 0;
+BEGIN
+    FOREACH stmt IN ARRAY statements LOOP
+        EXECUTE stmt;
+        executed := executed + 1;
+    END LOOP;
+    RETURN executed;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+REVOKE EXECUTE ON FUNCTION run_sql_statements(TEXT[]) FROM PUBLIC, anon, authenticated;
+
+-- Step 3: Tracked migrations
+-- =====================================================
+-- Applies a migration file's statements unless it is already recorded
+-- (returns false) and records it when done (returns true). With
+-- record_only the statements are skipped, for baselining files that
+-- were applied by hand.
+
+CREATE OR REPLACE FUNCTION apply_migration(
+    migration_name TEXT,
+    migration_checksum TEXT,
+    statements TEXT[],
+    record_only BOOLEAN DEFAULT false
+)
+RETURNS BOOLEAN AS $$
+BEGIN
+    -- Serialize concurrent runners on the tracking table
+    LOCK TABLE schema_migrations IN EXCLUSIVE MODE;
+
+    IF EXISTS (SELECT 1 FROM schema_migrations WHERE name = migration_name) THEN
+        RETURN false;
+    END IF;
+
+    IF NOT record_only THEN
+        PERFORM run_sql_statements(statements);
+    END IF;
+
+    INSERT INTO schema_migrations (name, checksum, statement_count)
+    VALUES (migration_name, migration_checksum, COALESCE(array_length(statements, 1), 0));
+    RETURN true;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+REVOKE EXECUTE ON FUNCTION apply_migration(TEXT, TEXT, TEXT[], BOOLEAN) FROM PUBLIC, anon, authenticated;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
+--
+-- Next steps:
+-- 1. Record the migrations already applied by hand:
+--    python run_schema_migration.py --baseline 015
+-- 2. Apply new migrations: python run_schema_migration.py
+-- =====================================================
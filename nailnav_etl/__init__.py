@@ -0,0 +1,38 @@
+"""
+Shared helpers for the salon import and maintenance scripts
+
+    from nailnav_etl import get_client, slugify, bool_value
+
+Names are resolved on first access, and the modules behind them import
+supabase, pandas and openpyxl only inside the functions that need them,
+so a script that only parses arguments (or prints --help) starts without
+paying for any of those imports.
+"""
+import importlib
+
+_EXPORTS = {
+    'bool_value': 'cleaning',
+    'clean_phone': 'cleaning',
+    'clean_website': 'cleaning',
+    'is_missing': 'cleaning',
+    'parse_hours': 'cleaning',
+    'slugify': 'cleaning',
+    'credentials': 'client',
+    'get_client': 'client',
+    'http_session': 'client',
+    'pool_settings': 'client',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,97 @@
+"""
+Cell cleaning for spreadsheet imports
+
+These work on raw values from pandas (NaN for blank cells) and openpyxl
+(None) alike. Missing-value checks don't import pandas: when a caller has
+already loaded it, its NA / NaT markers are recognised too.
+"""
+import math
+import re
+import sys
+import unicodedata
+
+TRUE_STRINGS = frozenset(['yes', 'true', '1', 'x', 'y'])
+
+DEFAULT_HOURS = {
+    "monday": "9:00 AM - 6:00 PM",
+    "tuesday": "9:00 AM - 6:00 PM",
+    "wednesday": "9:00 AM - 6:00 PM",
+    "thursday": "9:00 AM - 6:00 PM",
+    "friday": "9:00 AM - 6:00 PM",
+    "saturday": "9:00 AM - 5:00 PM",
+    "sunday": "10:00 AM - 4:00 PM",
+}
+
+
+def is_missing(value):
+    """True for None, NaN and pandas NA / NaT"""
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    pd = sys.modules.get('pandas')
+    return pd is not None and (value is pd.NA or value is pd.NaT)
+
+
+def slugify(text):
+    """Convert text to URL-friendly slug"""
+    if is_missing(text):
+        return ""
+    text = str(text).lower()
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8')
+    text = re.sub(r'[^\w\s-]', '', text)
+    text = re.sub(r'[-\s]+', '-', text).strip('-')
+    return text
+
+
+def clean_phone(phone):
+    """Clean and format phone number"""
+    if is_missing(phone):
+        return None
+    phone = str(phone).strip()
+    if not phone or phone == 'nan':
+        return None
+    return phone
+
+
+def clean_website(website):
+    """Clean and format website URL"""
+    if is_missing(website):
+        return None
+    website = str(website).strip()
+    if not website or website == 'nan':
+        return None
+    if not website.startswith('http'):
+        website = 'https://' + website
+    return website
+
+
+def parse_hours(hours_str, closed_on_str=None):
+    """Parse operating hours into JSON format"""
+    if is_missing(hours_str):
+        return dict(DEFAULT_HOURS)
+
+    # Simple default for now
+    hours = str(hours_str)
+    return {
+        "monday": hours,
+        "tuesday": hours,
+        "wednesday": hours,
+        "thursday": hours,
+        "friday": hours,
+        "saturday": hours,
+        "sunday": "Closed" if closed_on_str and 'sunday' in str(closed_on_str).lower() else hours,
+    }
+
+
+def bool_value(value):
+    """Convert Excel value to boolean"""
+    if is_missing(value):
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value > 0
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_STRINGS
+    return bool(value)
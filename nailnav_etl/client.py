@@ -0,0 +1,92 @@
+"""
+Supabase client for the ETL scripts
+
+get_client() reads the service-role credentials from .env.local and
+creates the client once per process; every later call returns the same
+client, so stages that run in one process (an import followed by the
+facet, city count and snapshot refreshes) share its connections.
+
+All PostgREST and RPC traffic goes through one httpx session with a
+bounded keep-alive pool, so repeated calls reuse open connections instead
+of paying for a new TLS handshake each time. The pool can be tuned from
+the environment (or .env.local):
+
+    SUPABASE_POOL_SIZE        connections kept open (default 10)
+    SUPABASE_TIMEOUT          seconds to wait for a response (default 60)
+    SUPABASE_CONNECT_TIMEOUT  seconds to wait for a connection (default 10)
+    SUPABASE_KEEPALIVE        seconds an idle connection is kept (default 30)
+    SUPABASE_HTTP2            1 to negotiate HTTP/2 (needs the h2 package)
+
+Requests through the session are timed into metrics.py, and creating the
+client turns on the end-of-run metrics report.
+
+supabase, httpx and dotenv are imported on the first call.
+"""
+import atexit
+import os
+from functools import lru_cache
+
+from . import metrics
+
+ENV_FILE = '.env.local'
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_KEEPALIVE = 30.0
+
+
+def credentials():
+    """(url, service key) from the environment, after loading .env.local"""
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_FILE)
+    return os.getenv('NEXT_PUBLIC_SUPABASE_URL'), os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+
+
+def pool_settings():
+    """Pool size, timeouts and HTTP/2 flag from the environment"""
+    return {
+        'pool_size': int(os.getenv('SUPABASE_POOL_SIZE', DEFAULT_POOL_SIZE)),
+        'timeout': float(os.getenv('SUPABASE_TIMEOUT', DEFAULT_TIMEOUT)),
+        'connect_timeout': float(os.getenv('SUPABASE_CONNECT_TIMEOUT', DEFAULT_CONNECT_TIMEOUT)),
+        'keepalive': float(os.getenv('SUPABASE_KEEPALIVE', DEFAULT_KEEPALIVE)),
+        'http2': os.getenv('SUPABASE_HTTP2', '').lower() in ('1', 'true', 'yes'),
+    }
+
+
+@lru_cache(maxsize=None)
+def http_session():
+    """The process-wide pooled keep-alive httpx session"""
+    import httpx
+
+    settings = pool_settings()
+    session = httpx.Client(
+        http2=settings['http2'],
+        limits=httpx.Limits(
+            max_connections=settings['pool_size'],
+            max_keepalive_connections=settings['pool_size'],
+            keepalive_expiry=settings['keepalive'],
+        ),
+        timeout=httpx.Timeout(settings['timeout'], connect=settings['connect_timeout']),
+        event_hooks=metrics.EVENT_HOOKS,
+    )
+    atexit.register(session.close)
+    return session
+
+
+@lru_cache(maxsize=None)
+def get_client():
+    """The process-wide service-role Supabase client"""
+    url, key = credentials()
+    if not url or not key:
+        raise RuntimeError(f"Supabase credentials not found in {ENV_FILE}")
+
+    from supabase import ClientOptions, create_client
+
+    options = ClientOptions(
+        postgrest_client_timeout=pool_settings()['timeout'],
+        httpx_client=http_session(),
+    )
+    metrics.enable()
+    return create_client(url, key, options=options)
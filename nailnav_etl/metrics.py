@@ -0,0 +1,273 @@
+"""
+Per-stage timing and request latency for ETL runs
+
+Scripts mark their stages with a context manager. Time spent in a stage
+name adds up across every entry, and a stage nested inside another is
+subtracted from the outer one, so a per-row loop can time its transform
+and write steps separately:
+
+    with metrics.stage('read') as read:
+        df = pd.read_excel(path)
+        read.rows = len(df)
+
+    for idx, row in metrics.per_row('transform', df.iterrows()):
+        salon = build_salon(row)
+        with metrics.stage('write', rows=1):
+            supabase.table('salons').insert(salon).execute()
+
+Every Supabase request made through the shared client (client.py) is
+timed too, into a latency histogram per endpoint and stage, so a slow
+stage shows whether its time went to parsing or to the network.
+
+Once a client has been created, a JSON summary is written to
+metrics/<script>.json (or ETL_METRICS_DIR) when the process exits. If
+ETL_PROMETHEUS_TEXTFILE is set, the same numbers are also written there
+in Prometheus text format, for node_exporter's textfile collector.
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+DEFAULT_METRICS_DIR = 'metrics'
+
+# Upper bounds, in seconds, of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_lock = threading.Lock()
+_stages = {}
+_requests = {}
+_active = []
+_started = time.time()
+_run = None
+
+
+class Stage:
+    """Accumulated wall time, entries and rows of one named stage"""
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+        self.calls = 0
+        self.rows = 0
+
+    def summary(self):
+        return {
+            'seconds': round(self.seconds, 6),
+            'calls': self.calls,
+            'rows': self.rows,
+            'rows_per_sec': round(self.rows / self.seconds, 2) if self.seconds and self.rows else None,
+        }
+
+
+class Histogram:
+    """Request count, total and bucketed latency of one endpoint"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, seconds, failed):
+        self.count += 1
+        self.errors += failed
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for position, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[position] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th quantile"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= target:
+                return bound
+        return round(self.max, 6)
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'mean_seconds': round(self.total / self.count, 6) if self.count else None,
+            'p50_seconds': self.quantile(0.5),
+            'p95_seconds': self.quantile(0.95),
+            'max_seconds': round(self.max, 6),
+            'buckets': dict(zip([*map(str, LATENCY_BUCKETS), '+Inf'], self.buckets)),
+        }
+
+
+@contextmanager
+def stage(name, rows=0):
+    """Time a block under `name`; set .rows on the yielded stage to count rows"""
+    with _lock:
+        entry = _stages.setdefault(name, Stage(name))
+    counter = Stage(name)
+    counter.rows = rows
+    _active.append(counter)
+    start = time.perf_counter()
+    try:
+        yield counter
+    finally:
+        elapsed = time.perf_counter() - start
+        _active.pop()
+        if _active:
+            # Nested stage time belongs to the nested stage only
+            _active[-1].seconds += elapsed
+        with _lock:
+            entry.seconds += elapsed - counter.seconds
+            entry.calls += 1
+            entry.rows += counter.rows
+
+
+def per_row(name, iterable):
+    """Yield from `iterable`, timing each loop body as one row of stage `name`"""
+    for item in iterable:
+        with stage(name, rows=1):
+            yield item
+
+
+def current_stage():
+    return _active[-1].name if _active else None
+
+
+def endpoint(url):
+    """'salons' or 'rpc/name' for a PostgREST URL, else the path"""
+    path = urlsplit(str(url)).path
+    for prefix in ('/rest/v1/', '/storage/v1/'):
+        if path.startswith(prefix):
+            return path[len(prefix):]
+    return path
+
+
+def record_request(method, url, seconds, status):
+    key = (current_stage() or '-', f"{method} {endpoint(url)}")
+    with _lock:
+        _requests.setdefault(key, Histogram()).observe(seconds, status >= 400)
+
+
+def _on_request(request):
+    request.extensions['nailnav_started'] = time.perf_counter()
+
+
+def _on_response(response):
+    started = response.request.extensions.get('nailnav_started')
+    if started is not None:
+        record_request(response.request.method, response.request.url,
+                       time.perf_counter() - started, response.status_code)
+
+
+EVENT_HOOKS = {'request': [_on_request], 'response': [_on_response]}
+
+
+def summary():
+    """Everything recorded so far, as a JSON-ready dict"""
+    with _lock:
+        return {
+            'run': _run or run_name(),
+            'started_at': _started,
+            'seconds': round(time.time() - _started, 6),
+            'stages': {name: entry.summary() for name, entry in _stages.items()},
+            'requests': [
+                {'stage': stage_name, 'endpoint': name, **histogram.summary()}
+                for (stage_name, name), histogram in sorted(_requests.items())
+            ],
+        }
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(report):
+    """A summary() report in Prometheus text exposition format"""
+    run = _label(report['run'])
+    families = {
+        'nailnav_etl_run_seconds': ('gauge', [f'{{run="{run}"}} {report["seconds"]}']),
+        'nailnav_etl_run_timestamp_seconds': ('gauge', [f'{{run="{run}"}} {report["started_at"]}']),
+        'nailnav_etl_stage_seconds': ('gauge', []),
+        'nailnav_etl_stage_rows': ('gauge', []),
+        'nailnav_etl_stage_rows_per_second': ('gauge', []),
+        'nailnav_etl_request_duration_seconds': ('histogram', []),
+        'nailnav_etl_request_errors_total': ('counter', []),
+    }
+
+    for name, entry in report['stages'].items():
+        labels = f'run="{run}",stage="{_label(name)}"'
+        families['nailnav_etl_stage_seconds'][1].append(f'{{{labels}}} {entry["seconds"]}')
+        families['nailnav_etl_stage_rows'][1].append(f'{{{labels}}} {entry["rows"]}')
+        if entry['rows_per_sec'] is not None:
+            families['nailnav_etl_stage_rows_per_second'][1].append(f'{{{labels}}} {entry["rows_per_sec"]}')
+
+    durations = families['nailnav_etl_request_duration_seconds'][1]
+    for request in report['requests']:
+        labels = f'run="{run}",stage="{_label(request["stage"])}",endpoint="{_label(request["endpoint"])}"'
+        cumulative = 0
+        for bound, count in request['buckets'].items():
+            cumulative += count
+            durations.append(f'_bucket{{{labels},le="{bound}"}} {cumulative}')
+        total = round((request['mean_seconds'] or 0) * request['count'], 6)
+        durations.append(f'_sum{{{labels}}} {total}')
+        durations.append(f'_count{{{labels}}} {request["count"]}')
+        families['nailnav_etl_request_errors_total'][1].append(f'{{{labels}}} {request["errors"]}')
+
+    lines = []
+    for name, (kind, samples) in families.items():
+        if samples:
+            lines.append(f'# TYPE {name} {kind}')
+            lines.extend(name + sample for sample in samples)
+    return '\n'.join(lines) + '\n'
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def write_reports():
+    """Write the JSON summary (and Prometheus textfile, if configured); returns the JSON path"""
+    report = summary()
+    path = os.path.join(os.getenv('ETL_METRICS_DIR', DEFAULT_METRICS_DIR), f"{report['run']}.json")
+    _write_atomic(path, json.dumps(report, indent=2))
+    textfile = os.getenv('ETL_PROMETHEUS_TEXTFILE')
+    if textfile:
+        _write_atomic(textfile, prometheus_text(report))
+    return path
+
+
+def run_name():
+    return os.path.splitext(os.path.basename(sys.argv[0] or 'python'))[0] or 'python'
+
+
+def _report_at_exit():
+    try:
+        path = write_reports()
+        print(f"\n📈 Run metrics written to {path}")
+    except OSError as e:
+        print(f"\n⚠️  Could not write run metrics: {e}")
+
+
+def enable(name=None):
+    """Write reports when the process exits; called once a client exists"""
+    global _run
+    if _run is None:
+        _run = name or run_name()
+        atexit.register(_report_at_exit)
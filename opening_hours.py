@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Compile free-text opening hours into minute-of-week intervals
+
+The workbook stores one `workday_timing` string per salon ("9:30 am-6 pm",
+"12-8 pm", "9:00 AM - 6:00 PM") and a `closed_on` list of weekdays
+("Monday, Sunday" or "Open All Days"). compile_open_minutes parses the whole
+column with one compiled regex and returns an int4multirange literal per
+salon, with minute 0 = Monday 00:00 salon local time, for the open_minutes
+column (migrations/007_open_minutes.sql).
+
+Run on its own, it backfills open_minutes for salons already in the
+database from their stored opening_hours JSON, without re-importing:
+
+    python opening_hours.py
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+HOURS_PATTERN = re.compile(
+    r'^\s*(\d{1,2})(?::(\d{2}))?\s*([ap])?\.?m?\.?\s*[-–]\s*'
+    r'(\d{1,2})(?::(\d{2}))?\s*([ap])?\.?m?\.?\s*$',
+    re.IGNORECASE,
+)
+
+
+def _to_minutes(hour, minute, meridiem):
+    """Convert 12-hour clock parts (float arrays, meridiem 'a'/'p'/NaN) to minutes"""
+    pm = meridiem.str.lower().eq('p').to_numpy()
+    am = meridiem.str.lower().eq('a').to_numpy()
+    hour = hour.to_numpy(dtype=float)
+    minute = minute.fillna(0).to_numpy(dtype=float)
+    hour = np.where(pm | am, hour % 12, hour) + np.where(pm, 12, 0)
+    return hour * 60 + minute
+
+
+def parse_open_span(workday_timing):
+    """
+    Parse a Series of "start-end" strings into (start, end) minute arrays.
+
+    A start without am/pm takes the end's ("12-8 pm" is noon to 8 pm) unless
+    that would put it after the end ("11-7 pm" is 11 am). With no am/pm on
+    either side, an end at or before the start is read as pm ("8-5" is 8 am
+    to 5 pm). Only spans with an explicit meridiem ("8 pm-2 am") run past
+    midnight. Unparseable or still-backwards values come back as NaN.
+    """
+    parts = workday_timing.str.extract(HOURS_PATTERN)
+    start_meridiem = parts[2].fillna(parts[5])
+    start = _to_minutes(pd.to_numeric(parts[0]), pd.to_numeric(parts[1]), start_meridiem)
+    end = _to_minutes(pd.to_numeric(parts[3]), pd.to_numeric(parts[4]), parts[5])
+
+    inherited_pm = parts[2].isna().to_numpy() & parts[5].str.lower().eq('p').to_numpy()
+    start = np.where(inherited_pm & (start >= end) & (start >= 12 * 60), start - 12 * 60, start)
+    bare = (parts[2].isna() & parts[5].isna()).to_numpy()
+    end = np.where(bare & (end <= start) & (end < 12 * 60), end + 12 * 60, end)
+    backwards = bare & (end <= start)
+    start = np.where(backwards, np.nan, start)
+    end = np.where(backwards, np.nan, np.where(end <= start, end + MINUTES_PER_DAY, end))
+    return start, end
+
+
+def closed_days(closed_on):
+    """Boolean matrix (salons x 7) of weekdays listed in closed_on"""
+    text = closed_on.str.lower()
+    return np.column_stack([text.str.contains(day, regex=False).to_numpy() for day in DAYS])
+
+
+def compile_open_minutes(workday_timing, closed_on):
+    """
+    Return an int4multirange literal per salon covering its open minutes.
+
+    Salons whose hours can't be parsed get None so the column stays NULL.
+    A sheet only has a few hundred distinct (hours, closed days) pairs, so
+    each pair is compiled once and the results are broadcast back.
+    """
+    pairs = pd.MultiIndex.from_arrays([
+        workday_timing.fillna('').astype(str).to_numpy(),
+        closed_on.fillna('').astype(str).to_numpy(),
+    ])
+    codes, uniques = pd.factorize(pairs)
+    compiled = _compile_pairs(
+        pd.Series(uniques.get_level_values(0)), pd.Series(uniques.get_level_values(1))
+    )
+    return pd.Series(compiled[codes], index=workday_timing.index, dtype=object)
+
+
+def _compile_pairs(workday_timing, closed_on):
+    start, end = parse_open_span(workday_timing)
+    closed = closed_days(closed_on)
+    valid = ~np.isnan(start) & ~np.isnan(end)
+
+    pieces = []
+    for day in range(7):
+        day_start = start + day * MINUTES_PER_DAY
+        day_end = end + day * MINUTES_PER_DAY
+        is_open = valid & ~closed[:, day]
+        # Sunday hours running past midnight wrap to Monday morning
+        main_end = np.minimum(day_end, MINUTES_PER_WEEK)
+        wrap_end = day_end - MINUTES_PER_WEEK
+        piece = pd.Series(
+            np.where(is_open, _ranges(day_start, main_end), ''), index=workday_timing.index
+        )
+        wrapped = is_open & (wrap_end > 0)
+        piece = piece.where(~wrapped, piece + ',' + _ranges(np.zeros_like(wrap_end), wrap_end))
+        pieces.append(piece)
+
+    joined = pieces[0]
+    for piece in pieces[1:]:
+        joined = joined + ',' + piece
+    joined = joined.str.replace(r',{2,}', ',', regex=True).str.strip(',')
+    literals = ('{' + joined + '}').to_numpy(dtype=object)
+    literals[~valid] = None
+    return literals
+
+
+def _ranges(lower, upper):
+    lower = pd.Series(np.nan_to_num(lower).astype(int)).astype(str)
+    upper = pd.Series(np.nan_to_num(upper).astype(int)).astype(str)
+    return ('[' + lower + ',' + upper + ')').to_numpy()
+
+
+def compile_weekly_open_minutes(opening_hours):
+    """
+    Like compile_open_minutes, from the per-day opening_hours JSON on salons.
+
+    Each day's hours are compiled on their own and joined, so days with
+    different hours are kept. Salons that only have the placeholder
+    DEFAULT_HOURS, or a day that can't be parsed, get None.
+    """
+    from nailnav_etl.cleaning import DEFAULT_HOURS
+
+    hours = opening_hours.map(lambda value: value if isinstance(value, dict) else {})
+    unknown = hours.map(lambda value: not value or value == DEFAULT_HOURS).to_numpy(dtype=bool, copy=True)
+
+    joined = pd.Series('', index=opening_hours.index, dtype=object)
+    for day in DAYS:
+        text = hours.map(lambda value: value.get(day)).fillna('').astype(str).str.strip()
+        closed = text.str.lower().isin(['closed', ''])
+        other_days = ', '.join(d for d in DAYS if d != day)
+        literals = compile_open_minutes(
+            text.where(~closed, '12-1 pm'),
+            pd.Series(other_days, index=text.index).where(~closed, 'Open All Days, ' + ', '.join(DAYS)),
+        )
+        unknown |= literals.isna().to_numpy()
+        joined = joined + ',' + literals.fillna('{}').str.strip('{}')
+
+    literals = ('{' + joined.str.replace(r',{2,}', ',', regex=True).str.strip(',') + '}').to_numpy(dtype=object, copy=True)
+    literals[unknown] = None
+    return pd.Series(literals, index=opening_hours.index, dtype=object)
+
+
+def refresh_open_minutes(supabase, batch_size=1000):
+    """Recompute open_minutes from opening_hours for every salon; returns rows written"""
+    from paged_reads import fetch_all
+
+    rows = fetch_all(lambda: supabase.table('salons').select('id, opening_hours, open_minutes').order('id'))
+    if not rows:
+        return 0
+
+    frame = pd.DataFrame(rows)
+    frame['compiled'] = compile_weekly_open_minutes(frame['opening_hours'])
+    changed = frame['compiled'].fillna('\0') != frame['open_minutes'].fillna('\0')
+    updates = [
+        {'id': int(row.id), 'open_minutes': row.compiled}
+        for row in frame[changed].itertuples()
+    ]
+    for i in range(0, len(updates), batch_size):
+        supabase.rpc('update_salon_open_minutes', {'rows': updates[i:i + batch_size]}).execute()
+    return len(updates)
+
+
+def main():
+    from nailnav_etl import get_client, metrics
+
+    print("=" * 80)
+    print("🕘 REFRESHING OPEN MINUTES")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    print("\n🔄 Compiling stored opening hours...")
+    try:
+        with metrics.stage('refresh_open_minutes'):
+            updated = refresh_open_minutes(supabase)
+    except Exception as e:
+        print(f"❌ Failed to refresh open minutes: {e}")
+        print("   Has migrations/007_open_minutes.sql been applied?")
+        return
+
+    print(f"✅ Updated open_minutes for {updated} salons")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Read whole tables past the PostgREST row cap
+
+A bare `select(...).execute()` returns at most the server's max-rows
+(1000 by default) and silently drops the rest. iter_rows pages through a
+query in PAGE_SIZE ranges instead, requesting WORKERS ranges at a time in
+parallel and yielding rows in order as each wave arrives:
+
+    rows = iter_rows(lambda: supabase.table('salons').select('id, name').order('id'))
+    salon_map = {row['name']: row['id'] for row in rows}
+
+query_fn must build a fresh query each call and should order by a unique
+column, or rows can repeat or go missing between ranges.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+PAGE_SIZE = 1000
+WORKERS = 4
+
+
+def iter_rows(query_fn, page_size=PAGE_SIZE, workers=WORKERS):
+    """
+    Yield every row of query_fn() in order, fetching `workers` pages at a time
+
+    The first page is read alone. If the server caps it below page_size,
+    later ranges step by the row count it actually returned, so a lower
+    max-rows setting doesn't leave gaps between ranges.
+    """
+    def fetch(start, size):
+        return query_fn().range(start, start + size - 1).execute().data
+
+    first = fetch(0, page_size)
+    yield from first
+    if not first:
+        return
+    step = len(first)
+    start = step
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            starts = [start + i * step for i in range(workers)]
+            for page in pool.map(lambda s: fetch(s, step), starts):
+                yield from page
+                if len(page) < step:
+                    return
+            start += workers * step
+
+
+def fetch_all(query_fn, page_size=PAGE_SIZE, workers=WORKERS):
+    """Read every row of a query into a list"""
+    return list(iter_rows(query_fn, page_size, workers))
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Vectorized extraction of reviews from the salon workbook
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+# Format: "rating 5: Review content here..." (or "rating 4.5: ...")
+REVIEW_PATTERN = re.compile(r'^rating\s+(\d+(?:\.\d+)?)\s*:\s*(.*)', re.IGNORECASE)
+
+MIN_CONTENT_LENGTH = 10
+MAX_CONTENT_LENGTH = 1000
+
+
+def review_columns(df):
+    """Return the `Review  N` columns in sheet order"""
+    return [col for col in df.columns if str(col).startswith('Review  ')]
+
+
+def extract_reviews(df, review_cols=None, name_col='name'):
+    """
+    Melt all review columns into one long Series and parse them in one pass.
+
+    Returns (reviews, skipped) where reviews has one row per usable review
+    with columns `salon_name`, `review_col`, `rating` and `content`, ordered
+    by sheet row and then review column. Reviews without a rating prefix are
+    treated as 5 stars, ratings are clamped to 1-5 and content is truncated
+    to MAX_CONTENT_LENGTH. `skipped` counts non-empty cells whose content was
+    shorter than MIN_CONTENT_LENGTH.
+    """
+    if review_cols is None:
+        review_cols = review_columns(df)
+
+    long = (
+        df[[name_col, *review_cols]]
+        .assign(_row=np.arange(len(df)))
+        .melt(id_vars=['_row', name_col], value_vars=review_cols,
+              var_name='review_col', value_name='text')
+        .dropna(subset=['text'])
+    )
+    long['_col'] = long['review_col'].map({col: i for i, col in enumerate(review_cols)})
+    long = long.sort_values(['_row', '_col'], kind='stable')
+
+    text = long['text'].astype(str).str.strip()
+    parts = text.str.extract(REVIEW_PATTERN)
+
+    has_rating = parts[0].notna()
+    rating = pd.to_numeric(parts[0], errors='coerce').fillna(5.0).clip(1.0, 5.0)
+    content = parts[1].str.strip().where(has_rating, text).fillna('')
+
+    keep = content.str.len() >= MIN_CONTENT_LENGTH
+
+    reviews = pd.DataFrame({
+        'salon_name': long[name_col][keep].to_numpy(),
+        'review_col': long['review_col'][keep].to_numpy(),
+        'rating': rating[keep].to_numpy(dtype=float),
+        'content': content[keep].str.slice(0, MAX_CONTENT_LENGTH).to_numpy(),
+    })
+    return reviews, int((~keep).sum())
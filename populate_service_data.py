@@ -6,24 +6,17 @@ boolean service columns in the salons table.
 """
 
 import openpyxl
-import os
-from supabase import create_client, Client
-from dotenv import load_dotenv
 import time
 
-# Load environment variables
-load_dotenv('.env.local')
+from nailnav_etl import get_client
 
 # Initialize Supabase client
-supabase_url = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-if not supabase_url or not supabase_key:
-    print("❌ Error: Missing Supabase credentials in .env.local")
+try:
+    supabase = get_client()
+except RuntimeError as e:
+    print(f"❌ Error: {e}")
     exit(1)
 
-supabase: Client = create_client(supabase_url, supabase_key)
-
 print("✅ Connected to Supabase")
 
 # Load Excel file
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Profile an incoming salon workbook before importing it
+
+Streams the first sheet of an .xlsx (openpyxl read-only mode) or a .csv row
+by row, optionally keeping only a uniform random sample of rows, then
+profiles every column in one vectorized pass:
+
+- non-null count, null rate, cardinality and top values
+- Yes/No ratios for flag columns, and any values that aren't Yes/No
+- header problems: likely typos ("Reveiw", "Exensions", "Tatoo"),
+  doubled spaces, one-letter names and duplicates
+- row-level anomalies: duplicate salons, ratings outside 0-5, negative
+  review counts, unparseable phone numbers and websites, blank names
+
+The result is a plain dict ready to be written as a JSON report.
+"""
+import csv
+import difflib
+import random
+import re
+
+import pandas as pd
+
+TOP_VALUES = 5
+MAX_EXAMPLE_ROWS = 20
+
+YES_VALUES = frozenset(['yes', 'y', 'true'])
+NO_VALUES = frozenset(['no', 'n', 'false'])
+
+# Correctly spelled words expected in salon workbook headers; a header word
+# that isn't here but is close to one of these is reported as a typo
+HEADER_VOCABULARY = frozenset("""
+place id name description reviews review rating phone website main category
+categories workday timing closed on address keywords state city postcode
+summary gel manicure extensions acrylic nails nail pedicure dip powder
+builders biab art massage facials eyelashes lash lift tint brows waxing
+hair cuts haircuts hand foot treatment price basic fluent english spanish
+vietnamese chinese korean qualified technicians experienced team quick
+service award winning staff master artist bridal appointment required
+walk ins welcome group bookings mobile kid friendly child play area adult
+only pet lgbtqi wheel chair accessible female owned salon minority
+complimentary drink heated chairs spas free wi fi parking autoclave
+sterilisation led curing non toxic treatments eco products cruelty vegan
+polish tattoo cosmetic injectables tanning spa x and of the how do they
+care for your health wellbeing what are customer customers saying about
+""".split())
+
+WORD_PATTERN = re.compile(r'[A-Za-z]+')
+PHONE_PATTERN = r'^\+?[\d\s()\-.]{8,}$'
+WEBSITE_PATTERN = r'^(https?://)?[\w\-]+(\.[\w\-]+)+'
+
+
+def stream_rows(file_path):
+    """Yield the header row, then every data row, of the first sheet or CSV"""
+    if file_path.lower().endswith('.csv'):
+        with open(file_path, newline='', encoding='utf-8') as f:
+            yield from csv.reader(f)
+        return
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def read_frame(file_path, sample=None, seed=0):
+    """
+    Stream a workbook into a DataFrame of raw values indexed by sheet row.
+
+    With `sample`, keeps a uniform random sample of that many data rows
+    (reservoir sampling), so memory stays bounded on very large files.
+    Entirely blank rows and trailing unnamed columns are skipped; repeated
+    header names get a ".1", ".2" suffix like pandas.read_excel, with the
+    raw names kept in frame.attrs['headers'].
+    Returns (frame, data rows, blank rows).
+    """
+    rows = stream_rows(file_path)
+    headers = [str(h) if h is not None else '' for h in next(rows)]
+    while headers and not headers[-1].strip():
+        headers.pop()
+
+    rng = random.Random(seed)
+    kept = []
+    total = 0
+    blank = 0
+    for row_number, values in enumerate(rows, 2):
+        if all(v is None or str(v).strip() == '' for v in values):
+            blank += 1
+            continue
+        total += 1
+        record = (row_number, values[:len(headers)])
+        if sample is None or len(kept) < sample:
+            kept.append(record)
+        else:
+            slot = rng.randrange(total)
+            if slot < sample:
+                kept[slot] = record
+
+    kept.sort(key=lambda record: record[0])
+    seen = {}
+    names = []
+    for header in headers:
+        names.append(f"{header}.{seen[header]}" if header in seen else header)
+        seen[header] = seen.get(header, 0) + 1
+
+    frame = pd.DataFrame(
+        [list(values) + [None] * (len(headers) - len(values)) for _, values in kept],
+        columns=pd.Index(names),
+        index=pd.Index([row for row, _ in kept], name='row'),
+        dtype=object,
+    )
+    # Blank cells from CSVs and whitespace-only cells count as missing
+    frame = frame.replace(r'^\s*$', None, regex=True)
+    frame.attrs['headers'] = headers
+    return frame, total, blank
+
+
+def header_issues(headers):
+    """Likely typos and formatting problems in header names"""
+    issues = []
+    seen = {}
+    for position, header in enumerate(headers):
+        if '  ' in header or header != header.strip():
+            issues.append({'column': header, 'issue': 'extra whitespace'})
+        if len(header.strip()) <= 1:
+            issues.append({'column': header, 'issue': 'one-letter or empty name'})
+
+        key = ' '.join(header.lower().split())
+        if key and key in seen:
+            issues.append({'column': header, 'issue': f'duplicate of column {seen[key] + 1}'})
+        seen.setdefault(key, position)
+
+        for word in WORD_PATTERN.findall(header):
+            lowered = word.lower()
+            if len(lowered) < 4 or lowered in HEADER_VOCABULARY:
+                continue
+            match = difflib.get_close_matches(lowered, HEADER_VOCABULARY, n=1, cutoff=0.8)
+            if match:
+                issues.append({'column': header, 'issue': f'possible typo: "{word}" -> "{match[0]}"'})
+    return issues
+
+
+def profile_columns(frame):
+    """Per-column counts, cardinality, top values and Yes/No ratios"""
+    total = len(frame)
+    text = frame.astype('string').apply(lambda col: col.str.strip())
+    lowered = text.apply(lambda col: col.str.lower())
+
+    non_null = text.notna().sum()
+    cardinality = text.nunique()
+    is_yes = lowered.isin(YES_VALUES)
+    is_no = lowered.isin(NO_VALUES)
+    yes_count = is_yes.sum()
+    no_count = is_no.sum()
+    # A flag column holds nothing but yes/no values
+    is_flag = (yes_count + no_count == non_null) & (non_null > 0)
+
+    profiles = {}
+    for position, column in enumerate(frame.columns):
+        values = text.iloc[:, position]
+        counts = values.value_counts().head(TOP_VALUES)
+        profile = {
+            'non_null': int(non_null.iloc[position]),
+            'null_rate': round(float(1 - non_null.iloc[position] / total), 4) if total else None,
+            'cardinality': int(cardinality.iloc[position]),
+            'top_values': [[value, int(count)] for value, count in counts.items()],
+        }
+        numeric = pd.to_numeric(values, errors='coerce')
+        if profile['non_null'] and numeric.notna().sum() == profile['non_null']:
+            profile.update(min=float(numeric.min()), max=float(numeric.max()), mean=round(float(numeric.mean()), 4))
+        if is_flag.iloc[position]:
+            profile.update(
+                yes=int(yes_count.iloc[position]),
+                no=int(no_count.iloc[position]),
+                yes_ratio=round(float(yes_count.iloc[position] / non_null.iloc[position]), 4),
+            )
+        profiles[column] = profile
+    return profiles
+
+
+def _rows(mask):
+    rows = mask[mask].index
+    return {'count': int(len(rows)), 'rows': [int(r) for r in rows[:MAX_EXAMPLE_ROWS]]}
+
+
+def row_anomalies(frame, flag_columns):
+    """Rows failing basic sanity checks, as {check: {count, rows}}"""
+    text = frame.astype('string').apply(lambda col: col.str.strip())
+    anomalies = {}
+
+    if 'name' in frame:
+        anomalies['blank_name'] = _rows(text['name'].isna())
+    if 'place_id' in frame:
+        place_id = text['place_id']
+        anomalies['duplicate_place_id'] = _rows(place_id.notna() & place_id.duplicated(keep=False))
+    if 'name' in frame and 'address' in frame:
+        key = text['name'].str.lower() + '|' + text['address'].str.lower()
+        anomalies['duplicate_name_address'] = _rows(key.notna() & key.duplicated(keep=False))
+    if 'rating' in frame:
+        rating = pd.to_numeric(text['rating'], errors='coerce')
+        anomalies['rating_out_of_range'] = _rows(
+            text['rating'].notna() & ~rating.between(0, 5)
+        )
+    if 'reviews' in frame:
+        reviews = pd.to_numeric(text['reviews'], errors='coerce')
+        anomalies['bad_review_count'] = _rows(
+            text['reviews'].notna() & ~(reviews >= 0)
+        )
+    if 'phone' in frame:
+        phone = text['phone'].str.replace(r'\.0$', '', regex=True)
+        anomalies['bad_phone'] = _rows(phone.notna() & ~phone.str.match(PHONE_PATTERN).fillna(False))
+    if 'website' in frame:
+        website = text['website']
+        anomalies['bad_website'] = _rows(website.notna() & ~website.str.match(WEBSITE_PATTERN).fillna(False))
+    if flag_columns:
+        anomalies['no_flags_set'] = _rows(text[flag_columns].isna().all(axis=1))
+
+    return anomalies
+
+
+def profile_workbook(file_path, sample=None, seed=0):
+    """Stream and profile a workbook; returns the report dict"""
+    frame, total_rows, blank_rows = read_frame(file_path, sample=sample, seed=seed)
+    headers = frame.attrs['headers']
+    columns = profile_columns(frame)
+    flag_columns = [column for column, profile in columns.items() if 'yes_ratio' in profile]
+
+    # Flag-like columns (mostly Yes/No) holding something else
+    lowered = frame.astype('string').apply(lambda col: col.str.strip().str.lower())
+    mostly_flags = [
+        column for column, profile in columns.items()
+        if 'yes_ratio' not in profile and profile['non_null']
+        and lowered[column].isin(YES_VALUES | NO_VALUES).sum() >= 0.9 * profile['non_null']
+    ]
+    non_flag_values = {
+        column: lowered[column][lowered[column].notna() & ~lowered[column].isin(YES_VALUES | NO_VALUES)]
+        .value_counts().head(TOP_VALUES).to_dict()
+        for column in mostly_flags
+    }
+
+    return {
+        'file': file_path,
+        'rows': total_rows,
+        'blank_rows': blank_rows,
+        'profiled_rows': len(frame),
+        'sampled': sample is not None and len(frame) < total_rows,
+        'column_count': len(headers),
+        'header_issues': header_issues(headers),
+        'flag_columns': flag_columns,
+        'non_flag_values': {c: {k: int(v) for k, v in vals.items()} for c, vals in non_flag_values.items()},
+        'columns': columns,
+        'anomalies': row_anomalies(frame, flag_columns),
+    }
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Refresh the materialized salon counts per city and state
+
+Runs refresh_city_salon_counts (migrations/013_city_salon_counts.sql),
+which recomputes city_salon_counts in one grouped query without blocking
+readers. state_salon_counts is a plain view over it and needs no refresh.
+Run after any import that adds, removes or publishes salons.
+"""
+from nailnav_etl import get_client, metrics
+
+
+def refresh_city_counts(supabase):
+    """Recompute per-city salon counts; returns the number of cities"""
+    result = supabase.rpc('refresh_city_salon_counts', {}).execute()
+    return result.data or 0
+
+
+def main():
+    print("=" * 80)
+    print("🏙️  REFRESHING CITY SALON COUNTS")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    print("\n🔄 Counting salons per city...")
+    try:
+        with metrics.stage('refresh_city_counts'):
+            cities = refresh_city_counts(supabase)
+    except Exception as e:
+        print(f"❌ Failed to refresh city counts: {e}")
+        print("   Has migrations/013_city_salon_counts.sql been applied?")
+        return
+
+    print(f"✅ Refreshed counts for {cities} cities")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
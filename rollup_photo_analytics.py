@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Fold raw photo_analytics events into hourly and daily summaries
+
+Reads photo_analytics rows past the high-water mark kept in
+photo_analytics_rollup_state (migrations/011_photo_analytics_rollups.sql)
+in (created_at, id) order, sums views and clicks per salon, photo and
+hour / day with pandas, and applies the sums together with the new mark
+through apply_photo_analytics_rollup. Each event is counted exactly once
+however often the job runs.
+
+Events younger than SETTLE_SECONDS are left for the next run, so rows
+from transactions still in flight when the mark advances aren't skipped.
+
+Usage:
+    python rollup_photo_analytics.py                  # catch up once
+    python rollup_photo_analytics.py --interval 300   # every 5 minutes
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from nailnav_etl import get_client, metrics
+
+PAGE_SIZE = 1000
+MAX_EVENTS_PER_BATCH = 50000
+SETTLE_SECONDS = 60
+
+EVENT_COLUMNS = ['id', 'salon_id', 'photo_id', 'views', 'clicks', 'date', 'created_at']
+
+
+def read_mark(supabase):
+    state = supabase.table('photo_analytics_rollup_state').select('last_created_at, last_id').single().execute()
+    return state.data['last_created_at'], state.data['last_id']
+
+
+def fetch_events(supabase, mark, cutoff):
+    """Events after `mark` and before `cutoff` in (created_at, id) order"""
+    import pandas as pd
+
+    last_created_at, last_id = mark
+    rows = []
+    while len(rows) < MAX_EVENTS_PER_BATCH:
+        result = (
+            supabase.table('photo_analytics')
+            .select(', '.join(EVENT_COLUMNS))
+            .or_(f'created_at.gt."{last_created_at}",'
+                 f'and(created_at.eq."{last_created_at}",id.gt.{last_id})')
+            .lt('created_at', cutoff)
+            .order('created_at')
+            .order('id')
+            .limit(PAGE_SIZE)
+            .execute()
+        )
+        rows.extend(result.data)
+        if len(result.data) < PAGE_SIZE:
+            break
+        last_created_at, last_id = result.data[-1]['created_at'], result.data[-1]['id']
+    return pd.DataFrame(rows, columns=EVENT_COLUMNS)
+
+
+def summarize(events):
+    """Return (hourly, daily) lists of summed {salon_id, photo_id, ...} records"""
+    import pandas as pd
+
+    events = events.dropna(subset=['salon_id', 'photo_id']).copy()
+    events[['views', 'clicks']] = events[['views', 'clicks']].fillna(0).astype(int)
+    created_at = pd.to_datetime(events['created_at'], utc=True, format='ISO8601')
+    events['bucket'] = created_at.dt.floor('h').map(lambda ts: ts.isoformat())
+    events['date'] = events['date'].fillna(created_at.dt.date.astype(str))
+
+    def sums(key):
+        grouped = events.groupby(['salon_id', 'photo_id', key], as_index=False)[['views', 'clicks']].sum()
+        return grouped.astype({'views': int, 'clicks': int}).to_dict('records')
+
+    return sums('bucket'), sums('date')
+
+
+def rollup_photo_analytics(supabase):
+    """Apply every settled event past the high-water mark; returns events folded"""
+    cutoff = (datetime.now(timezone.utc) - timedelta(seconds=SETTLE_SECONDS)).isoformat()
+    total = 0
+    while True:
+        mark = read_mark(supabase)
+        events = fetch_events(supabase, mark, cutoff)
+        if events.empty:
+            return total
+
+        hourly, daily = summarize(events)
+        last = events.iloc[-1]
+        supabase.rpc('apply_photo_analytics_rollup', {
+            'hourly': hourly,
+            'daily': daily,
+            'from_created_at': mark[0],
+            'from_id': mark[1],
+            'to_created_at': last['created_at'],
+            'to_id': last['id'],
+        }).execute()
+        total += len(events)
+
+        if len(events) < MAX_EVENTS_PER_BATCH:
+            return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Roll photo analytics events into summaries')
+    parser.add_argument('--interval', type=int, default=0,
+                        help='Seconds between rollups; 0 runs once')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("📸 ROLLING UP PHOTO ANALYTICS")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    while True:
+        try:
+            with metrics.stage('rollup_photo_analytics'):
+                events = rollup_photo_analytics(supabase)
+            print(f"✅ {time.strftime('%Y-%m-%d %H:%M:%S')} folded {events} events")
+        except Exception as e:
+            print(f"❌ Rollup failed: {e}")
+            print("   Has migrations/011_photo_analytics_rollups.sql been applied?")
+            if not args.interval:
+                return
+
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Roll buffered salon page views up into view counters
+
+Salon detail pages append a row to salon_view_events instead of bumping
+salons.view_count (migrations/010_salon_view_events.sql). Each run takes
+the buffer up to its current high-water id and calls
+rollup_salon_view_events, which aggregates the events per salon and day,
+adds them to salon_view_daily and salons.view_count in one bulk statement,
+and clears them from the buffer. Writes per run scale with the number of
+salons viewed, not the number of views.
+
+Usage:
+    python rollup_view_events.py                  # one rollup
+    python rollup_view_events.py --interval 300   # every 5 minutes
+"""
+import argparse
+import time
+
+from nailnav_etl import get_client, metrics
+
+
+def rollup_view_events(supabase):
+    """Apply all buffered views up to the current high-water id; returns views applied"""
+    latest = (
+        supabase.table('salon_view_events')
+        .select('id')
+        .order('id', desc=True)
+        .limit(1)
+        .execute()
+    )
+    if not latest.data:
+        return 0
+
+    result = supabase.rpc('rollup_salon_view_events', {'through_id': latest.data[0]['id']}).execute()
+    return result.data or 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Roll buffered salon views into counters')
+    parser.add_argument('--interval', type=int, default=0,
+                        help='Seconds between rollups; 0 runs once')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("👀 ROLLING UP SALON VIEWS")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    while True:
+        try:
+            with metrics.stage('rollup_view_events'):
+                views = rollup_view_events(supabase)
+            print(f"✅ {time.strftime('%Y-%m-%d %H:%M:%S')} applied {views} views")
+        except Exception as e:
+            print(f"❌ Rollup failed: {e}")
+            print("   Has migrations/010_salon_view_events.sql been applied?")
+            if not args.interval:
+                return
+
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,125 @@
 #!/usr/bin/env python3
 """
-Run the schema migration to fix database structure
+Apply pending schema migrations
+
+Reads the migrations already recorded in schema_migrations once, then
+applies every newer file in migrations/ in name order. Each file is split
+into statements with sql_statements.split_statements and sent in a single
+apply_migration call (migrations/015_migration_runner.sql), which runs the
+whole file in one transaction and records it, so a failing statement
+leaves nothing half-applied and the next run skips everything recorded.
+Applying a migration clears the local column cache (schema_cache.py).
+
+migrations/015_migration_runner.sql installs the runner itself and has to
+be pasted into the Supabase SQL Editor once. Files that were applied by
+hand before that can be recorded without re-running them via --baseline.
+
+Usage:
+    python run_schema_migration.py               # apply pending migrations
+    python run_schema_migration.py --dry-run     # list what would run
+    python run_schema_migration.py --baseline 015
 """
+import argparse
+import glob
+import hashlib
 import os
-from dotenv import load_dotenv
-from supabase import create_client, Client
 
-load_dotenv('.env.local')
+from nailnav_etl import get_client
+from schema_cache import invalidate
+from sql_statements import split_statements
+
+MIGRATIONS_DIR = 'migrations'
+RUNNER_MIGRATION = '015_migration_runner.sql'
+
+
+def migration_files():
+    """[(name, sql)] for every migration file, in apply order"""
+    files = []
+    for path in sorted(glob.glob(os.path.join(MIGRATIONS_DIR, '*.sql'))):
+        with open(path) as f:
+            files.append((os.path.basename(path), f.read()))
+    return files
+
+
+def checksum(sql):
+    return hashlib.sha256(sql.encode('utf-8')).hexdigest()
+
+
+def applied_migrations(supabase):
+    """{name: checksum} of recorded migrations"""
+    result = supabase.table('schema_migrations').select('name, checksum').execute()
+    return {row['name']: row['checksum'] for row in result.data}
+
 
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+def run_migrations(supabase, baseline=None, dry_run=False):
+    """Apply (or, up to `baseline`, just record) pending migrations; returns names handled"""
+    applied = applied_migrations(supabase)
+    handled = []
+
+    for name, sql in migration_files():
+        digest = checksum(sql)
+        if name in applied:
+            if applied[name] != digest:
+                print(f"  ⚠️  {name} changed since it was applied; not re-running")
+            continue
+
+        statements = split_statements(sql)
+        record_only = baseline is not None and name[:len(baseline)] <= baseline
+        action = 'record' if record_only else f'apply {len(statements)} statements'
+        if dry_run:
+            print(f"  • {name}: would {action}")
+            handled.append(name)
+            continue
+
+        result = supabase.rpc('apply_migration', {
+            'migration_name': name,
+            'migration_checksum': digest,
+            'statements': statements,
+            'record_only': record_only,
+        }).execute()
+        if result.data:
+            print(f"  ✅ {name}: {'recorded' if record_only else f'applied {len(statements)} statements'}")
+            handled.append(name)
+            if not record_only:
+                # The migration may have added columns the local cache lacks
+                invalidate()
+        else:
+            print(f"  ⏭️  {name}: already applied by another runner")
+
+    return handled
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply pending schema migrations')
+    parser.add_argument('--dry-run', action='store_true', help='List pending migrations without running them')
+    parser.add_argument('--baseline', metavar='PREFIX',
+                        help='Record migrations up to this name prefix (e.g. 015) as applied without running them')
+    args = parser.parse_args()
 
-def run_migration():
     print("=" * 80)
-    print("🚀 RUNNING SCHEMA MIGRATION")
+    print("🚀 RUNNING SCHEMA MIGRATIONS")
     print("=" * 80)
-    
-    # Read migration file
-    print("\n📂 Reading migration file...")
-    with open('migrations/001_fix_schema_for_integration.sql', 'r') as f:
-        sql_content = f.read()
-    
-    # Split into individual statements (rough split by semicolon)
-    statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip() and not stmt.strip().startswith('--')]
-    
-    print(f"✅ Found {len(statements)} SQL statements to execute")
-    print("\n⚠️  IMPORTANT: This migration should be run in Supabase SQL Editor")
-    print("   Reason: Complex SQL with functions and procedures")
-    print("\n📋 Instructions:")
-    print("   1. Go to: https://supabase.com/dashboard/project/bmlvjgulciphdqyqucxv/sql/new")
-    print("   2. Copy the contents of: migrations/001_fix_schema_for_integration.sql")
-    print("   3. Paste into SQL Editor")
-    print("   4. Click 'Run' button")
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    print("\n📂 Checking migrations...")
+    try:
+        handled = run_migrations(supabase, baseline=args.baseline, dry_run=args.dry_run)
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        print(f"   Has {MIGRATIONS_DIR}/{RUNNER_MIGRATION} been run in the Supabase SQL Editor?")
+        print("   A failed file is rolled back entirely; fix it and run again.")
+        return
+
     print("\n" + "=" * 80)
-    print("✅ Migration file ready at: migrations/001_fix_schema_for_integration.sql")
+    if args.dry_run:
+        print(f"📋 {len(handled)} migrations pending")
+    else:
+        print(f"✅ {len(handled)} migrations handled, database is up to date")
     print("=" * 80)
 
+
 if __name__ == "__main__":
-    run_migration()
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Locally cached column sets for Supabase tables
+
+table_columns() fetches a table's columns once through the table_columns
+RPC (migrations/014_table_columns.sql) and caches them in
+.schema_cache.json with the schema version stamp and fetch time. Later
+runs read the cache until it is older than CACHE_MAX_AGE, so importers
+can validate payload columns without a round trip. Anything that changes
+the schema should call invalidate() so the next read refetches.
+
+Where a stale answer would do harm, the cached stamp is checked against
+table_schema_version first and the columns are refetched only if it
+moved: unknown_columns does this before reporting a column the cache
+doesn't know about, and pending_ddl before skipping any DDL.
+"""
+import json
+import os
+import re
+import time
+
+CACHE_FILE = '.schema_cache.json'
+CACHE_FORMAT = 1
+CACHE_MAX_AGE = 24 * 60 * 60
+
+ADD_COLUMN_PATTERN = re.compile(
+    r'ALTER\s+TABLE\s+(?:public\.)?(\w+)\s+ADD\s+COLUMN\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)',
+    re.IGNORECASE,
+)
+
+
+def _load_cache():
+    if not os.path.exists(CACHE_FILE):
+        return {}
+    try:
+        with open(CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get('tables', {}) if cache.get('format') == CACHE_FORMAT else {}
+
+
+def _save_cache(tables):
+    with open(CACHE_FILE, 'w') as f:
+        json.dump({'format': CACHE_FORMAT, 'tables': tables}, f, indent=2)
+
+
+def table_columns(supabase, table='salons', max_age=CACHE_MAX_AGE, refresh=False, verify=False):
+    """
+    Return {column: data_type} for `table`, from the cache when fresh.
+
+    With verify=True a fresh entry is only used if its version stamp still
+    matches the database's; otherwise the columns are refetched.
+    """
+    tables = _load_cache()
+    entry = tables.get(table)
+    if entry and not refresh and time.time() - entry['fetched_at'] < max_age:
+        if not verify:
+            return entry['columns']
+        version = supabase.rpc('table_schema_version', {'target_table': table}).execute().data
+        if version == entry['version']:
+            return entry['columns']
+
+    result = supabase.rpc('table_columns', {'target_table': table}).execute()
+    columns = {column['name']: column['data_type'] for column in result.data['columns']}
+    if not columns:
+        raise ValueError(f"Table {table} not found")
+
+    tables[table] = {
+        'version': result.data['version'],
+        'fetched_at': time.time(),
+        'columns': columns,
+    }
+    _save_cache(tables)
+    return columns
+
+
+def schema_version(table='salons'):
+    """Version stamp of the cached column set, or None if not cached"""
+    return _load_cache().get(table, {}).get('version')
+
+
+def invalidate(table=None):
+    """Drop one table, or every table, from the cache"""
+    tables = _load_cache()
+    if table is None:
+        tables = {}
+    else:
+        tables.pop(table, None)
+    _save_cache(tables)
+
+
+def unknown_columns(supabase, columns, table='salons'):
+    """
+    Columns of a payload that don't exist in `table`, in input order.
+
+    A column the cached set lacks may have been added since it was
+    cached, so the version stamp is checked (and the set refetched if it
+    moved) before any column is reported.
+    """
+    columns = list(columns)
+    existing = table_columns(supabase, table)
+    if any(column not in existing for column in columns):
+        existing = table_columns(supabase, table, verify=True)
+    return [column for column in columns if column not in existing]
+
+
+def pending_ddl(supabase, statements):
+    """
+    Drop ADD COLUMN statements whose column already exists.
+
+    Other statements are kept as-is, since their effect can't be checked
+    from the column set. Each table's cached set is checked against its
+    version stamp once, so a column dropped since it was cached is added
+    back rather than skipped.
+    """
+    verified = {}
+    pending = []
+    for statement in statements:
+        match = ADD_COLUMN_PATTERN.search(statement)
+        if match:
+            table = match.group(1)
+            if table not in verified:
+                verified[table] = table_columns(supabase, table, verify=True)
+            if match.group(2) in verified[table]:
+                continue
+        pending.append(statement)
+    return pending
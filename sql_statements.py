@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Split a SQL script into individual statements
+
+Unlike sql.split(';'), split_statements understands the parts of
+PostgreSQL syntax where a semicolon doesn't end a statement:
+
+- dollar-quoted bodies ($$ ... $$, $fn$ ... $fn$) of functions and DO blocks
+- single-quoted strings ('it''s'), including E'...' backslash escapes
+- double-quoted identifiers
+- -- line comments and nested /* block */ comments
+
+Comments are dropped from the output. Top-level BEGIN / COMMIT statements
+are dropped too, since callers run each script in their own transaction.
+"""
+import re
+
+DOLLAR_TAG = re.compile(r'\$([A-Za-z_][A-Za-z0-9_]*)?\$')
+TRANSACTION_CONTROL = re.compile(
+    r'^(BEGIN|START\s+TRANSACTION|COMMIT|END)(\s+(WORK|TRANSACTION))?$', re.IGNORECASE
+)
+
+
+def split_statements(sql):
+    """Return the statements of a SQL script, without comments or trailing ';'"""
+    statements = []
+    current = []
+    i = 0
+    n = len(sql)
+
+    def flush():
+        statement = ''.join(current).strip()
+        current.clear()
+        if statement and not TRANSACTION_CONTROL.match(statement):
+            statements.append(statement)
+
+    while i < n:
+        ch = sql[i]
+
+        if ch == '-' and sql.startswith('--', i):
+            end = sql.find('\n', i)
+            i = n if end == -1 else end
+            continue
+
+        if ch == '/' and sql.startswith('/*', i):
+            depth = 0
+            while i < n:
+                if sql.startswith('/*', i):
+                    depth += 1
+                    i += 2
+                elif sql.startswith('*/', i):
+                    depth -= 1
+                    i += 2
+                    if depth == 0:
+                        break
+                else:
+                    i += 1
+            current.append(' ')
+            continue
+
+        if ch == "'":
+            escapes = i > 0 and sql[i - 1] in 'eE' and (i < 2 or not (sql[i - 2].isalnum() or sql[i - 2] == '_'))
+            j = i + 1
+            while j < n:
+                if escapes and sql[j] == '\\':
+                    j += 2
+                    continue
+                if sql[j] == "'":
+                    if sql.startswith("''", j):
+                        j += 2
+                        continue
+                    break
+                j += 1
+            current.append(sql[i:j + 1])
+            i = j + 1
+            continue
+
+        if ch == '"':
+            j = i + 1
+            while j < n:
+                if sql[j] == '"':
+                    if sql.startswith('""', j):
+                        j += 2
+                        continue
+                    break
+                j += 1
+            current.append(sql[i:j + 1])
+            i = j + 1
+            continue
+
+        if ch == '$':
+            match = DOLLAR_TAG.match(sql, i)
+            # $1-style parameters and identifiers containing $ aren't quotes
+            if match and not (i > 0 and (sql[i - 1].isalnum() or sql[i - 1] == '_')):
+                tag = match.group(0)
+                end = sql.find(tag, match.end())
+                end = n if end == -1 else end + len(tag)
+                current.append(sql[i:end])
+                i = end
+                continue
+
+        if ch == ';':
+            flush()
+            i += 1
+            continue
+
+        current.append(ch)
+        i += 1
+
+    flush()
+    return statements
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { supabase } from '@/lib/supabase'
+import { normalizeSearchText } from '@/lib/utils/searchText'
 
 export async function GET(request: NextRequest) {
   try {
@@ -18,9 +19,10 @@ export async function GET(request: NextRequest) {
       .order('name', { ascending: true })
       .limit(limit)
 
-    // If search query provided, filter cities
-    if (search) {
-      query = query.ilike('name', `%${search}%`)
+    // If search query provided, filter cities on the trigram-indexed column
+    const searchTerm = search ? normalizeSearchText(search) : ''
+    if (searchTerm) {
+      query = query.like('search_name', `%${searchTerm}%`)
     }
 
     // If state filter provided, get state ID first
@@ -46,21 +48,31 @@ export async function GET(request: NextRequest) {
       )
     }
 
-    // Fetch state names for the cities
+    // Fetch state names and published salon counts (the city_salon_counts
+    // materialized view, migrations/013) for the cities
     const stateIds = [...new Set(cities?.map(c => c.state_id) || [])]
-    const { data: states } = await supabase
-      .from('states')
-      .select('id, code, name')
-      .in('id', stateIds)
+    const cityIds = cities?.map(c => c.id) || []
+    const [{ data: states }, { data: counts }] = await Promise.all([
+      supabase
+        .from('states')
+        .select('id, code, name')
+        .in('id', stateIds),
+      supabase
+        .from('city_salon_counts')
+        .select('city_id, salon_count')
+        .in('city_id', cityIds)
+    ])
 
     const stateMap = new Map(states?.map(s => [s.id, s]) || [])
+    const countMap = new Map(counts?.map(c => [c.city_id, c.salon_count]) || [])
 
     // Transform cities with state info
     const transformedCities = (cities || []).map(city => ({
       id: city.id,
       name: city.name,
       state_id: city.state_id,
-      state: stateMap.get(city.state_id)?.code || 'Unknown'
+      state: stateMap.get(city.state_id)?.code || 'Unknown',
+      salon_count: countMap.get(city.id) || 0
     }))
 
     return NextResponse.json({
@@ -1,5 +1,66 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { supabase } from '@/lib/supabase'
+import { filterMask } from '@/lib/utils/filterBits'
+import { normalizeSearchText } from '@/lib/utils/searchText'
+import { openNowFilter } from '@/lib/utils/openMinutes'
+import { cursorParams, decodeListingCursor, encodeListingCursor } from '@/lib/utils/listingCursor'
+
+// Filter option labels -> database boolean columns (EXACT Excel match)
+const SERVICE_COLUMNS: Record<string, string> = {
+  'Manicure': 'manicure',
+  'Gel Manicure': 'gel_manicure',
+  'Gel Extensions': 'gel_extensions',
+  'Shellac / Acrylic Nails': 'acrylic_nails',  // RENAMED
+  'Pedicure': 'pedicure',
+  'Gel Pedicure': 'gel_pedicure',
+  'SNS / Dip Powder': 'sns_dip_powder',  // RENAMED
+  'BIAB / Builders Gel': 'builders_gel_biab',  // RENAMED
+  'Nail Art': 'nail_art',
+  'Massage': 'massage',
+  'Facials': 'facials',
+  'Lash Exensions': 'lash_extensions',  // typo in Excel
+  'Lash Lift and Tint': 'lash_lift_tint',
+  'Brows': 'brows',
+  'Waxing': 'waxing',
+  'Haircuts': 'haircuts',
+  'Spa Hand and Foot Treatment': 'spa_hand_foot_treatment'
+}
+
+const SPECIALTY_COLUMNS: Record<string, string> = {
+  'Qualified technicians': 'qualified_technicians',
+  'Experienced Team': 'experienced_team',
+  'Quick Service': 'quick_service',
+  'Award winning staff': 'award_winning_staff',
+  'Master Nail Artist': 'master_nail_artist',
+  'Bridal Nails': 'bridal_nails'
+}
+
+const LANGUAGE_COLUMNS: Record<string, string> = {
+  'en': 'english',
+  'es': 'spanish',
+  'vi': 'vietnamese',
+  'zh': 'chinese',
+  'ko': 'korean'
+}
+
+const AMENITY_COLUMNS: Record<string, string> = {
+  'Child Friendly': 'child_friendly',
+  'Pet Friendly': 'pet_friendly',
+  'LGBTQI+ Friendly': 'lgbtqi_friendly',
+  'Wheel Chair Accessable': 'wheelchair_accessible',  // typo in Excel
+  'Complimentary drink': 'complimentary_drink',
+  'Heated Massage Chairs': 'heated_massage_chairs',
+  'Foot Spas': 'foot_spas',
+  'Free Wi-fi': 'free_wifi',
+  'Parking': 'parking',
+  'Autoclave sterlisation': 'autoclave_sterilisation',  // typo in Excel
+  'LED Curing': 'led_curing',
+  'Clean & Ethical Products': 'clean_ethical_products',
+  'Vegan Polish': 'vegan_polish'
+}
+
+const columnsFor = (param: string | null, columns: Record<string, string>) =>
+  (param ? param.split(',') : []).map(value => columns[value]).filter(Boolean)
 
 export async function GET(request: NextRequest) {
   try {
@@ -9,6 +70,13 @@ export async function GET(request: NextRequest) {
     const state = searchParams.get('state')
     const limit = parseInt(searchParams.get('limit') || '20')
     const offset = parseInt(searchParams.get('offset') || '0')
+
+    // Keyset pagination: an opaque cursor from the previous page's nextCursor
+    const cursorParam = searchParams.get('cursor')
+    const cursor = cursorParam ? decodeListingCursor(cursorParam) : null
+    if (cursorParam && !cursor) {
+      return NextResponse.json({ error: 'Invalid cursor' }, { status: 400 })
+    }
     
     // Geographic bounding box parameters for map-based search
     const bounds = searchParams.get('bounds')
@@ -29,10 +97,29 @@ export async function GET(request: NextRequest) {
     const priceRange = searchParams.get('priceRange')
     const walkIns = searchParams.get('walkIns') === 'true'
     const parking = searchParams.get('parking') === 'true'
+    const openNow = searchParams.get('openNow') === 'true'
     
+    // Services, specialties and languages match ANY option in their group,
+    // amenities must ALL match. Each group is packed into a filter_mask bit
+    // set and tested server-side by salons_matching_filters (migrations/004),
+    // or by salon_listing_page (migrations/009), which also applies the cursor.
+    const allMask = filterMask(columnsFor(amenities, AMENITY_COLUMNS))
+    const anyMasks = [
+      filterMask(columnsFor(services, SERVICE_COLUMNS)),
+      filterMask(columnsFor(specialties, SPECIALTY_COLUMNS)),
+      filterMask(columnsFor(languages, LANGUAGE_COLUMNS))
+    ].filter(mask => mask > 0)
+
+    // A cursor page skips the exact count, which would scan every match
+    const countOptions = cursor ? {} : { count: 'exact' as const }
+    const source: any = cursor
+      ? supabase.rpc('salon_listing_page', { ...cursorParams(cursor), all_mask: allMask, any_masks: anyMasks })
+      : allMask > 0 || anyMasks.length > 0
+        ? supabase.rpc('salons_matching_filters', { all_mask: allMask, any_masks: anyMasks }, countOptions)
+        : supabase.from('salons')
+
     // Build query with city join - UPDATED with all Excel columns
-    let query = supabase
-      .from('salons')
+    let query = source
       .select(`
         id,
         name,
@@ -51,6 +138,7 @@ export async function GET(request: NextRequest) {
         is_verified,
         is_featured,
         is_published,
+        rank_score,
         parking,
         accepts_walk_ins,
         opening_hours,
@@ -112,7 +200,7 @@ export async function GET(request: NextRequest) {
         customers_saying,
         health_wellbeing_care,
         created_at
-      `, { count: 'exact' })
+      `, countOptions)
       .eq('is_published', true)
     
     // Apply filters
@@ -120,12 +208,16 @@ export async function GET(request: NextRequest) {
       query = query.eq('is_featured', true)
     }
     
-    if (city) {
+    // Text filters match the normalized, trigram-indexed search_* columns
+    const cityTerm = city ? normalizeSearchText(city) : ''
+    const stateTerm = state ? normalizeSearchText(state) : ''
+
+    if (cityTerm) {
       // Search by city name - check cities table first
       const cityResult = await supabase
         .from('cities')
         .select('id, name, state_id')
-        .ilike('name', `%${city}%`)
+        .like('search_name', `%${cityTerm}%`)
       
       if (cityResult.data && cityResult.data.length > 0) {
         // Found matching city/cities - use city_id filter
@@ -134,39 +226,12 @@ export async function GET(request: NextRequest) {
       } else {
         // No city found - search in address field for suburbs
         // This handles searches like "Bondi", "Surry Hills", etc.
-        query = query.ilike('address', `%${city}%`)
+        query = query.like('search_address', `%${cityTerm}%`)
       }
     }
     
-    if (state) {
-      query = query.ilike('state', `%${state}%`)
-    }
-    
-    // Service filters - map service names to database boolean columns (EXACT Excel match)
-    if (services) {
-      const serviceList = services.split(',')
-      const serviceMap: Record<string, string> = {
-        'Manicure': 'manicure',
-        'Gel Manicure': 'gel_manicure',
-        'Gel Extensions': 'gel_extensions',
-        'Shellac / Acrylic Nails': 'acrylic_nails',  // RENAMED
-        'Pedicure': 'pedicure',
-        'Gel Pedicure': 'gel_pedicure',
-        'SNS / Dip Powder': 'sns_dip_powder',  // RENAMED
-        'BIAB / Builders Gel': 'builders_gel_biab',  // RENAMED
-        'Nail Art': 'nail_art',
-        'Massage': 'massage',
-        'Facials': 'facials',
-        'Lash Exensions': 'lash_extensions',  // typo in Excel
-        'Lash Lift and Tint': 'lash_lift_tint',
-        'Brows': 'brows',
-        'Waxing': 'waxing',
-        'Haircuts': 'haircuts',
-        'Spa Hand and Foot Treatment': 'spa_hand_foot_treatment'
-      }
-      
-      // For multiple services, we want salons that have ANY of them (OR logic)
-      // We'll filter in memory after fetching results for now
+    if (stateTerm) {
+      query = query.like('search_state', `%${stateTerm}%`)
     }
     
     // Price range filter
@@ -175,12 +240,6 @@ export async function GET(request: NextRequest) {
       query = query.in('price_range', ranges)
     }
     
-    // Specialty filters - map to database columns
-    if (specialties) {
-      const specialtyList = specialties.split(',')
-      // Similar to services, these map to boolean columns
-    }
-    
     // Amenity filters
     if (walkIns) {
       query = query.eq('accepts_walk_ins', true)
@@ -189,33 +248,10 @@ export async function GET(request: NextRequest) {
     if (parking) {
       query = query.eq('parking', true)
     }
-    
-    // Amenity mapping
-    if (amenities) {
-      const amenityList = amenities.split(',')
-      const amenityMap: Record<string, string> = {
-        'Child Friendly': 'child_friendly',
-        'Pet Friendly': 'pet_friendly',
-        'LGBTQI+ Friendly': 'lgbtqi_friendly',
-        'Wheel Chair Accessable': 'wheelchair_accessible',  // typo in Excel
-        'Complimentary drink': 'complimentary_drink',
-        'Heated Massage Chairs': 'heated_massage_chairs',
-        'Foot Spas': 'foot_spas',
-        'Free Wi-fi': 'free_wifi',
-        'Parking': 'parking',
-        'Autoclave sterlisation': 'autoclave_sterilisation',  // typo in Excel
-        'LED Curing': 'led_curing',
-        'Clean & Ethical Products': 'clean_ethical_products',
-        'Vegan Polish': 'vegan_polish'
-      }
-      
-      // Apply each amenity filter
-      amenityList.forEach(amenity => {
-        const dbColumn = amenityMap[amenity]
-        if (dbColumn) {
-          query = query.eq(dbColumn, true)
-        }
-      })
+
+    // Open right now, matched against the GiST-indexed open_minutes ranges
+    if (openNow) {
+      query = query.or(openNowFilter())
     }
     
     // Geographic bounding box filter (map viewport)
@@ -230,12 +266,16 @@ export async function GET(request: NextRequest) {
         .not('longitude', 'is', null)
     }
     
-    // Order and pagination
+    // Order and pagination - walks idx_salons_listing_rank (migrations/009).
+    // With a cursor the scan seeks to the previous page's last row, so
+    // deep pages cost the same as the first one.
     query = query
       .order('is_featured', { ascending: false })
-      .order('rating', { ascending: false })
-      .order('name', { ascending: true })
-      .range(offset, offset + limit - 1)
+      .order('rank_score', { ascending: false })
+      .order('id', { ascending: false })
+    query = cursor
+      ? query.limit(limit)
+      : query.range(offset, offset + limit - 1)
 
     const { data: salons, error, count } = await query
 
@@ -250,78 +290,8 @@ export async function GET(request: NextRequest) {
       )
     }
 
-    // Post-process filters for services and specialties (OR logic)
-    let filteredSalons = salons || []
-    
-    if (services) {
-      const serviceList = services.split(',')
-      const serviceMap: Record<string, string> = {
-        'Manicure': 'manicure',
-        'Gel Manicure': 'gel_manicure',
-        'Gel Extensions': 'gel_extensions',
-        'Shellac / Acrylic Nails': 'acrylic_nails',  // RENAMED
-        'Pedicure': 'pedicure',
-        'Gel Pedicure': 'gel_pedicure',
-        'SNS / Dip Powder': 'sns_dip_powder',  // RENAMED
-        'BIAB / Builders Gel': 'builders_gel_biab',  // RENAMED
-        'Nail Art': 'nail_art',
-        'Massage': 'massage',
-        'Facials': 'facials',
-        'Lash Exensions': 'lash_extensions',
-        'Lash Lift and Tint': 'lash_lift_tint',
-        'Brows': 'brows',
-        'Waxing': 'waxing',
-        'Haircuts': 'haircuts',
-        'Spa Hand and Foot Treatment': 'spa_hand_foot_treatment'
-      }
-      
-      filteredSalons = filteredSalons.filter((salon: any) => {
-        return serviceList.some(service => {
-          const dbColumn = serviceMap[service]
-          return dbColumn && salon[dbColumn] === true
-        })
-      })
-    }
-    
-    if (specialties) {
-      const specialtyList = specialties.split(',')
-      const specialtyMap: Record<string, string> = {
-        'Qualified technicians': 'qualified_technicians',
-        'Experienced Team': 'experienced_team',
-        'Quick Service': 'quick_service',
-        'Award winning staff': 'award_winning_staff',
-        'Master Nail Artist': 'master_nail_artist',
-        'Bridal Nails': 'bridal_nails'
-      }
-      
-      filteredSalons = filteredSalons.filter((salon: any) => {
-        return specialtyList.some(specialty => {
-          const dbColumn = specialtyMap[specialty]
-          return dbColumn && salon[dbColumn] === true
-        })
-      })
-    }
-    
-    if (languages) {
-      const languageList = languages.split(',')
-      const languageMap: Record<string, string> = {
-        'en': 'english',
-        'es': 'spanish',
-        'vi': 'vietnamese',
-        'zh': 'chinese',
-        'ko': 'korean'
-      }
-      
-      filteredSalons = filteredSalons.filter((salon: any) => {
-        return languageList.some(language => {
-          const dbColumn = languageMap[language]
-          return dbColumn && salon[dbColumn] === true
-        })
-      })
-    }
-
     // Transform data - ONLY REAL DATA FROM DATABASE
-    const transformedSalons = (filteredSalons || []).map((salon: any) => ({
+    const transformedSalons = (salons || []).map((salon: any) => ({
       id: salon.id,
       name: salon.name,
       slug: salon.slug,
@@ -401,6 +371,7 @@ export async function GET(request: NextRequest) {
       total: transformedSalons.length,
       limit,
       offset,
+      nextCursor: salons && salons.length === limit ? encodeListingCursor(salons[salons.length - 1]) : null,
       success: true
     })
   } catch (error) {
@@ -6,6 +6,7 @@ import {
   BarChart3, TrendingUp, Users, Eye, Phone, MapPin, Clock, Star, 
   Calendar, Download, Filter, Crown, ArrowUp, ArrowDown, Minus 
 } from 'lucide-react'
+import { PhotoAnalyticsService, type PhotoEngagementPoint } from '@/lib/api/photoAnalytics'
 
 interface AnalyticsData {
   overview: {
@@ -50,6 +51,7 @@ interface AnalyticsData {
     priceRange: string
     marketShare: number
   }>
+  photoEngagement: PhotoEngagementPoint[]
 }
 
 interface AdvancedAnalyticsProps {
@@ -77,6 +79,9 @@ export const AdvancedAnalytics = ({
   const loadAnalyticsData = async () => {
     setLoading(true)
     try {
+      // Photo engagement comes from the pre-aggregated daily rollup
+      const photoEngagement = await PhotoAnalyticsService.getDailyEngagement(salonId, parseInt(dateRange) || 30)
+
       // Mock data for demonstration - replace with actual API call
       const mockData: AnalyticsData = {
         overview: {
@@ -130,11 +135,10 @@ export const AdvancedAnalytics = ({
           { name: 'Quick Nails Express', rating: 4.2, priceRange: '$', marketShare: 18 },
           { name: 'Elegant Nail Studio', rating: 4.6, priceRange: '$$', marketShare: 15 },
           { name: 'Premium Nail Bar', rating: 4.5, priceRange: '$$$', marketShare: 12 }
-        ]
+        ],
+        photoEngagement: photoEngagement.data || []
       }
 
-      // Simulate API delay
-      await new Promise(resolve => setTimeout(resolve, 1000))
       setData(mockData)
     } catch (error) {
       console.error('Failed to load analytics:', error)
@@ -382,6 +386,34 @@ export const AdvancedAnalytics = ({
         </div>
       </motion.div>
 
+      {/* Photo Engagement */}
+      {data.photoEngagement.length > 0 && (
+        <motion.div
+          initial={{ opacity: 0, y: 20 }}
+          animate={{ opacity: 1, y: 0 }}
+          transition={{ delay: 0.45 }}
+          className="bg-white rounded-lg shadow-sm border border-gray-200 p-6"
+        >
+          <h3 className="text-lg font-semibold text-gray-900 mb-4">Photo Engagement</h3>
+          <div className="grid grid-cols-3 gap-4">
+            {(() => {
+              const views = data.photoEngagement.reduce((sum, day) => sum + day.views, 0)
+              const clicks = data.photoEngagement.reduce((sum, day) => sum + day.clicks, 0)
+              return [
+                ['Photo Views', views.toLocaleString()],
+                ['Photo Clicks', clicks.toLocaleString()],
+                ['Click Rate', views ? `${((clicks / views) * 100).toFixed(1)}%` : '-']
+              ].map(([label, value]) => (
+                <div key={label}>
+                  <p className="text-sm text-gray-600">{label}</p>
+                  <p className="text-xl font-bold text-gray-900">{value}</p>
+                </div>
+              ))
+            })()}
+          </div>
+        </motion.div>
+      )}
+
       <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
         {/* Top Services */}
         <motion.div
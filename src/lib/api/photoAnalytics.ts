@@ -0,0 +1,46 @@
+import { supabase, type ApiResponse } from '../supabase'
+
+export interface PhotoEngagementPoint {
+  date: string
+  views: number
+  clicks: number
+}
+
+export class PhotoAnalyticsService {
+  /**
+   * Daily photo views and clicks for a salon, read from the
+   * photo_analytics_daily rollup (rollup_photo_analytics.py)
+   */
+  static async getDailyEngagement(salonId: string, days = 30): Promise<ApiResponse<PhotoEngagementPoint[]>> {
+    try {
+      const since = new Date(Date.now() - (days - 1) * 24 * 60 * 60 * 1000).toISOString().split('T')[0]
+
+      const { data, error } = await supabase
+        .from('photo_analytics_daily')
+        .select('date, views, clicks')
+        .eq('salon_id', salonId)
+        .gte('date', since)
+        .order('date', { ascending: true })
+
+      if (error) throw error
+
+      // One row per photo per day - sum the photos
+      const byDate = new Map<string, PhotoEngagementPoint>()
+      for (const row of data || []) {
+        const point = byDate.get(row.date) || { date: row.date, views: 0, clicks: 0 }
+        point.views += row.views
+        point.clicks += row.clicks
+        byDate.set(row.date, point)
+      }
+
+      return {
+        data: Array.from(byDate.values())
+      }
+    } catch (error) {
+      console.error('Error fetching photo engagement:', error)
+      return {
+        error: 'Failed to fetch photo engagement'
+      }
+    }
+  }
+}
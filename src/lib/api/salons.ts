@@ -64,26 +64,12 @@ export class SalonService {
 
       if (error) throw error
 
-      // Calculate averages and review counts for each salon
-      const salonsWithStats = await Promise.all(
-        (data || []).map(async (salon) => {
-          const { data: reviews } = await supabase
-            .from('reviews')
-            .select('rating')
-            .eq('salon_id', salon.id)
-            .eq('is_published', true)
-
-          const average_rating = reviews?.length 
-            ? Number((reviews.reduce((sum, r) => sum + r.rating, 0) / reviews.length).toFixed(2))
-            : 0
-
-          return {
-            ...salon,
-            average_rating,
-            review_count: reviews?.length || 0
-          } as SalonWithDetails
-        })
-      )
+      // Review stats are stored on each salon row (migrations/002)
+      const salonsWithStats = (data || []).map(salon => ({
+        ...salon,
+        average_rating: Number(salon.average_rating) || 0,
+        review_count: salon.review_count || 0
+      }) as SalonWithDetails)
 
       return {
         data: {
@@ -134,25 +120,8 @@ export class SalonService {
       if (error) throw error
       if (!data) return { error: 'Salon not found' }
 
-      // Calculate average rating and review count
-      const { data: reviews } = await supabase
-        .from('reviews')
-        .select('rating')
-        .eq('salon_id', data.id)
-        .eq('is_published', true)
-
-      const average_rating = reviews?.length 
-        ? Number((reviews.reduce((sum, r) => sum + r.rating, 0) / reviews.length).toFixed(2))
-        : 0
-
-      const salonWithStats: SalonWithDetails = {
-        ...data,
-        average_rating,
-        review_count: reviews?.length || 0
-      }
-
       return {
-        data: salonWithStats
+        data: SalonService.withReviewSnapshot(data)
       }
     } catch (error) {
       console.error('Error fetching salon:', error)
@@ -162,6 +131,20 @@ export class SalonService {
     }
   }
 
+  /**
+   * Expand the precomputed review snapshot into reviews and stats
+   */
+  private static withReviewSnapshot(salon: SalonWithDetails): SalonWithDetails {
+    const snapshot = salon.review_snapshot
+
+    return {
+      ...salon,
+      reviews: snapshot?.reviews || [],
+      average_rating: Number(snapshot?.average_rating) || 0,
+      review_count: snapshot?.review_count || 0
+    }
+  }
+
   /**
    * Get salon by ID with full details
    */
@@ -172,25 +155,8 @@ export class SalonService {
       if (error) throw error
       if (!data) return { error: 'Salon not found' }
 
-      // Calculate average rating and review count
-      const { data: reviews } = await supabase
-        .from('reviews')
-        .select('rating')
-        .eq('salon_id', data.id)
-        .eq('is_published', true)
-
-      const average_rating = reviews?.length 
-        ? Number((reviews.reduce((sum, r) => sum + r.rating, 0) / reviews.length).toFixed(2))
-        : 0
-
-      const salonWithStats: SalonWithDetails = {
-        ...data,
-        average_rating,
-        review_count: reviews?.length || 0
-      }
-
       return {
-        data: salonWithStats
+        data: SalonService.withReviewSnapshot(data)
       }
     } catch (error) {
       console.error('Error fetching salon:', error)
@@ -201,21 +167,22 @@ export class SalonService {
   }
 
   /**
-   * Increment salon view count
+   * Record a salon page view. Views are buffered in salon_view_events and
+   * rolled into view_count by rollup_view_events.py (migrations/010).
    */
-  static async incrementViewCount(salonId: string): Promise<ApiResponse<number>> {
+  static async incrementViewCount(salonId: string): Promise<ApiResponse<null>> {
     try {
-      const { data, error } = await supabase.rpc('increment_salon_view_count', {
-        salon_id: salonId
-      })
+      const { error } = await supabase
+        .from('salon_view_events')
+        .insert({ salon_id: salonId })
 
       if (error) throw error
 
       return {
-        data: data || 0
+        data: null
       }
     } catch (error) {
-      console.error('Error incrementing view count:', error)
+      console.error('Error recording salon view:', error)
       return {
         error: 'Failed to update view count'
       }
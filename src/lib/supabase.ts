@@ -102,6 +102,7 @@ export interface Salon {
   keywords?: string[]
   view_count: number
   contact_form_submissions: number
+  review_snapshot?: ReviewSnapshot
   created_at: string
   updated_at: string
 }
@@ -168,6 +169,15 @@ export interface Review {
   created_at: string
 }
 
+// Precomputed by refresh_salon_review_snapshots (migrations/003)
+export interface ReviewSnapshot {
+  review_count: number
+  average_rating: number | null
+  rating_histogram: number[]
+  latest_review_at: string | null
+  reviews: Review[]
+}
+
 export interface VendorTier {
   id: string
   name: 'free' | 'premium' | 'featured'
@@ -320,8 +330,7 @@ export const db = {
           salon_services(
             *,
             service_type:service_types(*)
-          ),
-          reviews(rating, is_published)
+          )
         `)
         .eq('is_published', true)
 
@@ -353,8 +362,7 @@ export const db = {
           salon_services(
             *,
             service_type:service_types(*)
-          ),
-          reviews(*)
+          )
         `)
         .eq('id', id)
         .eq('is_published', true)
@@ -370,8 +378,7 @@ export const db = {
           salon_services(
             *,
             service_type:service_types(*)
-          ),
-          reviews(*)
+          )
         `)
         .eq('slug', slug)
         .eq('is_published', true)
@@ -379,7 +386,8 @@ export const db = {
     },
 
     async incrementViewCount(id: string) {
-      return supabase.rpc('increment_salon_view_count', { salon_id: id })
+      // Buffered; see rollup_view_events.py
+      return supabase.from('salon_view_events').insert({ salon_id: id })
     }
   },
 
@@ -0,0 +1,81 @@
+import { normalizeSearchText } from './searchText'
+
+// Static prefix index written by build_autocomplete_index.py
+
+export interface AutocompleteSuggestion {
+  label: string
+  type: 'city' | 'salon'
+  slug: string
+  state: string | null
+}
+
+type Entry = [string, 'city' | 'salon', string, string | null, number]
+
+interface AutocompleteIndex {
+  block: number
+  keys: [number, string][]
+  entries: Entry[]
+  top: Record<string, number[]>
+}
+
+let indexPromise: Promise<{ index: AutocompleteIndex; restarts: string[] }> | null = null
+
+const loadIndex = () => {
+  if (!indexPromise) {
+    indexPromise = fetch('/autocomplete.json')
+      .then(res => res.json() as Promise<AutocompleteIndex>)
+      .then(index => ({
+        index,
+        // Every block-th key is stored in full
+        restarts: index.keys.filter((_, i) => i % index.block === 0).map(([, key]) => key)
+      }))
+      .catch(error => {
+        indexPromise = null
+        throw error
+      })
+  }
+  return indexPromise
+}
+
+const toSuggestion = ([label, type, slug, state]: Entry): AutocompleteSuggestion => ({
+  label,
+  type,
+  slug,
+  state
+})
+
+export const autocomplete = async (input: string, limit = 10): Promise<AutocompleteSuggestion[]> => {
+  const prefix = normalizeSearchText(input)
+  if (!prefix) return []
+
+  const { index, restarts } = await loadIndex()
+
+  // Short prefixes match too many keys, their ranking is precomputed
+  if (index.top[prefix]) {
+    return index.top[prefix].slice(0, limit).map(i => toSuggestion(index.entries[i]))
+  }
+
+  // Last restart key that sorts before the prefix
+  let lo = 0
+  let hi = restarts.length - 1
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1
+    if (restarts[mid] < prefix) lo = mid
+    else hi = mid - 1
+  }
+
+  // Decode forward from there, collecting keys that start with the prefix
+  const matches: number[] = []
+  let key = ''
+  for (let i = lo * index.block; i < index.keys.length; i++) {
+    const [shared, suffix] = index.keys[i]
+    key = key.slice(0, shared) + suffix
+    if (key.startsWith(prefix)) matches.push(i)
+    else if (key > prefix) break
+  }
+
+  return matches
+    .sort((a, b) => index.entries[a][4] - index.entries[b][4])
+    .slice(0, limit)
+    .map(i => toSuggestion(index.entries[i]))
+}
@@ -0,0 +1,67 @@
+// Bit registry for the packed salon filter_mask column (migrations/004).
+// Mirrors filter_bits.py - bit numbers are stored in the database and
+// must never be renumbered.
+export const FILTER_BITS: Record<string, number> = {
+  manicure: 0,
+  gel_manicure: 1,
+  gel_extensions: 2,
+  acrylic_nails: 3,
+  pedicure: 4,
+  gel_pedicure: 5,
+  sns_dip_powder: 6,
+  builders_gel_biab: 7,
+  nail_art: 8,
+  massage: 9,
+  facials: 10,
+  lash_extensions: 11,
+  lash_lift_tint: 12,
+  brows: 13,
+  waxing: 14,
+  injectables: 15,
+  tanning: 16,
+  cosmetic_tattoo: 17,
+  haircuts: 18,
+  spa_hand_foot_treatment: 19,
+  english: 20,
+  spanish: 21,
+  vietnamese: 22,
+  chinese: 23,
+  korean: 24,
+  qualified_technicians: 25,
+  experienced_team: 26,
+  quick_service: 27,
+  award_winning_staff: 28,
+  master_nail_artist: 29,
+  bridal_nails: 30,
+  appointment_required: 31,
+  walk_ins_welcome: 32,
+  group_bookings: 33,
+  mobile_nails: 34,
+  child_friendly: 35,
+  adult_only: 36,
+  pet_friendly: 37,
+  lgbtqi_friendly: 38,
+  wheelchair_accessible: 39,
+  complimentary_drink: 40,
+  heated_massage_chairs: 41,
+  foot_spas: 42,
+  free_wifi: 43,
+  parking: 44,
+  autoclave_sterilisation: 45,
+  led_curing: 46,
+  clean_ethical_products: 47,
+  vegan_polish: 48
+}
+
+// Bits above 31 overflow JS bitwise operators, so masks are built by
+// summing distinct powers of two (exact up to 2^53).
+export const filterMask = (columns: string[]): number => {
+  const bits = new Set(
+    columns.map(column => FILTER_BITS[column]).filter(bit => bit !== undefined)
+  )
+  let mask = 0
+  bits.forEach(bit => {
+    mask += 2 ** bit
+  })
+  return mask
+}
@@ -0,0 +1,28 @@
+// Keyset cursors for the salon listing, which is ordered by
+// is_featured DESC, rank_score DESC, id DESC (idx_salons_listing_rank)
+
+export interface ListingCursor {
+  isFeatured: boolean
+  rankScore: number
+  id: number
+}
+
+export const encodeListingCursor = (row: { is_featured: boolean | null; rank_score: number; id: number }): string =>
+  Buffer.from(JSON.stringify([Boolean(row.is_featured), row.rank_score, row.id])).toString('base64url')
+
+export const decodeListingCursor = (cursor: string): ListingCursor | null => {
+  try {
+    const [isFeatured, rankScore, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+    if (typeof isFeatured !== 'boolean' || !Number.isFinite(rankScore) || !Number.isInteger(id)) return null
+    return { isFeatured, rankScore, id }
+  } catch {
+    return null
+  }
+}
+
+// salon_listing_page (migrations/009) arguments for rows sorting after the cursor
+export const cursorParams = ({ isFeatured, rankScore, id }: ListingCursor) => ({
+  cursor_featured: isFeatured,
+  cursor_rank_score: rankScore,
+  cursor_id: id
+})
@@ -0,0 +1,77 @@
+// Precomputed cluster tiles written by build_map_tiles.py to public/tiles
+
+export interface MapCluster {
+  lng: number
+  lat: number
+  count: number
+}
+
+export interface MapPoint {
+  lng: number
+  lat: number
+  salonId: number
+}
+
+interface TileData {
+  c: [number, number, number][]
+  p: [number, number, number][]
+}
+
+interface Bounds {
+  north: number
+  south: number
+  east: number
+  west: number
+}
+
+const MIN_ZOOM = 0
+const MAX_ZOOM = 18
+
+const lngToTileX = (lng: number, z: number) =>
+  Math.floor(((lng + 180) / 360) * (1 << z))
+
+const latToTileY = (lat: number, z: number) => {
+  const sin = Math.sin((lat * Math.PI) / 180)
+  const y = 0.5 - (0.25 * Math.log((1 + sin) / (1 - sin))) / Math.PI
+  return Math.floor(Math.min(Math.max(y, 0), 1 - 1e-12) * (1 << z))
+}
+
+export const visibleTiles = (bounds: Bounds, zoom: number): [number, number, number][] => {
+  const z = Math.max(MIN_ZOOM, Math.min(MAX_ZOOM, Math.round(zoom)))
+  const max = (1 << z) - 1
+  const minX = Math.max(0, lngToTileX(bounds.west, z))
+  const maxX = Math.min(max, lngToTileX(bounds.east, z))
+  const minY = Math.max(0, latToTileY(bounds.north, z))
+  const maxY = Math.min(max, latToTileY(bounds.south, z))
+
+  const tiles: [number, number, number][] = []
+  for (let x = minX; x <= maxX; x++) {
+    for (let y = minY; y <= maxY; y++) {
+      tiles.push([z, x, y])
+    }
+  }
+  return tiles
+}
+
+export const loadClusterTiles = async (
+  bounds: Bounds,
+  zoom: number
+): Promise<{ clusters: MapCluster[]; points: MapPoint[] }> => {
+  const responses = await Promise.all(
+    visibleTiles(bounds, zoom).map(async ([z, x, y]) => {
+      const res = await fetch(`/tiles/${z}/${x}/${y}.json`)
+      // Missing tiles are empty, they are never written
+      return res.ok ? ((await res.json()) as TileData) : null
+    })
+  )
+
+  const clusters: MapCluster[] = []
+  const points: MapPoint[] = []
+  responses.forEach(tile => {
+    if (!tile) return
+    tile.c.forEach(([lng, lat, count]) => clusters.push({ lng, lat, count }))
+    tile.p.forEach(([lng, lat, salonId]) => points.push({ lng, lat, salonId }))
+  })
+
+  return { clusters, points }
+}
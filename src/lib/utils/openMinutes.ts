@@ -0,0 +1,39 @@
+// Minute-of-week lookups against salons.open_minutes (migrations/007),
+// where minute 0 is Monday 00:00 in the salon's local time
+
+const MINUTES_PER_DAY = 24 * 60
+
+const WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+// Salon states grouped by the time zone their opening hours are written in
+const STATE_TIME_ZONES: Record<string, string[]> = {
+  'Australia/Sydney': ['NSW', 'New South Wales', 'VIC', 'Victoria', 'ACT', 'Australian Capital Territory', 'TAS', 'Tasmania'],
+  'Australia/Brisbane': ['QLD', 'Queensland'],
+  'Australia/Adelaide': ['SA', 'South Australia'],
+  'Australia/Darwin': ['NT', 'Northern Territory'],
+  'Australia/Perth': ['WA', 'Western Australia']
+}
+
+export const minuteOfWeek = (date: Date, timeZone: string): number => {
+  const parts = new Intl.DateTimeFormat('en-AU', {
+    timeZone,
+    weekday: 'short',
+    hour: '2-digit',
+    minute: '2-digit',
+    hourCycle: 'h23'
+  }).formatToParts(date)
+  const part = (type: string) => parts.find(p => p.type === type)?.value || ''
+
+  const day = WEEKDAYS.indexOf(part('weekday'))
+  return day * MINUTES_PER_DAY + parseInt(part('hour')) * 60 + parseInt(part('minute'))
+}
+
+// PostgREST `or` filter matching salons open at `date` in their own time zone
+export const openNowFilter = (date: Date = new Date()): string =>
+  Object.entries(STATE_TIME_ZONES)
+    .map(([timeZone, states]) => {
+      const minute = minuteOfWeek(date, timeZone)
+      const stateList = states.map(state => `"${state}"`).join(',')
+      return `and(state.in.(${stateList}),open_minutes.cs."{[${minute},${minute + 1})}")`
+    })
+    .join(',')
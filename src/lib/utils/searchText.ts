@@ -0,0 +1,11 @@
+// Same normalization search_text() (migrations/006) applies to the search_*
+// columns (slugify, but words joined with spaces), so user input matches the
+// trigram-indexed values.
+export const normalizeSearchText = (text: string): string =>
+  text
+    .toLowerCase()
+    .normalize('NFKD')
+    .replace(/[^\x00-\x7f]/g, '')
+    .replace(/[^\w\s-]/g, '')
+    .replace(/[-\s]+/g, ' ')
+    .trim()
@@ -2,13 +2,9 @@
 """
 Test Supabase connection with current credentials
 """
-import os
-from dotenv import load_dotenv
+from nailnav_etl import credentials, get_client
 
-load_dotenv('.env.local')
-
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+SUPABASE_URL, SUPABASE_SERVICE_KEY = credentials()
 
 print("=" * 80)
 print("🔍 SUPABASE CONNECTION TEST")
@@ -18,10 +14,8 @@ print(f"🔑 Service Key (first 20 chars): {SUPABASE_SERVICE_KEY[:20] if SUPABAS
 print(f"🔑 Service Key length: {len(SUPABASE_SERVICE_KEY) if SUPABASE_SERVICE_KEY else 0} characters")
 
 try:
-    from supabase import create_client, Client
-    
     print("\n📡 Testing connection...")
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    supabase = get_client()
     
     # Try to fetch vendor tiers
     result = supabase.table('vendor_tiers').select('*').execute()
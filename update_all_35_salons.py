@@ -1,12 +1,6 @@
-import os
-from dotenv import load_dotenv
-load_dotenv('.env.local')
-from supabase import create_client
+from nailnav_etl import get_client
 
-url = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-
-supabase = create_client(url, service_key)
+supabase = get_client()
 
 # Get city IDs
 darwin_city = supabase.table('cities').select('id').eq('name', 'Darwin').limit(1).execute()
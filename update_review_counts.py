@@ -4,16 +4,9 @@ Update salon review counts from Excel file
 """
 
 import pandas as pd
-import os
-from dotenv import load_dotenv
-from supabase import create_client
 
-# Load environment variables
-load_dotenv('.env.local')
-
-# Get Supabase credentials
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+from nailnav_etl import get_client
+from paged_reads import iter_rows
 
 def main():
     print("=" * 80)
@@ -27,13 +20,15 @@ def main():
     
     # Connect to Supabase
     print("\n📡 Connecting to Supabase...")
-    supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    supabase = get_client()
     print("✅ Connected")
     
     # Get all salons from database
     print("\n📊 Fetching salons from database...")
-    result = supabase.table('salons').select('id, name').execute()
-    db_salons = {salon['name'].lower().strip(): salon['id'] for salon in result.data}
+    db_salons = {
+        salon['name'].lower().strip(): salon['id']
+        for salon in iter_rows(lambda: supabase.table('salons').select('id, name').order('id'))
+    }
     print(f"✅ Found {len(db_salons)} salons in database")
     
     # Update review counts
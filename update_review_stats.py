@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Recompute per-salon review statistics from the reviews table
+
+Runs refresh_salon_review_stats (migrations/002_salon_review_stats.sql),
+which computes review count, mean rating, 1-5 star histogram and latest
+review date for every salon in one grouped SQL aggregate and bulk-writes
+them to the salons table, then re-scores the default listing order
+(build_rank_scores.py) from the fresh stats.
+"""
+from build_rank_scores import refresh_rank_scores
+from nailnav_etl import get_client, metrics
+
+
+def refresh_review_stats(supabase, salon_ids=None):
+    """Refresh stats for all salons, or only `salon_ids`; returns rows changed"""
+    params = {'salon_ids': list(salon_ids)} if salon_ids is not None else {}
+    result = supabase.rpc('refresh_salon_review_stats', params).execute()
+    return result.data or 0
+
+
+def main():
+    print("=" * 80)
+    print("📊 REFRESHING SALON REVIEW STATISTICS")
+    print("=" * 80)
+
+    print("\n📡 Connecting to Supabase...")
+    supabase = get_client()
+    print("✅ Connected")
+
+    print("\n🔄 Aggregating reviews...")
+    try:
+        with metrics.stage('refresh_review_stats'):
+            updated = refresh_review_stats(supabase)
+    except Exception as e:
+        print(f"❌ Failed to refresh stats: {e}")
+        print("   Has migrations/002_salon_review_stats.sql been applied?")
+        return
+
+    print(f"✅ Updated statistics for {updated} salons")
+
+    print("\n🏆 Re-scoring salons...")
+    with metrics.stage('refresh_rank_scores'):
+        ranked = refresh_rank_scores(supabase)
+    print(f"✅ Updated rank scores for {ranked} salons")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,25 +2,25 @@
 """
 Verify the imported salon data
 """
-import os
-from dotenv import load_dotenv
-from supabase import create_client, Client
+from column_stats import column_stats
+from filter_bits import FILTER_BITS
+from nailnav_etl import get_client
 
-load_dotenv('.env.local')
-
-SUPABASE_URL = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
-SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+# Columns whose missing-value rate is reported
+CORE_COLUMNS = ['city_id', 'address', 'phone', 'website', 'description', 'rating', 'latitude', 'longitude']
 
 print("=" * 80)
 print("✅ IMPORT VERIFICATION")
 print("=" * 80)
 
 try:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    supabase = get_client()
     
-    # Get total count
-    result = supabase.table('salons').select('*', count='exact').execute()
-    total = result.count if hasattr(result, 'count') else len(result.data)
+    # Every statistic below comes from one table_column_stats call
+    flag_columns = ['is_published', 'accepts_walk_ins', *FILTER_BITS]
+    total, stats, by_city, missing = column_stats(
+        supabase, flag_columns + CORE_COLUMNS, group_by='city_id'
+    )
     
     print(f"\n📊 Total salons in database: {total}")
     
@@ -40,32 +40,35 @@ try:
     print("📈 STATISTICS")
     print("=" * 80)
     
-    # Published salons
-    published = supabase.table('salons').select('id', count='exact').eq('is_published', True).execute()
-    pub_count = published.count if hasattr(published, 'count') else len(published.data)
-    print(f"✅ Published salons: {pub_count}")
+    for column, label in [('is_published', '✅ Published salons'), ('accepts_walk_ins', '🚶 Accepting walk-ins')]:
+        if column not in missing:
+            print(f"{label}: {int(stats.at[column, 'true'])}")
     
-    # Services statistics
-    with_manicure = supabase.table('salons').select('id', count='exact').eq('manicure', True).execute()
-    man_count = with_manicure.count if hasattr(with_manicure, 'count') else len(with_manicure.data)
-    print(f"💅 Offering manicures: {man_count}")
+    print("\n🏷️  Yes/No flags:")
+    for column in FILTER_BITS:
+        if column in missing:
+            continue
+        row = stats.loc[column]
+        print(f"   {column:<28} {int(row['true']):>6}  ({row['true_rate']:.1%})")
     
-    with_pedicure = supabase.table('salons').select('id', count='exact').eq('pedicure', True).execute()
-    ped_count = with_pedicure.count if hasattr(with_pedicure, 'count') else len(with_pedicure.data)
-    print(f"🦶 Offering pedicures: {ped_count}")
+    print("\n🕳️  Missing values:")
+    for column in CORE_COLUMNS:
+        if column not in missing:
+            print(f"   {column:<28} {stats.at[column, 'null_rate']:.1%}")
     
-    with_acrylic = supabase.table('salons').select('id', count='exact').eq('acrylic_nails', True).execute()
-    acr_count = with_acrylic.count if hasattr(with_acrylic, 'count') else len(with_acrylic.data)
-    print(f"✨ Offering acrylic nails: {acr_count}")
+    if missing:
+        print("\n⚠️  Columns not in the salons table:")
+        for column in missing:
+            print(f"   {column}")
     
-    # Amenities
-    with_parking = supabase.table('salons').select('id', count='exact').eq('parking', True).execute()
-    park_count = with_parking.count if hasattr(with_parking, 'count') else len(with_parking.data)
-    print(f"🅿️  With parking: {park_count}")
+    top_cities = by_city.head(10)
+    city_ids = [int(city_id) for city_id in top_cities.index if city_id != 'null']
+    cities = supabase.table('cities').select('id, name').in_('id', city_ids).execute()
+    city_names = {str(city['id']): city['name'] for city in cities.data}
     
-    with_walkins = supabase.table('salons').select('id', count='exact').eq('accepts_walk_ins', True).execute()
-    walk_count = with_walkins.count if hasattr(with_walkins, 'count') else len(with_walkins.data)
-    print(f"🚶 Accepting walk-ins: {walk_count}")
+    print("\n🏙️  Salons per city (top 10):")
+    for city_id, count in top_cities.items():
+        print(f"   {city_names.get(city_id, 'No city'):<28} {count:>6}")
     
     print("\n" + "=" * 80)
     print("✅ VERIFICATION COMPLETE!")